@@ -0,0 +1,91 @@
+"""init
+
+Revision ID: 3f1c2a9d8b01
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d8b01"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+language_code_enum = sa.Enum("ko", "en", "jp", "tw", name="language_code_enum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "company",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_company_id"), "company", ["id"], unique=False)
+    op.create_table(
+        "tag",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_tag_id"), "tag", ["id"], unique=False)
+    op.create_table(
+        "company_name",
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column("language_code", language_code_enum, nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["company_id"], ["company.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("company_id", "language_code", name="unique_company_lang"),
+    )
+    op.create_index(op.f("ix_company_name_id"), "company_name", ["id"], unique=False)
+    op.create_table(
+        "company_tag",
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column("tag_id", sa.BigInteger(), nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["company_id"], ["company.id"]),
+        sa.ForeignKeyConstraint(["tag_id"], ["tag.id"]),
+        sa.PrimaryKeyConstraint("id", "company_id", "tag_id"),
+    )
+    op.create_index(op.f("ix_company_tag_id"), "company_tag", ["id"], unique=False)
+    op.create_table(
+        "tag_name",
+        sa.Column("tag_id", sa.BigInteger(), nullable=False),
+        sa.Column("language_code", language_code_enum, nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["tag_id"], ["tag.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tag_id", "language_code", "name", name="unique_tag_lang_name"),
+    )
+    op.create_index(op.f("ix_tag_name_id"), "tag_name", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tag_name_id"), table_name="tag_name")
+    op.drop_table("tag_name")
+    op.drop_index(op.f("ix_company_tag_id"), table_name="company_tag")
+    op.drop_table("company_tag")
+    op.drop_index(op.f("ix_company_name_id"), table_name="company_name")
+    op.drop_table("company_name")
+    op.drop_index(op.f("ix_tag_id"), table_name="tag")
+    op.drop_table("tag")
+    op.drop_index(op.f("ix_company_id"), table_name="company")
+    op.drop_table("company")
+    language_code_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,32 @@
+"""company version, catalog version sequence
+
+Revision ID: 4b9e2d7c1f38
+Revises: e1b7a3c9d205
+Create Date: 2026-10-18 16:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b9e2d7c1f38"
+down_revision: Union[str, None] = "e1b7a3c9d205"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 회사 상세 / 회사 목록 응답의 ETag 버전
+    op.add_column(
+        "company",
+        sa.Column("version", sa.BigInteger(), server_default="1", nullable=False),
+    )
+    op.execute(sa.schema.CreateSequence(sa.Sequence("catalog_version_seq")))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence("catalog_version_seq")))
+    op.drop_column("company", "version")
@@ -0,0 +1,41 @@
+"""catalog version table (replica 복제)
+
+Revision ID: 7d3a5f1e9c62
+Revises: 4b9e2d7c1f38
+Create Date: 2026-10-18 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3a5f1e9c62"
+down_revision: Union[str, None] = "4b9e2d7c1f38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # sequence 는 replica 에서 WAL 에 미리 기록된 값을 보여주므로 한 행 테이블로 변경
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        "INSERT INTO catalog_version (id, version) "
+        "SELECT 1, last_value FROM catalog_version_seq"
+    )
+    op.execute(sa.schema.DropSequence(sa.Sequence("catalog_version_seq")))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("catalog_version_seq")))
+    op.execute(
+        "SELECT setval('catalog_version_seq', version) FROM catalog_version WHERE id = 1"
+    )
+    op.drop_table("catalog_version")
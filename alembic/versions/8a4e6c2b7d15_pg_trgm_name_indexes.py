@@ -0,0 +1,55 @@
+"""pg_trgm name indexes
+
+Revision ID: 8a4e6c2b7d15
+Revises: 3f1c2a9d8b01
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e6c2b7d15"
+down_revision: Union[str, None] = "3f1c2a9d8b01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LANGUAGE_CODES = ("ko", "en", "jp", "tw")
+TABLES = ("company_name", "tag_name")
+
+
+def _trgm_available() -> bool:
+    return bool(
+        op.get_bind()
+        .execute(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+        .scalar()
+    )
+
+
+def upgrade() -> None:
+    # pg_trgm 이 설치되지 않은 서버는 인덱스 없이 진행 (fuzzy 검색은 부분 검색으로 대체)
+    if not _trgm_available():
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 언어별 partial GIN 인덱스: name ILIKE '%query%' / name % query 검색에 사용
+    for table in TABLES:
+        for language_code in LANGUAGE_CODES:
+            op.create_index(
+                f"ix_{table}_name_trgm_{language_code}",
+                table,
+                ["name"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={"name": "gin_trgm_ops"},
+                postgresql_where=sa.text(f"language_code = '{language_code}'"),
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for language_code in LANGUAGE_CODES:
+            op.drop_index(f"ix_{table}_name_trgm_{language_code}", table_name=table, if_exists=True)
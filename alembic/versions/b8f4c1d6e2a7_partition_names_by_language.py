@@ -0,0 +1,132 @@
+"""company_name / tag_name LIST partitions by language_code
+
+Revision ID: b8f4c1d6e2a7
+Revises: 7d3a5f1e9c62
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f4c1d6e2a7"
+down_revision: Union[str, None] = "7d3a5f1e9c62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LANGUAGE_CODES = ("ko", "en", "jp", "tw")
+
+# 테이블별 (참조 컬럼, 참조 테이블, unique 제약 이름, unique 컬럼)
+TABLES = {
+    "company_name": (
+        "company_id",
+        "company",
+        "unique_company_lang",
+        ["company_id", "language_code"],
+    ),
+    "tag_name": ("tag_id", "tag", "unique_tag_name_lang_name", ["language_code", "name"]),
+}
+COLUMNS = "id, {parent_id}, language_code, name, created, updated"
+
+
+def _has_trgm() -> bool:
+    return bool(
+        op.get_bind()
+        .execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        .scalar()
+    )
+
+
+def _create_table(table: str, partitioned: bool) -> None:
+    parent_id, parent, unique_name, unique_columns = TABLES[table]
+    primary_key = ["id", "language_code"] if partitioned else ["id"]
+    kwargs = {"postgresql_partition_by": "LIST (language_code)"} if partitioned else {}
+    op.create_table(
+        table,
+        sa.Column(parent_id, sa.BigInteger(), nullable=False),
+        sa.Column(
+            "language_code",
+            postgresql.ENUM(*LANGUAGE_CODES, name="language_code_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        # 기존 id sequence 를 계속 사용
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            server_default=sa.text(f"nextval('{table}_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint([parent_id], [f"{parent}.id"], name=f"{table}_{parent_id}_fkey"),
+        sa.PrimaryKeyConstraint(*primary_key, name=f"{table}_pkey"),
+        sa.UniqueConstraint(*unique_columns, name=unique_name),
+        **kwargs,
+    )
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
+
+
+def _drop_old_table(table: str) -> None:
+    """기존 테이블 이름 변경 (인덱스/제약 이름은 새 테이블에서 다시 사용하므로 삭제)"""
+    parent_id, _, unique_name, _ = TABLES[table]
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.rename_table(table, f"{table}_old")
+    op.execute(f"ALTER TABLE {table}_old DROP CONSTRAINT {table}_pkey")
+    op.execute(f"ALTER TABLE {table}_old DROP CONSTRAINT {unique_name}")
+    op.execute(f"ALTER TABLE {table}_old DROP CONSTRAINT IF EXISTS {table}_{parent_id}_fkey")
+    op.execute(f"DROP INDEX IF EXISTS ix_{table}_id")
+    op.execute(f"DROP INDEX IF EXISTS ix_{table}_name")
+    for language_code in LANGUAGE_CODES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_name_trgm_{language_code}")
+
+
+def _copy_rows(table: str) -> None:
+    columns = COLUMNS.format(parent_id=TABLES[table][0])
+    op.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_old")
+    op.drop_table(f"{table}_old")
+
+
+def upgrade() -> None:
+    trgm = _has_trgm()
+    for table in TABLES:
+        _drop_old_table(table)
+        _create_table(table, partitioned=True)
+        # 언어별 파티션과 파티션의 pg_trgm 인덱스 (이전 partial 인덱스와 같은 이름)
+        # 이후 추가되는 언어는 app.models.partitions.ensure_language_partitions 로 생성
+        for language_code in LANGUAGE_CODES:
+            op.execute(
+                f"CREATE TABLE {table}_{language_code} "
+                f"PARTITION OF {table} FOR VALUES IN ('{language_code}')"
+            )
+            if trgm:
+                op.execute(
+                    f"CREATE INDEX ix_{table}_name_trgm_{language_code} "
+                    f"ON {table}_{language_code} USING gin (name gin_trgm_ops)"
+                )
+        _copy_rows(table)
+
+
+def downgrade() -> None:
+    trgm = _has_trgm()
+    for table in TABLES:
+        # 파티션 (company_name_ko 등) 과 파티션 인덱스는 기존 테이블과 함께 삭제
+        _drop_old_table(table)
+        _create_table(table, partitioned=False)
+        if trgm:
+            for language_code in LANGUAGE_CODES:
+                op.create_index(
+                    f"ix_{table}_name_trgm_{language_code}",
+                    table,
+                    ["name"],
+                    unique=False,
+                    postgresql_using="gin",
+                    postgresql_ops={"name": "gin_trgm_ops"},
+                    postgresql_where=sa.text(f"language_code = '{language_code}'"),
+                )
+        _copy_rows(table)
@@ -0,0 +1,33 @@
+"""tag_name unique (language_code, name)
+
+Revision ID: c5d2e7f4a913
+Revises: 8a4e6c2b7d15
+Create Date: 2026-10-18 12:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2e7f4a913"
+down_revision: Union[str, None] = "8a4e6c2b7d15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 태그명은 언어별로 하나의 태그에만 속함 (INSERT ... ON CONFLICT 대상)
+    # (tag_id, language_code, name) 제약은 이 제약에 포함되므로 삭제
+    op.create_unique_constraint(
+        "unique_tag_name_lang_name", "tag_name", ["language_code", "name"]
+    )
+    op.drop_constraint("unique_tag_lang_name", "tag_name", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        "unique_tag_lang_name", "tag_name", ["tag_id", "language_code", "name"]
+    )
+    op.drop_constraint("unique_tag_name_lang_name", "tag_name", type_="unique")
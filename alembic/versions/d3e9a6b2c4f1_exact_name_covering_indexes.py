@@ -0,0 +1,49 @@
+"""covering indexes for exact company/tag name lookups
+
+Revision ID: d3e9a6b2c4f1
+Revises: b8f4c1d6e2a7
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e9a6b2c4f1"
+down_revision: Union[str, None] = "b8f4c1d6e2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 회사명 조회 (get_by_name, get_version_by_name, get_existing_names) 는 언어 조건이 없어도
+    # 테이블 조회 없이 company_id 확인 (이전 마이그레이션으로 만든 같은 이름의 인덱스는 교체)
+    op.drop_index("ix_company_name_name", table_name="company_name", if_exists=True)
+    op.create_index(
+        "ix_company_name_name",
+        "company_name",
+        ["name"],
+        postgresql_include=["company_id", "language_code"],
+    )
+    # unique_tag_name_lang_name 은 language_code 가 앞이라 언어 조건 없는 태그명 조회에 사용할 수 없음
+    op.create_index(
+        "ix_tag_name_name", "tag_name", ["name", "language_code"], postgresql_include=["tag_id"]
+    )
+    op.create_index("ix_tag_name_tag_id", "tag_name", ["tag_id"])
+    # company_tag 기본키 (id, company_id, tag_id) 는 id 가 앞이라 회사/태그별 조회에 사용할 수 없음
+    op.create_index(
+        "ix_company_tag_company_id", "company_tag", ["company_id"], postgresql_include=["tag_id"]
+    )
+    op.create_index(
+        "ix_company_tag_tag_id", "company_tag", ["tag_id"], postgresql_include=["company_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_company_tag_tag_id", table_name="company_tag")
+    op.drop_index("ix_company_tag_company_id", table_name="company_tag")
+    op.drop_index("ix_tag_name_tag_id", table_name="tag_name")
+    op.drop_index("ix_tag_name_name", table_name="tag_name")
+    op.drop_index("ix_company_name_name", table_name="company_name")
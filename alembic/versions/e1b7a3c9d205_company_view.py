@@ -0,0 +1,59 @@
+"""company_view read model
+
+Revision ID: e1b7a3c9d205
+Revises: c5d2e7f4a913
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1b7a3c9d205"
+down_revision: Union[str, None] = "c5d2e7f4a913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LANGUAGE_CODES = ("ko", "en", "jp", "tw")
+COLUMNS = ("all_names", "all_tag_names")
+
+
+def upgrade() -> None:
+    # 데이터는 app/scripts/rebuild_company_view.py 로 채운다.
+    op.create_table(
+        "company_view",
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "language_code",
+            postgresql.ENUM("ko", "en", "jp", "tw", name="language_code_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("company_name", sa.String(length=255), nullable=False),
+        sa.Column("tags", postgresql.ARRAY(sa.String(length=255)), nullable=False),
+        sa.Column("all_names", postgresql.ARRAY(sa.String(length=255)), nullable=False),
+        sa.Column("all_tag_names", postgresql.ARRAY(sa.String(length=255)), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["company.id"]),
+        sa.PrimaryKeyConstraint("company_id", "language_code"),
+    )
+    # 언어별 partial GIN 인덱스: language_code = :language AND all_names @> ARRAY[:name]
+    for column in COLUMNS:
+        for language_code in LANGUAGE_CODES:
+            op.create_index(
+                f"ix_company_view_{column}_{language_code}",
+                "company_view",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_where=sa.text(f"language_code = '{language_code}'"),
+            )
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        for language_code in LANGUAGE_CODES:
+            op.drop_index(f"ix_company_view_{column}_{language_code}", table_name="company_view")
+    op.drop_table("company_view")
@@ -0,0 +1,39 @@
+"""catalog change log (검색 색인 변경분 반영)
+
+Revision ID: f6c1b8d4a2e9
+Revises: d3e9a6b2c4f1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c1b8d4a2e9"
+down_revision: Union[str, None] = "d3e9a6b2c4f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 버전은 변경 내역이 없으므로 실행 중인 워커는 한 번 색인을 다시 생성한다.
+    op.create_table(
+        "catalog_change",
+        sa.Column("version", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("company_ids", postgresql.ARRAY(sa.BigInteger()), nullable=False),
+        sa.Column(
+            "removed_tag_ids",
+            postgresql.ARRAY(sa.BigInteger()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("version"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_change")
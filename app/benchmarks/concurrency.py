@@ -0,0 +1,106 @@
+"""
+동시 요청 수에 따른 처리량 측정
+
+    python -m app.benchmarks.concurrency --concurrency 1 8 32 --requests 256
+    DATABASE_ASYNC=true python -m app.benchmarks.concurrency --concurrency 1 8 32
+
+시나리오
+- endpoint: ASGI 앱으로 GET /companies/{name} 호출
+- db-sleep: run_db 로 pg_sleep 쿼리 실행 (느린 쿼리가 동시에 처리되는지 확인)
+- db-sleep-blocking: 이벤트 루프에서 직접 pg_sleep 쿼리 실행 (기존 방식, 직렬 처리)
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+from sqlalchemy import text
+
+from app.common.database import AsyncSessionLocal, SessionLocal
+from app.common.utils import run_db
+from app.config.settings import Settings
+from app.main import app
+
+settings = Settings()
+
+
+def sleep_query(db, seconds: float) -> None:
+    db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": seconds})
+
+
+async def db_sleep(seconds: float) -> None:
+    if settings.database_async:
+        async with AsyncSessionLocal() as session:
+            await run_db(session.sync_session, sleep_query, session.sync_session, seconds)
+    else:
+        with SessionLocal() as session:
+            await run_db(session, sleep_query, session, seconds)
+
+
+async def db_sleep_blocking(seconds: float) -> None:
+    with SessionLocal() as session:
+        sleep_query(session, seconds)
+
+
+async def measure(request: Callable[[], Awaitable[None]], concurrency: int, total: int) -> float:
+    """concurrency 개의 워커로 total 개 요청을 처리하고 초당 처리량 반환"""
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await request()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - started)
+
+
+async def main(args) -> List[Dict]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def endpoint():
+            resp = await client.get(
+                f"/companies/{args.company}", headers={"x-wanted-language": "ko"}
+            )
+            resp.raise_for_status()
+
+        scenarios = {
+            "endpoint": endpoint,
+            "db-sleep": lambda: db_sleep(args.sleep),
+            "db-sleep-blocking": lambda: db_sleep_blocking(args.sleep),
+        }
+
+        results = []
+        for name in args.scenarios:
+            for concurrency in args.concurrency:
+                rps = await measure(scenarios[name], concurrency, args.requests)
+                results.append(
+                    {
+                        "scenario": name,
+                        "database_async": settings.database_async,
+                        "concurrency": concurrency,
+                        "requests_per_second": round(rps, 1),
+                    }
+                )
+                print(json.dumps(results[-1]))
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=256)
+    parser.add_argument("--sleep", type=float, default=0.05, help="db-sleep 쿼리 시간(초)")
+    parser.add_argument("--company", default="Wantedlab")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=["endpoint", "db-sleep", "db-sleep-blocking"],
+        choices=["endpoint", "db-sleep", "db-sleep-blocking"],
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,149 @@
+"""
+부하 테스트용 합성 회사/태그 CSV 생성 (company_tag_sample.csv 와 같은 형식)
+
+    python -m app.benchmarks.datagen --companies 100000 --output /tmp/companies_100k.csv
+    python -m app.scripts.init_data --bulk --csv /tmp/companies_100k.csv
+
+- 같은 seed 와 옵션이면 항상 같은 데이터를 생성
+- 회사명은 샘플과 비슷한 비율로 ko/en/ja 이름을 가진다. (한 언어 이상)
+- 태그 인기도는 Zipf 분포를 따른다. (소수의 태그가 대부분의 회사에 연결)
+"""
+import argparse
+import csv
+import itertools
+import random
+import sys
+from typing import Dict, Iterator, List, Optional
+
+COLUMNS = ["company_ko", "company_en", "company_ja", "tag_ko", "tag_en", "tag_ja"]
+
+# company_tag_sample.csv 의 언어별 회사명 비율
+NAME_RATIOS = {"ko": 0.85, "en": 0.22, "ja": 0.03}
+
+# 회사명 조합에 사용하는 단어 (같은 위치의 단어는 같은 의미)
+# fmt: off
+KO_WORDS = [
+    "원티드", "링크", "데이터", "클라우드", "스마트", "그린", "블루", "오픈", "퓨처", "넥스트",
+    "코리아", "글로벌", "모바일", "디지털", "헬스", "에듀", "핀", "로직", "브릿지", "스타",
+]
+EN_WORDS = [
+    "Wanted", "Link", "Data", "Cloud", "Smart", "Green", "Blue", "Open", "Future", "Next",
+    "Korea", "Global", "Mobile", "Digital", "Health", "Edu", "Fin", "Logic", "Bridge", "Star",
+]
+JA_WORDS = [
+    "ウォンテッド", "リンク", "データ", "クラウド", "スマート", "グリーン", "ブルー", "オープン",
+    "フューチャー", "ネクスト", "コリア", "グローバル", "モバイル", "デジタル", "ヘルス", "エデュ",
+    "フィン", "ロジック", "ブリッジ", "スター",
+]
+# fmt: on
+SUFFIXES = [
+    ("랩", "Lab", "ラボ"),
+    ("테크", "Tech", "テック"),
+    ("소프트", "Soft", "ソフト"),
+    ("스튜디오", "Studio", "スタジオ"),
+    ("헬스케어", "Healthcare", "ヘルスケア"),
+    ("네트웍스", "Networks", "ネットワークス"),
+    ("", "", ""),
+]
+KO_PREFIXES = ["", "", "", "주식회사 ", "(주)"]
+
+MAX_TAGS_PER_COMPANY = 4
+
+
+def default_tag_count(companies: int) -> int:
+    """샘플 (회사 100개, 태그 30개) 과 비슷하게 회사 수에 비례하는 태그 수"""
+    return max(30, companies // 50)
+
+
+def tag_popularity(tag_count: int, rng: random.Random) -> List[int]:
+    """인기 순위별 태그 번호 (인기 태그가 번호 순서대로 몰리지 않도록 섞음)"""
+    ranks = list(range(1, tag_count + 1))
+    rng.shuffle(ranks)
+    return ranks
+
+
+def zipf_weights(count: int, exponent: float) -> List[float]:
+    """순위 k 의 누적 가중치 (1 / k^exponent)"""
+    return list(itertools.accumulate(1 / rank**exponent for rank in range(1, count + 1)))
+
+
+def company_names(index: int, rng: random.Random, seen: Dict[str, set]) -> Dict[str, str]:
+    first, second = rng.randrange(len(KO_WORDS)), rng.randrange(len(KO_WORDS))
+    suffix = SUFFIXES[rng.randrange(len(SUFFIXES))]
+    candidates = {
+        "ko": f"{rng.choice(KO_PREFIXES)}{KO_WORDS[first]}{KO_WORDS[second]}{suffix[0]}",
+        "en": f"{EN_WORDS[first]}{EN_WORDS[second].lower()} {suffix[1]}".strip(),
+        "ja": f"株式会社{JA_WORDS[first]}{JA_WORDS[second]}{suffix[2]}",
+    }
+    languages = [lang for lang, ratio in NAME_RATIOS.items() if rng.random() < ratio]
+    if not languages:
+        # 샘플에서 한국어 이름이 없는 회사는 영어 이름을 가짐
+        languages = ["en"]
+
+    names = {}
+    for lang in languages:
+        # 같은 이름이 이미 있으면 지점명처럼 번호를 붙여 회사명이 겹치지 않도록 함
+        name = candidates[lang]
+        if name in seen[lang]:
+            name = f"{name} {index}"
+        seen[lang].add(name)
+        names[lang] = name
+    return names
+
+
+def generate_rows(
+    companies: int,
+    tag_count: Optional[int] = None,
+    exponent: float = 1.1,
+    seed: int = 0,
+) -> Iterator[Dict[str, str]]:
+    """CSV 행 생성"""
+    rng = random.Random(seed)
+    tag_count = tag_count or default_tag_count(companies)
+    popular = tag_popularity(tag_count, rng)
+    cum_weights = zipf_weights(tag_count, exponent)
+    seen: Dict[str, set] = {lang: set() for lang in NAME_RATIOS}
+
+    for index in range(companies):
+        names = company_names(index, rng, seen)
+        count = rng.randint(1, min(MAX_TAGS_PER_COMPANY, tag_count))
+        tags: Dict[int, None] = {}
+        while len(tags) < count:
+            tags[rng.choices(popular, cum_weights=cum_weights)[0]] = None
+
+        yield {
+            "company_ko": names.get("ko", ""),
+            "company_en": names.get("en", ""),
+            "company_ja": names.get("ja", ""),
+            "tag_ko": "|".join(f"태그_{tag}" for tag in tags),
+            "tag_en": "|".join(f"tag_{tag}" for tag in tags),
+            "tag_ja": "|".join(f"タグ_{tag}" for tag in tags),
+        }
+
+
+def write_csv(rows: Iterator[Dict[str, str]], output) -> int:
+    writer = csv.DictWriter(output, fieldnames=COLUMNS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def main(args) -> int:
+    rows = generate_rows(args.companies, args.tags, args.exponent, args.seed)
+    if args.output == "-":
+        return write_csv(rows, sys.stdout)
+    with open(args.output, "w", newline="", encoding="utf-8") as output:
+        return write_csv(rows, output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=10000, help="10000 / 100000 / 1000000")
+    parser.add_argument("--tags", type=int, default=None, help="태그 수 (기본: 회사 수 / 50)")
+    parser.add_argument("--exponent", type=float, default=1.1, help="태그 인기도 Zipf 지수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="저장할 CSV 파일 (기본: stdout)")
+    main(parser.parse_args())
@@ -0,0 +1,235 @@
+"""
+API 시나리오별 처리량과 응답 시간(p50/p95/p99) 측정
+
+    python -m app.benchmarks.datagen --companies 100000 --output /tmp/companies_100k.csv
+    python -m app.scripts.init_data --bulk --csv /tmp/companies_100k.csv
+    python -m app.benchmarks.runner --csv /tmp/companies_100k.csv --concurrency 1 16 \\
+        --output after.json --baseline before.json
+
+- 기본은 ASGI 앱을 프로세스 안에서 호출 (lifespan 포함), --base-url 로 실행 중인 서버 호출
+- 요청 대상(회사명/태그명)은 적재한 CSV 에서 고르므로 태그 검색도 Zipf 인기도를 따른다.
+- create / add-tags 시나리오는 데이터를 추가하므로 벤치마크 전용 DB 에서 실행
+- 결과는 커밋 해시와 함께 JSON 으로 저장하고, --baseline 결과가 있으면 변화율을 함께 기록
+"""
+import argparse
+import asyncio
+import contextlib
+import csv
+import json
+import math
+import os
+import random
+import subprocess
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+from app.main import app
+
+CSV_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "scripts", "company_tag_sample.csv"
+)
+
+# CSV 컬럼별 언어코드
+NAME_COLUMNS = {"company_ko": "ko", "company_en": "en", "company_ja": "jp"}
+TAG_COLUMNS = {"tag_ko": "ko", "tag_en": "en", "tag_ja": "jp"}
+
+# (method, url, httpx 요청 옵션)
+Request = Tuple[str, str, Dict[str, Any]]
+
+SCENARIOS = ["search", "company", "tags", "create", "add-tags"]
+
+
+class Workload:
+    """CSV 에서 읽은 회사명/태그명으로 시나리오별 요청 생성"""
+
+    def __init__(self, rows: List[Dict[str, str]], seed: int = 0, limit: int = 20):
+        self.rng = random.Random(seed)
+        self.limit = limit
+        # 벤치마크 실행마다 새로 추가하는 회사/태그명이 겹치지 않도록 구분
+        self.run_id = f"{int(time.time()):x}"
+        self.sequence = 0
+        self.names: List[Tuple[str, str]] = []
+        # 회사별 태그 목록 (회사에서 고르면 인기 태그가 더 자주 선택됨)
+        self.company_tags: List[List[Dict[str, str]]] = []
+        for row in rows:
+            self.names += [(lang, row[col]) for col, lang in NAME_COLUMNS.items() if row.get(col)]
+            split = {lang: row[col].split("|") for col, lang in TAG_COLUMNS.items()}
+            self.company_tags.append([dict(zip(split, names)) for names in zip(*split.values())])
+
+    @classmethod
+    def from_csv(cls, path: str, sample: int, **kwargs) -> "Workload":
+        """CSV 앞에서부터 sample 개 행 사용 (합성 데이터는 행 순서와 관계 없이 같은 분포)"""
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = [row for _, row in zip(range(sample), csv.DictReader(file))]
+        return cls(rows, **kwargs)
+
+    def _next(self) -> int:
+        self.sequence += 1
+        return self.sequence
+
+    def _tag(self) -> Tuple[str, str]:
+        tag_names = self.rng.choice(self.rng.choice(self.company_tags))
+        return self.rng.choice(list(tag_names.items()))
+
+    def search(self) -> Request:
+        language, name = self.rng.choice(self.names)
+        query = name[: self.rng.randint(2, 4)]
+        params = {"query": query, "limit": self.limit}
+        return "GET", "/search", {"params": params, "headers": {"x-wanted-language": language}}
+
+    def company(self) -> Request:
+        language, name = self.rng.choice(self.names)
+        url = f"/companies/{quote(name, safe='')}"
+        return "GET", url, {"headers": {"x-wanted-language": language}}
+
+    def tags(self) -> Request:
+        language, tag_name = self._tag()
+        params = {"query": tag_name, "limit": self.limit}
+        return "GET", "/tags", {"params": params, "headers": {"x-wanted-language": language}}
+
+    def create(self) -> Request:
+        number = self._next()
+        body = {
+            "company_name": {"ko": f"벤치마크 {self.run_id} {number}"},
+            "tags": [{"tag_name": tag_names} for tag_names in self.rng.choice(self.company_tags)],
+        }
+        return "POST", "/companies", {"json": body, "headers": {"x-wanted-language": "ko"}}
+
+    def add_tags(self) -> Request:
+        language, name = self.rng.choice(self.names)
+        number = self._next()
+        body = [{"tag_name": {"ko": f"벤치마크태그_{self.run_id}_{number}"}}]
+        url = f"/companies/{quote(name, safe='')}/tags"
+        return "PUT", url, {"json": body, "headers": {"x-wanted-language": language}}
+
+    def scenario(self, name: str) -> Callable[[], Request]:
+        return getattr(self, name.replace("-", "_"))
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위수 (values 는 정렬된 목록)"""
+    if not values:
+        return 0.0
+    return values[max(math.ceil(q / 100 * len(values)) - 1, 0)]
+
+
+async def measure(
+    client: httpx.AsyncClient, make_request: Callable[[], Request], concurrency: int, total: int
+) -> Dict[str, Any]:
+    """concurrency 개의 워커로 total 개 요청을 처리하고 처리량/응답 시간 반환"""
+    remaining = total
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, url, options = make_request()
+            started = time.perf_counter()
+            resp = await client.request(method, url, **options)
+            latencies.append(time.perf_counter() - started)
+            if resp.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "requests_per_second": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """같은 시나리오/동시성의 baseline 대비 변화율(%) 기록"""
+    previous = {(r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])}
+    for result in results:
+        before = previous.get((result["scenario"], result["concurrency"]))
+        if not before:
+            continue
+        result["change"] = {
+            key: round((result[key] - before[key]) / before[key] * 100, 1) if before[key] else None
+            for key in ("requests_per_second", "p50_ms", "p95_ms", "p99_ms")
+        }
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.asynccontextmanager
+async def open_client(base_url: Optional[str], concurrency: int):
+    if base_url:
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            yield client
+        return
+
+    # 서버 실행 시와 같이 lifespan (인덱스 생성, 연결 정리) 포함
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            yield client
+
+
+async def main(args) -> Dict[str, Any]:
+    workload = Workload.from_csv(args.csv, args.sample, seed=args.seed, limit=args.limit)
+    results = []
+    async with open_client(args.base_url, max(args.concurrency)) as client:
+        for name in args.scenarios:
+            make_request = workload.scenario(name)
+            for concurrency in args.concurrency:
+                await measure(client, make_request, concurrency, args.warmup)
+                result = {"scenario": name}
+                result.update(await measure(client, make_request, concurrency, args.requests))
+                results.append(result)
+                print(json.dumps(result))
+
+    report = {
+        "commit": current_commit(),
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "target": args.base_url or "asgi",
+        "dataset": {"csv": args.csv, "sample": args.sample},
+        "results": results,
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            compare(results, json.load(file))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--csv", default=CSV_PATH, help="DB 에 적재한 CSV 파일")
+    parser.add_argument("--sample", type=int, default=10000, help="요청 대상을 고를 CSV 행 수")
+    parser.add_argument("--base-url", default=None, help="예) http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=1000, help="시나리오/동시성별 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전 요청 수")
+    parser.add_argument("--limit", type=int, default=20, help="/search, /tags 의 limit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 파일")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,104 @@
+"""
+회사 응답 직렬화 방식별 처리 시간 측정
+
+    python -m app.benchmarks.serialization --companies 10000 --repeat 5
+
+시나리오
+- default: CompanyResponse 검증 생성 + jsonable_encoder + json.dumps (FastAPI 기본 응답)
+- fast: CompanyResponse.model_construct + orjson (FAST_JSON_RESPONSE=true)
+- cached-default: 캐시 JSON 검증(model_validate_json) + jsonable_encoder + json.dumps
+- cached-encoded: 캐시 JSON 을 변환 없이 그대로 응답
+"""
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from app.common import responses
+from app.schemas.company import CompanyResponse
+
+
+def sample_rows(count: int, tag_count: int) -> List[Dict]:
+    """DB 조회 결과와 같은 형태의 회사명/태그명 목록"""
+    return [
+        {
+            "company_name": f"벤치마크 회사 {i}",
+            "tags": sorted(f"태그_{(i + j) % 50}" for j in range(tag_count)),
+        }
+        for i in range(count)
+    ]
+
+
+def default(rows: List[Dict]) -> bytes:
+    companies = [CompanyResponse(**row) for row in rows]
+    return JSONResponse(jsonable_encoder(companies)).body
+
+
+def fast(rows: List[Dict]) -> bytes:
+    companies = [CompanyResponse.model_construct(**row) for row in rows]
+    return responses.render(companies).body
+
+
+def cached_default(encoded: List[str]) -> bytes:
+    companies = [CompanyResponse.model_validate_json(data) for data in encoded]
+    return b"".join(JSONResponse(jsonable_encoder(company)).body for company in companies)
+
+
+def cached_encoded(encoded: List[str]) -> bytes:
+    return b"".join(Response(data, media_type="application/json").body for data in encoded)
+
+
+def measure(func: Callable, payload, repeat: int) -> float:
+    """repeat 번 실행한 시간 중 가장 짧은 시간(ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(args) -> List[Dict]:
+    responses.settings.fast_json_response = True
+    rows = sample_rows(args.companies, args.tags)
+    encoded = [CompanyResponse(**row).model_dump_json() for row in rows]
+
+    # 같은 데이터는 같은 JSON 으로 직렬화되어야 함
+    assert json.loads(default(rows)) == json.loads(fast(rows))
+    assert cached_default(encoded) == cached_encoded(encoded)
+
+    scenarios = {
+        "default": (default, rows),
+        "fast": (fast, rows),
+        "cached-default": (cached_default, encoded),
+        "cached-encoded": (cached_encoded, encoded),
+    }
+    results = []
+    for name in args.scenarios:
+        func, payload = scenarios[name]
+        results.append(
+            {
+                "scenario": name,
+                "companies": args.companies,
+                "milliseconds": round(measure(func, payload, args.repeat), 2),
+            }
+        )
+        print(json.dumps(results[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=10000)
+    parser.add_argument("--tags", type=int, default=5, help="회사별 태그 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=["default", "fast", "cached-default", "cached-encoded"],
+        choices=["default", "fast", "cached-default", "cached-encoded"],
+    )
+    main(parser.parse_args())
@@ -1,14 +1,80 @@
 import redis
+import redis.asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.common.greenlet_redis import GreenletRedis
+from app.common.routing import REPLICAS, ReplicaSet, RoutingSession
 from app.config.settings import Settings
 
 settings = Settings()
 
-engine = create_engine(settings.database_url, echo=True)
-SessionLocal = sessionmaker(engine, expire_on_commit=False, autocommit=False)
+engine_options = dict(
+    echo=settings.database_echo,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+)
+engine = create_engine(settings.database_url, **engine_options)
+
+# 읽기 전용 조회 (read_replica) 를 보낼 replica, 없으면 모두 primary 로 보냄
+# replica 는 연결 오류 시 바로 제외되도록 커넥션을 사용 전에 확인
+replica_engines = [
+    create_engine(url, pool_pre_ping=True, **engine_options) for url in settings.replica_urls
+]
+replicas = ReplicaSet(replica_engines, settings.database_replica_retry_interval)
+SessionLocal = sessionmaker(
+    engine,
+    class_=RoutingSession,
+    info={REPLICAS: replicas},
+    expire_on_commit=False,
+    autocommit=False,
+)
 
-RedisClient = redis.StrictRedis(
-    host=settings.redis_host, port=settings.redis_port, db=settings.redis_db, decode_responses=True
+# DATABASE_ASYNC 모드에서 사용하는 asyncpg 엔진
+async_engine = None
+async_replica_engines = []
+AsyncSessionLocal = None
+if settings.database_async:
+    # asyncpg 의 prepared statement 가 generic plan 으로 바뀌면
+    # language_code 별 partial 인덱스를 사용할 수 없으므로 항상 custom plan 사용
+    async_engine_options = dict(
+        engine_options,
+        connect_args={"server_settings": {"plan_cache_mode": "force_custom_plan"}},
+    )
+    async_engine = create_async_engine(settings.async_database_url, **async_engine_options)
+    async_replica_engines = [
+        create_async_engine(url, pool_pre_ping=True, **async_engine_options)
+        for url in settings.async_replica_urls
+    ]
+    # AsyncSession 의 동기 세션이 replica 를 고르므로 동기 엔진 전달
+    async_replicas = ReplicaSet(
+        [replica.sync_engine for replica in async_replica_engines],
+        settings.database_replica_retry_interval,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        sync_session_class=RoutingSession,
+        info={REPLICAS: async_replicas},
+        expire_on_commit=False,
+        autocommit=False,
+    )
+
+redis_options = dict(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.redis_db,
+    decode_responses=True,
+    max_connections=settings.redis_max_connections,
+    health_check_interval=settings.redis_health_check_interval,
+    socket_timeout=settings.redis_socket_timeout,
+    socket_connect_timeout=settings.redis_socket_timeout,
 )
+
+# 워커 프로세스 단위로 공유하는 Redis 커넥션 풀
+RedisPool = redis.ConnectionPool(**redis_options)
+RedisClient = redis.StrictRedis(connection_pool=RedisPool)
+
+# async 모드용 Redis 커넥션 풀 (run_db 의 greenlet 안에서 동기 클라이언트처럼 사용)
+AsyncRedisPool = redis.asyncio.ConnectionPool(**redis_options)
+AsyncRedisClient = GreenletRedis(redis.asyncio.StrictRedis(connection_pool=AsyncRedisPool))
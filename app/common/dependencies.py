@@ -1,27 +1,78 @@
-from fastapi import Depends
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from fastapi import Depends, Request
+from redis import StrictRedis
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.config.settings import Settings
+from app.repositories.cache_repository import CacheRepository
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.tag_repository import TagRepository
 from app.services.company_service import CompanyService
 
-from .database import RedisClient, SessionLocal
+from .database import AsyncRedisClient, AsyncSessionLocal, RedisClient, SessionLocal
+from .greenlet_redis import greenlet_sleep
+from .routing import READ_PRIMARY_HEADER, pin_primary
+from .search_index import company_name_index
+from .tag_cache import tag_name_cache
+from .tag_index import tag_index
+
+settings = Settings()
+
 
+def _route_request(session: Session, request: Request) -> None:
+    """X-Read-Primary header 가 있으면 (직전에 쓴 데이터 조회) replica 를 사용하지 않음"""
+    if READ_PRIMARY_HEADER in request.headers:
+        pin_primary(session)
 
-def get_db():
+
+def get_sync_db(request: Request):
     with SessionLocal() as session:
         try:
+            _route_request(session, request)
             yield session
         finally:
             session.close()
 
 
-def get_redis() -> RedisClient:
-    with RedisClient() as redis_client:
-        try:
-            yield redis_client
-        finally:
-            redis_client.close()
+async def get_async_db(request: Request):
+    """
+    AsyncSession 의 동기 Session 을 전달한다.
+    repository/service 는 run_db (AsyncSession.run_sync) 로 greenlet 안에서 실행되어 asyncpg 로 비동기 조회한다.
+    """
+    async with AsyncSessionLocal() as session:
+        _route_request(session.sync_session, request)
+        yield session.sync_session
+
+
+get_db = get_async_db if settings.database_async else get_sync_db
+
+
+@asynccontextmanager
+async def open_db() -> AsyncIterator[Session]:
+    """요청과 관계 없는 세션 (요청이 끝나거나 취소되어도 사용하는 작업용)"""
+    if settings.database_async:
+        async with AsyncSessionLocal() as session:
+            yield session.sync_session
+        return
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        await run_in_threadpool(session.close)
+
+
+def get_db_factory() -> Callable[[], AsyncContextManager[Session]]:
+    return open_db
+
+
+def get_redis() -> StrictRedis:
+    # 클라이언트는 요청마다 커넥션 풀에서 커넥션을 빌려 쓴다.
+    # async 모드의 service 는 이벤트 루프 스레드에서 실행되므로 비동기 클라이언트를 사용
+    return AsyncRedisClient if settings.database_async else RedisClient
 
 
 def get_company_repository(db: Session = Depends(get_db)) -> CompanyRepository:
@@ -32,8 +83,23 @@ def get_tag_repository(db: Session = Depends(get_db)) -> TagRepository:
     return TagRepository(db)
 
 
+def get_cache_repository(redis_client: StrictRedis = Depends(get_redis)) -> CacheRepository:
+    if settings.database_async:
+        # lease 대기 중에도 이벤트 루프를 막지 않음
+        return CacheRepository(redis_client, sleep=greenlet_sleep)
+    return CacheRepository(redis_client)
+
+
 def get_company_service(
     company_repository: CompanyRepository = Depends(get_company_repository),
     tag_repository: TagRepository = Depends(get_tag_repository),
+    cache_repository: CacheRepository = Depends(get_cache_repository),
 ) -> CompanyService:
-    return CompanyService(company_repository=company_repository, tag_repository=tag_repository)
+    return CompanyService(
+        company_repository=company_repository,
+        tag_repository=tag_repository,
+        name_index=company_name_index if settings.search_index_enabled else None,
+        cache_repository=cache_repository if settings.cache_enabled else None,
+        tag_index=tag_index if settings.tag_index_enabled else None,
+        tag_cache=tag_name_cache if settings.tag_cache_enabled else None,
+    )
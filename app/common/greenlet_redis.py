@@ -0,0 +1,46 @@
+import asyncio
+import inspect
+from typing import Any
+
+from redis.asyncio import StrictRedis as AsyncStrictRedis
+from sqlalchemy.util import await_only
+
+
+class GreenletRedis:
+    """
+    redis.asyncio 클라이언트를 동기 클라이언트와 같은 방식으로 사용하는 adapter
+    async 모드의 service 는 run_db (AsyncSession.run_sync) 의 greenlet 안에서 실행되므로,
+    명령을 await_only 로 이벤트 루프에 넘겨 응답을 기다리는 동안 루프를 막지 않는다.
+    greenlet 밖 (스레드, 스크립트) 에서는 사용할 수 없다.
+    """
+
+    def __init__(self, client: AsyncStrictRedis):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            # pipeline 과 pipeline 에 쌓은 명령은 pipeline 자신을 반환 (execute 에서 실행)
+            if isinstance(result, AsyncStrictRedis):
+                return GreenletRedis(result)
+            if inspect.isawaitable(result):
+                return await_only(result)
+            return result
+
+        return call
+
+    def __enter__(self) -> "GreenletRedis":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # pipeline 의 WATCH 해제, 커넥션 반환
+        await_only(self._client.reset())
+
+
+def greenlet_sleep(seconds: float) -> None:
+    """greenlet 안에서 이벤트 루프를 막지 않고 대기"""
+    await_only(asyncio.sleep(seconds))
@@ -0,0 +1,39 @@
+from typing import Dict, Optional
+
+from fastapi.responses import Response
+
+from app.config.settings import Settings
+
+settings = Settings()
+
+# 같은 URL 이라도 언어 header 에 따라 응답이 다름
+VARY = "X-Wanted-Language"
+
+
+def entity_tag(*parts) -> str:
+    """버전 값으로 만든 strong ETag (버전이 같으면 응답 본문도 같음)"""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 목록에 etag 가 있는지 확인 (RFC 9110, W/ 는 무시하고 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """ETag 와 함께 응답하는 header (max-age 가 지나면 If-None-Match 로 다시 확인)"""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"max-age={settings.http_cache_max_age}, must-revalidate",
+        "Vary": VARY,
+    }
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers=cache_headers(etag))
@@ -0,0 +1,163 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.common.database import SessionLocal
+from app.config.settings import Settings
+from app.models.company import CatalogChange
+from app.repositories.company_repository import CompanyRepository
+
+settings = Settings()
+
+logger = logging.getLogger("app.index_sync")
+
+
+class CatalogChanges(NamedTuple):
+    """색인에 반영할 변경분"""
+
+    # 회사명/태그가 추가되거나 태그 연결이 삭제된 회사
+    company_ids: Set[int]
+    # 삭제된 (회사 id, 태그 id) 연결
+    removed_tags: List[Tuple[int, int]]
+
+
+def merge_changes(changes: Iterable[CatalogChange]) -> CatalogChanges:
+    """버전별 변경 내역을 하나의 변경분으로 합침"""
+    company_ids: Set[int] = set()
+    removed_tags: List[Tuple[int, int]] = []
+    for change in changes:
+        company_ids.update(change.company_ids)
+        removed_tags += [
+            (company_id, tag_id)
+            for company_id in change.company_ids
+            for tag_id in change.removed_tag_ids
+        ]
+    return CatalogChanges(company_ids, removed_tags)
+
+
+class VersionedIndex(ABC):
+    """
+    catalog_version 기준으로 최신 여부를 판단하는 프로세스 단위 색인
+    - 현재 워커의 변경은 색인에 바로 반영하고 mark_version 으로 버전을 올린다.
+    - 다른 워커의 변경은 refresh 에서 catalog_change 의 변경분만 다시 조회하여 반영한다.
+    - 처음 생성하거나 변경 내역이 없는 버전 (적재 스크립트, 보관 기간 초과) 이 있으면 다시 생성한다.
+    build, apply 와 변경 메서드는 self._lock 을 사용해야 한다.
+    """
+
+    _lock: threading.Lock
+
+    def _init_version(self) -> None:
+        # 색인에 반영된 catalog_version (생성 전에는 None)
+        self.version: Optional[int] = None
+
+    @abstractmethod
+    def build(self, db: Session) -> None:
+        """DB 의 전체 데이터로 색인을 다시 생성"""
+
+    @abstractmethod
+    def apply(self, db: Session, changes: CatalogChanges) -> None:
+        """변경된 회사의 현재 데이터를 다시 조회하여 색인에 반영 (여러 번 반영해도 같은 결과)"""
+
+    def mark_version(self, version: int) -> None:
+        """
+        현재 워커의 변경을 반영하고 catalog_version 을 version 으로 올린 뒤 호출
+        그 사이 다른 변경이 있었다면 버전을 올리지 않고 다음 refresh 에서 변경분을 반영한다.
+        """
+        with self._lock:
+            if self.version == version - 1:
+                self.version = version
+
+    def refresh(self, db: Session, version: int, changes: Optional[CatalogChanges] = None) -> bool:
+        """
+        색인의 버전이 version 과 다르면 changes 를 반영 (None 이면 다시 생성)
+        version 은 색인에 반영할 데이터보다 먼저 조회한 값이어야 한다.
+        """
+        if self.version == version:
+            return False
+
+        if changes is None:
+            self.build(db)
+        else:
+            self.apply(db, changes)
+        # 반영 중 현재 워커의 변경이 있었더라도 이후 버전의 변경 내역으로 다시 반영된다.
+        with self._lock:
+            self.version = version
+        return True
+
+
+class IndexRefresher:
+    """
+    catalog_version 을 interval 초마다 확인하여 색인을 갱신하는 스레드
+    다른 워커의 변경과 적재 스크립트로 추가된 데이터를 최대 interval 초 안에 반영한다.
+    """
+
+    def __init__(self, indexes: List[VersionedIndex], interval: float = 5.0):
+        self.indexes = indexes
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self, db: Optional[Session] = None) -> List[VersionedIndex]:
+        """버전이 달라진 색인에 변경분을 반영하고 (또는 다시 생성하고) 갱신한 색인 목록 반환"""
+        if not self.indexes:
+            return []
+        with self._lock:
+            if db is None:
+                with SessionLocal() as db:
+                    return self._refresh(db)
+            return self._refresh(db)
+
+    def _refresh(self, db: Session) -> List[VersionedIndex]:
+        repository = CompanyRepository(db)
+        version = repository.get_catalog_version()
+        # 색인의 버전별 변경분 (같은 버전의 색인은 한 번만 조회)
+        changes: Dict[int, Optional[CatalogChanges]] = {}
+        refreshed = []
+        for index in self.indexes:
+            if index.version == version:
+                continue
+            if index.version is not None and index.version not in changes:
+                changes[index.version] = self._changes(repository, index.version, version)
+            if index.refresh(db, version, changes.get(index.version)):
+                refreshed.append(index)
+        return refreshed
+
+    @staticmethod
+    def _changes(
+        repository: CompanyRepository, after: int, version: int
+    ) -> Optional[CatalogChanges]:
+        """after 이후의 변경분 (변경 내역이 없는 버전이 있거나 너무 많으면 None)"""
+        if version - after > settings.catalog_change_retention:
+            return None
+        rows = repository.get_catalog_changes(after, version)
+        if rows is None:
+            return None
+        changes = merge_changes(rows)
+        if len(changes.company_ids) > settings.index_replay_max_companies:
+            return None
+        return changes
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                for index in self.refresh():
+                    logger.info("%s 갱신 (catalog_version=%s)", type(index).__name__, index.version)
+            except Exception:
+                logger.exception("색인 갱신 실패")
+
+    def start(self) -> None:
+        if not self.indexes or self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="index-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,119 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.settings import Settings
+
+settings = Settings()
+logger = logging.getLogger("app.sql")
+
+# IN (...) 목록의 bind 파라미터 개수, asyncpg 의 $n 번호와 관계 없이 같은 형태로 취급
+IN_LIST_PATTERN = re.compile(r"\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)*\s*\)")
+NUMBERED_PARAM_PATTERN = re.compile(r"\$\d+")
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 값/개수를 제외한 SQL 형태"""
+    shape = IN_LIST_PATTERN.sub("(?)", statement)
+    shape = NUMBERED_PARAM_PATTERN.sub("?", shape)
+    return " ".join(shape.split())
+
+
+class QueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float, rows: int) -> None:
+        self.count += 1
+        self.duration += duration
+        self.rows += max(rows, 0)
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 번보다 많이 반복된 SQL 형태 (N+1 의심)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def server_timing(self) -> str:
+        """Server-Timing header 값"""
+        return f'db;desc="queries={self.count} rows={self.rows}";dur={self.duration * 1000:.2f}'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실행 단위 context 에 저장 (실패한 SQL 은 after_cursor_execute 가 호출되지 않음)
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    stats = _current.get()
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started, cursor.rowcount)
+
+
+def instrument(engine: Engine) -> None:
+    """엔진에서 실행되는 SQL 을 현재 요청의 통계에 기록 (AsyncEngine 은 sync_engine 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    요청 단위 SQL 통계를 Server-Timing header 와 로그로 남기는 ASGI middleware
+    같은 형태의 SQL 이 sql_n_plus_one_threshold 번보다 많이 실행되면 N+1 로 경고한다.
+    """
+
+    def __init__(self, app, threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = threshold if threshold is not None else settings.sql_n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self.report(scope, stats)
+
+    def report(self, scope, stats: QueryStats) -> None:
+        endpoint = f"{scope['method']} {scope['path']}"
+        logger.info(
+            "%s queries=%d db_ms=%.2f rows=%d",
+            endpoint,
+            stats.count,
+            stats.duration * 1000,
+            stats.rows,
+        )
+        for shape, count in stats.repeated(self.threshold):
+            logger.warning("N+1 의심 %s: 같은 SQL %d 회 실행 - %s", endpoint, count, shape[:200])
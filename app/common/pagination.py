@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+# 다음 페이지 cursor 응답 header (응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# cursor 정렬 키 타입
+ID_CURSOR = (int,)
+# 회사명 자동완성 (bucket, 소문자 이름, 이름, id)
+SEARCH_CURSOR = (int, str, str, int)
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값을 cursor 문자열로 변환"""
+    payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _is_type(value: Any, value_type: type) -> bool:
+    # bool 은 int 의 하위 타입이므로 제외
+    return isinstance(value, value_type) and not isinstance(value, bool)
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """cursor 문자열을 정렬 키 값 목록으로 변환 (types 는 정렬 키별 타입)"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, ValueError):
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(_is_type(value, value_type) for value, value_type in zip(values, types))
+    ):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+    return values
+
+
+def paginate(
+    items: Sequence[T], keys: Sequence[Sequence[Any]], limit: Optional[int]
+) -> Tuple[List[T], Optional[str]]:
+    """
+    limit + 1 개를 조회한 결과를 limit 개로 자르고 다음 페이지 cursor 생성
+    keys 는 items 의 keyset 정렬 키
+    """
+    if limit is None or len(items) <= limit:
+        return list(items), None
+    return list(items[:limit]), encode_cursor(*keys[limit - 1])
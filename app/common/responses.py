@@ -0,0 +1,39 @@
+from typing import Any, Mapping, Optional, Union
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+from app.config.settings import Settings
+
+settings = Settings()
+
+# fast_json_response 이면 오류 응답 등 기본 응답도 orjson 으로 직렬화
+DefaultResponse = ORJSONResponse if settings.fast_json_response else JSONResponse
+
+
+def _encode_model(obj: Any) -> Any:
+    """orjson 이 직접 직렬화하지 못하는 pydantic 모델 변환"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"{type(obj).__name__} 는 JSON 으로 변환할 수 없습니다.")
+
+
+def render(content: Any, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    응답 본문 직렬화
+    fast_json_response 이면 jsonable_encoder 를 거치지 않고 orjson 으로 바로 직렬화한다.
+    아니면 FastAPI 기본 응답과 같이 jsonable_encoder + json.dumps 로 직렬화한다.
+    """
+    if settings.fast_json_response:
+        body = orjson.dumps(content, default=_encode_model)
+        return Response(body, media_type="application/json", headers=headers)
+    return JSONResponse(jsonable_encoder(content), headers=headers)
+
+
+def render_encoded(
+    body: Union[str, bytes], headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """이미 JSON 으로 직렬화된 본문(캐시 등)을 다시 변환하지 않고 그대로 응답"""
+    return Response(body, media_type="application/json", headers=headers)
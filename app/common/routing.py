@@ -0,0 +1,136 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger("app.routing")
+
+# Session.info 키
+REPLICAS = "replicas"
+READ_REPLICA = "read_replica"
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# 직전에 쓴 데이터를 읽어야 하는 요청 (replica 지연과 관계 없이 primary 에서 조회)
+READ_PRIMARY_HEADER = "x-read-primary"
+
+
+class ReplicaSet:
+    """
+    읽기 전용 replica 엔진 목록
+    round-robin 으로 고르고, 연결 오류가 난 replica 는 retry_interval 초 동안 제외한다.
+    """
+
+    def __init__(self, engines: Iterable[Engine] = (), retry_interval: float = 5.0):
+        self.engines = list(engines)
+        self.retry_interval = retry_interval
+        self._down_until: Dict[Engine, float] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def choose(self) -> Optional[Engine]:
+        """다음 정상 replica (모두 제외된 상태면 None, primary 사용)"""
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            with self._lock:
+                engine = self.engines[next(self._counter) % len(self.engines)]
+            if self._down_until.get(engine, 0) <= now:
+                return engine
+        return None
+
+    def is_down(self, engine: Engine) -> bool:
+        return self._down_until.get(engine, 0) > time.monotonic()
+
+    def mark_down(self, engine: Engine) -> None:
+        if not self.is_down(engine):
+            logger.warning("replica %s 연결 실패, %.1f초 동안 제외", engine.url, self.retry_interval)
+        self._down_until[engine] = time.monotonic() + self.retry_interval
+
+    def _on_error(self, context) -> None:
+        # 연결 중 오류 (connection 없음) 또는 연결이 끊어진 경우만 제외
+        if context.engine is not None and (context.connection is None or context.is_disconnect):
+            self.mark_down(context.engine)
+
+
+class RoutingSession(Session):
+    """
+    read_replica() 안의 조회는 replica 로, 나머지는 primary (bind) 로 보내는 세션
+    - 한 세션은 처음 고른 replica 만 사용 (버전 확인과 본문 조회가 같은 시점의 데이터)
+    - 세션에서 한 번이라도 변경 (flush, INSERT/UPDATE/DELETE) 하면 이후 조회는 primary
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[PRIMARY] = True
+        elif self.info.get(READ_REPLICA) and not self.info.get(PRIMARY):
+            replica = self._replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _replica(self) -> Optional[Engine]:
+        if REPLICA not in self.info:
+            replicas: Optional[ReplicaSet] = self.info.get(REPLICAS)
+            self.info[REPLICA] = replicas.choose() if replicas else None
+        return self.info[REPLICA]
+
+
+@contextmanager
+def read_replica(session: Session) -> Iterator[None]:
+    """블록 안의 조회를 replica 로 보냄 (RoutingSession 이 아니면 영향 없음)"""
+    previous = session.info.get(READ_REPLICA, False)
+    session.info[READ_REPLICA] = True
+    try:
+        yield
+    finally:
+        session.info[READ_REPLICA] = previous
+
+
+def pin_primary(session: Session) -> None:
+    """이후 조회를 모두 primary 로 보냄 (read-your-writes)"""
+    session.info[PRIMARY] = True
+
+
+def is_primary_pinned(session: Session) -> bool:
+    return bool(session.info.get(PRIMARY))
+
+
+def replica_read(get_session: Callable[..., Session]):
+    """
+    읽기 전용 메서드의 조회를 replica 로 보내는 decorator (get_session(self) 로 세션 확인)
+    사용 중인 replica 의 연결이 끊어지면 다른 replica (없으면 primary) 로 한 번 더 실행한다.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            session = get_session(self)
+            with read_replica(session):
+                try:
+                    return method(self, *args, **kwargs)
+                except DBAPIError:
+                    replica = session.info.get(REPLICA)
+                    replicas = session.info.get(REPLICAS)
+                    if replica is None or not replicas or not replicas.is_down(replica):
+                        raise
+                    session.rollback()
+                    del session.info[REPLICA]
+                    return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,289 @@
+import bisect
+import heapq
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.common.index_sync import CatalogChanges, VersionedIndex
+from app.config.settings import Settings
+from app.models.company import CompanyName
+
+settings = Settings()
+
+# ILIKE 패턴에서 특수 의미를 가지는 문자
+LIKE_SPECIAL_CHARS = ("%", "_", "\\")
+
+# 자동완성 정렬 키: (소문자 회사명, 회사명, company_name.id)
+Entry = Tuple[str, str, int]
+
+
+class NgramIndex:
+    """
+    회사명 n-gram 역색인
+    - 길이 1 ~ n 의 모든 gram 을 색인하므로 n 보다 짧은 검색어도 처리할 수 있다.
+    - 검색 결과는 ILIKE '%query%' 결과를 모두 포함하는 후보 집합이다.
+    """
+
+    def __init__(self, n: int = 2):
+        self.n = n
+        self._names: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _grams(self, text: str, size: int) -> Set[str]:
+        return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+    def add(self, name_id: int, name: str) -> None:
+        """회사명 색인"""
+        folded = name.lower()
+        self._names[name_id] = folded
+        for size in range(1, self.n + 1):
+            for gram in self._grams(folded, size):
+                self._postings[gram].add(name_id)
+
+    def candidates(self, query: str) -> Set[int]:
+        """검색어를 포함하는 회사명 id 목록"""
+        folded = query.lower()
+        if not folded:
+            return set(self._names)
+
+        size = min(len(folded), self.n)
+        postings = [self._postings.get(gram, set()) for gram in self._grams(folded, size)]
+        postings.sort(key=len)
+
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                return result
+
+        # 검색어가 n 보다 길면 gram 교집합만으로는 부족하므로 실제 포함 여부를 확인
+        if len(folded) > self.n:
+            result = {name_id for name_id in result if folded in self._names[name_id]}
+        return result
+
+
+class RadixTrieNode:
+    __slots__ = ("children", "entries", "top")
+
+    def __init__(self):
+        # 첫 글자 -> (edge label, 자식 노드)
+        self.children: Dict[str, Tuple[str, "RadixTrieNode"]] = {}
+        # 이 노드에서 끝나는 회사명
+        self.entries: List[Entry] = []
+        # 하위 트리 전체의 상위 k 개 자동완성 결과
+        self.top: List[Entry] = []
+
+
+class RadixTrie:
+    """
+    회사명 접두어 자동완성을 위한 radix tree
+    각 노드가 하위 트리의 상위 k 개 결과를 가지고 있으므로 limit <= k 인 조회는
+    접두어를 가진 회사명 수와 관계없이 접두어 길이만큼만 탐색한다.
+    """
+
+    def __init__(self, k: int = 10):
+        self.k = k
+        self.root = RadixTrieNode()
+
+    def _push_top(self, node: RadixTrieNode, entry: Entry) -> None:
+        bisect.insort(node.top, entry)
+        if len(node.top) > self.k:
+            node.top.pop()
+
+    def insert(self, key: str, entry: Entry) -> None:
+        """key 경로의 모든 노드에 entry 추가"""
+        node = self.root
+        self._push_top(node, entry)
+        rest = key
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                leaf = RadixTrieNode()
+                node.children[rest[0]] = (rest, leaf)
+                node = leaf
+                self._push_top(node, entry)
+                break
+
+            label, child_node = child
+            common = 0
+            while common < min(len(label), len(rest)) and label[common] == rest[common]:
+                common += 1
+
+            # edge 중간에서 갈라지면 중간 노드를 만들어 분할
+            if common < len(label):
+                middle = RadixTrieNode()
+                middle.children[label[common]] = (label[common:], child_node)
+                middle.top = list(child_node.top)
+                node.children[rest[0]] = (label[:common], middle)
+                child_node = middle
+
+            node = child_node
+            self._push_top(node, entry)
+            rest = rest[common:]
+
+        node.entries.append(entry)
+
+    def _find(self, prefix: str) -> Optional[RadixTrieNode]:
+        node = self.root
+        rest = prefix
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return None
+            label, child_node = child
+            if rest.startswith(label):
+                rest = rest[len(label) :]
+                node = child_node
+            elif label.startswith(rest):
+                return child_node
+            else:
+                return None
+        return node
+
+    def complete(self, prefix: str, limit: int) -> List[Entry]:
+        """접두어로 시작하는 상위 limit 개 결과"""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        if limit <= self.k:
+            return node.top[:limit]
+
+        # 캐시보다 많은 결과가 필요하면 하위 트리 전체 탐색
+        entries: List[Entry] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            entries.extend(current.entries)
+            stack.extend(child for _, child in current.children.values())
+        return heapq.nsmallest(limit, entries)
+
+
+class LanguageNameIndex:
+    """한 언어의 회사명 색인 (부분 검색용 n-gram 색인 + 접두어 검색용 trie)"""
+
+    def __init__(self, n: int, k: int):
+        self.names: Dict[int, str] = {}
+        self.ngram = NgramIndex(n)
+        self.trie = RadixTrie(k)
+
+    def add(self, name_id: int, name: str) -> None:
+        # 변경분 반영 시 이미 색인한 회사명이 다시 추가될 수 있음
+        if self.names.get(name_id) == name:
+            return
+        self.names[name_id] = name
+        self.ngram.add(name_id, name)
+        self.trie.insert(name.lower(), (name.lower(), name, name_id))
+
+
+class CompanyNameIndex(VersionedIndex):
+    """
+    언어별 회사명 색인
+    앱 시작 시 company_name 테이블로부터 생성되고, 회사 생성 시 갱신된다.
+    다른 워커의 변경은 catalog_version 이 달라지면 변경된 회사의 회사명을 추가하여 반영한다.
+    """
+
+    def __init__(self, n: int = 2, k: int = 10):
+        self.n = n
+        self.k = k
+        self.ready = False
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, LanguageNameIndex] = {}
+        self._init_version()
+
+    def _new_language_index(self) -> LanguageNameIndex:
+        return LanguageNameIndex(self.n, self.k)
+
+    def build(self, db: Session) -> None:
+        """company_name 테이블 전체로 색인 생성"""
+        indexes: Dict[str, LanguageNameIndex] = defaultdict(self._new_language_index)
+        queryset = select(CompanyName.id, CompanyName.language_code, CompanyName.name)
+        for name_id, language_code, name in db.execute(queryset).yield_per(1000):
+            indexes[language_code].add(name_id, name)
+
+        with self._lock:
+            self._indexes = dict(indexes)
+            self.ready = True
+
+    def apply(self, db: Session, changes: CatalogChanges) -> None:
+        """변경된 회사의 회사명 색인 (회사명은 추가만 되므로 없는 회사명만 추가됨)"""
+        queryset = select(CompanyName.id, CompanyName.language_code, CompanyName.name).filter(
+            CompanyName.company_id.in_(changes.company_ids)
+        )
+        rows = db.execute(queryset).all()
+        with self._lock:
+            for name_id, language_code, name in rows:
+                self._add(name_id, language_code, name)
+
+    def add(self, company_name: CompanyName) -> None:
+        """새로운 회사명 색인"""
+        with self._lock:
+            self._add(company_name.id, company_name.language_code, company_name.name)
+
+    def _add(self, name_id: int, language_code: str, name: str) -> None:
+        if language_code not in self._indexes:
+            self._indexes[language_code] = self._new_language_index()
+        self._indexes[language_code].add(name_id, name)
+
+    def _can_serve(self, query: str) -> bool:
+        return self.ready and not any(c in query for c in LIKE_SPECIAL_CHARS)
+
+    def search(self, query: str, language: str) -> Optional[List[int]]:
+        """
+        검색어를 포함하는 회사명 id 목록
+        색인으로 처리할 수 없는 경우(색인 미생성, LIKE 특수문자 포함) None 을 반환한다.
+        """
+        if not self._can_serve(query):
+            return None
+
+        with self._lock:
+            index = self._indexes.get(language)
+            if index is None:
+                return []
+            return list(index.ngram.candidates(query))
+
+    def search_ranked(self, query: str, language: str, limit: int) -> Optional[List[str]]:
+        """
+        자동완성 상위 limit 개 회사명
+        접두어 일치 결과를 먼저, 부족하면 중간 일치 결과를 회사명 순으로 채운다.
+        색인으로 처리할 수 없는 경우 None 을 반환한다.
+        """
+        keys = self.search_ranked_keys(query, language, limit)
+        if keys is None:
+            return None
+        return [name for _, _, name, _ in keys]
+
+    def search_ranked_keys(
+        self, query: str, language: str, limit: int
+    ) -> Optional[List[Tuple[int, str, str, int]]]:
+        """
+        search_ranked 결과의 정렬 키 (접두어 불일치 여부, 소문자 회사명, 회사명, id)
+        CompanyRepository.search_by_name_ranked 의 정렬 키와 같다.
+        """
+        if not self._can_serve(query):
+            return None
+
+        folded = query.lower()
+        with self._lock:
+            index = self._indexes.get(language)
+            if index is None:
+                return []
+
+            keys = [(0, *entry) for entry in index.trie.complete(folded, limit)]
+            if len(keys) < limit:
+                middle = (
+                    (index.names[name_id].lower(), index.names[name_id], name_id)
+                    for name_id in index.ngram.candidates(folded)
+                )
+                middle = (entry for entry in middle if not entry[0].startswith(folded))
+                keys += [(1, *entry) for entry in heapq.nsmallest(limit - len(keys), middle)]
+
+        return keys
+
+
+company_name_index = CompanyNameIndex(n=settings.search_index_ngram, k=settings.search_index_topk)
@@ -0,0 +1,41 @@
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from app.config.settings import Settings
+
+settings = Settings()
+
+
+class SingleFlight:
+    """
+    워커 프로세스 안에서 같은 키의 동시 호출을 하나로 합침
+    먼저 시작한 호출의 결과(또는 예외)를 끝나기 전에 들어온 같은 키의 호출이 함께 사용한다.
+    계산은 별도 task 로 실행되므로 먼저 시작한 요청이 취소되어도 다른 요청은 결과를 받는다.
+    따라서 func 는 요청 세션을 사용하지 않아야 한다. (utils.run_in_new_session 참고)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        if not self.enabled:
+            return await func(*args, **kwargs)
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.stats["calls"] += 1
+        else:
+            self.stats["shared"] += 1
+        return await asyncio.shield(task)
+
+
+single_flight = SingleFlight(enabled=settings.single_flight_enabled)
@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from redis import RedisError, StrictRedis
+
+from app.config.settings import Settings
+
+settings = Settings()
+
+# 태그명 변경을 다른 워커 프로세스에 알리는 채널
+INVALIDATION_CHANNEL = "tag_cache:invalidate"
+
+# 태그의 다국어 이름 [(언어, 태그명), ...] (저장 순)
+TagNames = Tuple[Tuple[str, str], ...]
+
+
+class TagNameCache:
+    """
+    프로세스 단위 태그명 캐시 (tag_id -> 다국어 이름, (언어, 태그명) -> tag_id)
+    - 최대 size 개를 LRU 로 유지하고, ttl 초가 지난 항목은 다시 조회한다.
+    - 태그명이 추가되면 Redis pub/sub 으로 모든 워커에 무효화를 전달한다.
+    - 태그명은 삭제/변경되지 않으므로 (언어, 태그명) -> tag_id 는 항목이 있으면 항상 유효하다.
+    """
+
+    def __init__(
+        self, size: int = 10000, ttl: int = 600, redis_client: Optional[StrictRedis] = None
+    ):
+        self.size = size
+        self.ttl = ttl
+        self.redis_client = redis_client
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[float, TagNames]]" = OrderedDict()
+        self._tag_ids: Dict[Tuple[str, str], int] = {}
+        # 무효화 횟수 (무효화 이전에 조회한 값을 저장하지 않기 위해 사용)
+        self.generation = 0
+        self._subscriber = None
+        # 캐시 적중/실패, Redis 오류 통계
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, tag_id: int) -> None:
+        _, names = self._entries.pop(tag_id)
+        for pair in names:
+            if self._tag_ids.get(pair) == tag_id:
+                del self._tag_ids[pair]
+
+    def get_many(self, tag_ids: Iterable[int]) -> Tuple[Dict[int, TagNames], List[int]]:
+        """캐시된 태그명과 캐시에 없는 tag_id 목록"""
+        now = time.monotonic()
+        found: Dict[int, TagNames] = {}
+        missing: List[int] = []
+        with self._lock:
+            for tag_id in tag_ids:
+                entry = self._entries.get(tag_id)
+                if entry is None or entry[0] < now:
+                    if entry is not None:
+                        self._drop(tag_id)
+                    missing.append(tag_id)
+                    continue
+                self._entries.move_to_end(tag_id)
+                found[tag_id] = entry[1]
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(missing)
+        return found, missing
+
+    def get_tag_ids(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """캐시된 (언어, 태그명) 의 tag_id"""
+        with self._lock:
+            return {pair: self._tag_ids[pair] for pair in pairs if pair in self._tag_ids}
+
+    def put_many(self, tag_names: Dict[int, TagNames], generation: int) -> None:
+        """
+        DB 에서 조회한 태그명 저장
+        조회 이후 무효화가 있었다면 이전 값일 수 있으므로 저장하지 않는다.
+        """
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self.generation:
+                return
+            for tag_id, names in tag_names.items():
+                if tag_id in self._entries:
+                    self._drop(tag_id)
+                self._entries[tag_id] = (expires, tuple(names))
+                for pair in names:
+                    self._tag_ids[pair] = tag_id
+            while len(self._entries) > self.size:
+                self._drop(next(iter(self._entries)))
+
+    def discard(self, tag_ids: Iterable[int]) -> None:
+        """현재 프로세스의 캐시에서 삭제"""
+        with self._lock:
+            self.generation += 1
+            for tag_id in tag_ids:
+                if tag_id in self._entries:
+                    self._drop(tag_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._tag_ids.clear()
+
+    def invalidate(self, tag_ids: Iterable[int]) -> None:
+        """현재 프로세스의 캐시에서 삭제하고 다른 워커에 무효화 전달"""
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return
+        self.discard(tag_ids)
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.publish(INVALIDATION_CHANNEL, json.dumps(tag_ids))
+        except RedisError:
+            # 다른 워커는 ttl 이 지난 뒤 다시 조회
+            self.stats["errors"] += 1
+
+    def _on_message(self, message: dict) -> None:
+        self.discard(json.loads(message["data"]))
+
+    def _on_error(self, error: Exception, pubsub, thread) -> None:
+        # 연결이 끊긴 동안의 무효화는 알 수 없으므로 전체 삭제 후 재연결
+        self.stats["errors"] += 1
+        self.clear()
+        time.sleep(1)
+
+    def start_subscriber(
+        self,
+        redis_client: StrictRedis,
+        poll_interval: float = 1.0,
+        publisher: Optional[StrictRedis] = None,
+    ) -> None:
+        """
+        다른 워커의 무효화를 받는 구독 스레드 시작
+        publisher 가 주어지면 무효화 전달에 사용한다. (async 모드의 비동기 클라이언트)
+        """
+        self.redis_client = publisher or redis_client
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_message})
+        self._subscriber = pubsub.run_in_thread(
+            sleep_time=poll_interval, daemon=True, exception_handler=self._on_error
+        )
+
+    def stop_subscriber(self) -> None:
+        if self._subscriber is not None:
+            self._subscriber.stop()
+            self._subscriber.join(timeout=5)
+            self._subscriber = None
+
+
+tag_name_cache = TagNameCache(size=settings.tag_cache_size, ttl=settings.tag_cache_ttl)
@@ -0,0 +1,353 @@
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import chain
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.common.index_sync import CatalogChanges, VersionedIndex
+from app.models import CompanyTag
+from app.models.company import Company
+from app.models.tag import TagName
+
+# 괄호 중첩 최대 깊이 (재귀 하강 파서의 재귀 깊이 제한)
+MAX_QUERY_DEPTH = 32
+# 검색식의 최대 태그 수 (DB 검색 비용 제한)
+MAX_QUERY_TERMS = 32
+
+# 괄호, 따옴표로 묶은 태그명 (\" 로 따옴표 포함), 공백/괄호/따옴표 없는 단어
+TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<paren>[()])
+        | "(?P<quoted>(?:[^"\\]|\\.)*)"
+        | (?P<word>[^\s()"]+)
+    )""",
+    re.VERBOSE,
+)
+KEYWORDS = ("AND", "OR", "NOT")
+
+
+class TagQuerySyntaxError(ValueError):
+    """태그 검색식 문법 오류"""
+
+
+class Term(NamedTuple):
+    name: str
+
+
+class And(NamedTuple):
+    left: "TagQuery"
+    right: "TagQuery"
+
+
+class Or(NamedTuple):
+    left: "TagQuery"
+    right: "TagQuery"
+
+
+class Not(NamedTuple):
+    operand: "TagQuery"
+
+
+TagQuery = Union[Term, And, Or, Not]
+
+
+def _tokenize(expression: str) -> List[tuple]:
+    """(종류, 값) 토큰 목록, 종류는 ( ) AND OR NOT TERM"""
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            raise TagQuerySyntaxError(f"{position} 번째 문자를 해석할 수 없습니다.")
+        position = match.end()
+        if match.group("paren"):
+            tokens.append((match.group("paren"), None))
+        elif match.group("quoted") is not None:
+            tokens.append(("TERM", re.sub(r"\\(.)", r"\1", match.group("quoted"))))
+        elif match.group("word").upper() in KEYWORDS:
+            tokens.append((match.group("word").upper(), None))
+        else:
+            tokens.append(("TERM", match.group("word")))
+    return tokens
+
+
+class _Parser:
+    """
+    재귀 하강 파서
+    우선순위는 NOT > AND > OR 이며, 연산자 없이 나열된 태그는 AND 로 처리한다.
+    """
+
+    def __init__(self, tokens: List[tuple]):
+        self.tokens = tokens
+        self.position = 0
+        self.depth = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self, kind: str) -> tuple:
+        if self.peek() != kind:
+            found = self.peek() or "식의 끝"
+            raise TagQuerySyntaxError(f"{kind} 가 필요한 위치에 {found} 가 있습니다.")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> TagQuery:
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise TagQuerySyntaxError(f"예상하지 못한 {self.peek()} 가 있습니다.")
+        return node
+
+    def parse_or(self) -> TagQuery:
+        node = self.parse_and()
+        while self.peek() == "OR":
+            self.take("OR")
+            node = Or(node, self.parse_and())
+        return node
+
+    def parse_and(self) -> TagQuery:
+        node = self.parse_not()
+        while self.peek() in ("AND", "NOT", "TERM", "("):
+            if self.peek() == "AND":
+                self.take("AND")
+            node = And(node, self.parse_not())
+        return node
+
+    def parse_not(self) -> TagQuery:
+        if self.peek() == "NOT":
+            self.take("NOT")
+            return Not(self.parse_not())
+        return self.parse_atom()
+
+    def parse_atom(self) -> TagQuery:
+        if self.peek() == "(":
+            self.take("(")
+            self.depth += 1
+            if self.depth > MAX_QUERY_DEPTH:
+                raise TagQuerySyntaxError("괄호가 너무 깊게 중첩되어 있습니다.")
+            node = self.parse_or()
+            self.depth -= 1
+            self.take(")")
+            return node
+        return Term(self.take("TERM")[1])
+
+
+def parse_tag_query(expression: str) -> TagQuery:
+    """
+    태그 검색식 해석
+    예) 태그_4 AND (tag_16 OR "タグ_20") AND NOT 태그_1
+    """
+    tokens = _tokenize(expression)
+    if not tokens:
+        raise TagQuerySyntaxError("검색식이 비어 있습니다.")
+    if sum(kind == "TERM" for kind, _ in tokens) > MAX_QUERY_TERMS:
+        raise TagQuerySyntaxError(f"태그는 {MAX_QUERY_TERMS} 개까지 사용할 수 있습니다.")
+    return _Parser(tokens).parse()
+
+
+def tag_query_terms(query: TagQuery) -> Set[str]:
+    """검색식에 사용된 태그명 (중복 제거)"""
+    if isinstance(query, Term):
+        return {query.name}
+    if isinstance(query, Not):
+        return tag_query_terms(query.operand)
+    return tag_query_terms(query.left) | tag_query_terms(query.right)
+
+
+def matches_untagged(query: TagQuery) -> bool:
+    """검색식의 어떤 태그도 없는 회사가 검색식을 만족하는지 (예: NOT a)"""
+    if isinstance(query, Term):
+        return False
+    if isinstance(query, And):
+        return matches_untagged(query.left) and matches_untagged(query.right)
+    if isinstance(query, Or):
+        return matches_untagged(query.left) or matches_untagged(query.right)
+    return not matches_untagged(query.operand)
+
+
+def _to_postings(company_ids: Iterable[int]) -> array:
+    """회사 id 목록을 정렬된 posting list 로 변환 (중복 제거)"""
+    return array("I", sorted(set(company_ids)))
+
+
+def _intersect(left: array, right: array) -> array:
+    """두 posting list 의 교집합 (짧은 쪽의 id 를 긴 쪽에서 이분 탐색)"""
+    if len(left) > len(right):
+        left, right = right, left
+    result = array("I")
+    position, size = 0, len(right)
+    for company_id in left:
+        position = bisect_left(right, company_id, position)
+        if position == size:
+            break
+        if right[position] == company_id:
+            result.append(company_id)
+    return result
+
+
+def _union(left: array, right: array) -> array:
+    """두 posting list 의 합집합"""
+    if not left or not right:
+        return array("I", left or right)
+    return _to_postings(chain(left, right))
+
+
+def _difference(left: array, right: array) -> array:
+    """left 에서 right 의 id 를 제외한 posting list"""
+    result = array("I")
+    position, size = 0, len(right)
+    for company_id in left:
+        position = bisect_left(right, company_id, position)
+        if position == size or right[position] != company_id:
+            result.append(company_id)
+    return result
+
+
+def _page(postings: array, after: Optional[int] = None, limit: Optional[int] = None) -> List[int]:
+    """posting list 에서 after 다음 id 부터 limit 개"""
+    start = bisect_right(postings, after) if after is not None else 0
+    end = start + limit if limit is not None else len(postings)
+    return postings[start:end].tolist()
+
+
+def _insert(postings: array, company_id: int) -> None:
+    """정렬 순서를 유지하며 id 추가 (새 회사는 보통 가장 큰 id 이므로 끝에 추가)"""
+    if not postings or postings[-1] < company_id:
+        postings.append(company_id)
+        return
+    position = bisect_left(postings, company_id)
+    if postings[position] != company_id:
+        postings.insert(position, company_id)
+
+
+def _remove(postings: array, company_id: int) -> None:
+    position = bisect_left(postings, company_id)
+    if position < len(postings) and postings[position] == company_id:
+        del postings[position]
+
+
+class TagPostingIndex(VersionedIndex):
+    """
+    태그별 회사 id posting list 역색인
+    posting list 는 정렬된 array('I') 로 저장하여 AND/OR/NOT 을 교집합/합집합/차집합으로 처리한다.
+    앱 시작 시 company_tag 테이블로부터 생성되고, 회사/태그 변경 시 갱신된다.
+    다른 워커의 변경은 catalog_version 이 달라지면 변경된 회사의 태그를 다시 조회하여 반영한다.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self._lock = threading.Lock()
+        # 태그 id -> 회사 id posting list
+        self._postings: Dict[int, array] = {}
+        # 태그명 (모든 언어) -> 태그 id 목록
+        self._tag_ids: Dict[str, Set[int]] = {}
+        # 전체 회사 id posting list (NOT 연산용)
+        self._universe = array("I")
+        self._init_version()
+
+    def build(self, db: Session) -> None:
+        """company, company_tag, tag_name 테이블 전체로 색인 생성"""
+        company_ids = db.execute(select(Company.id)).scalars().all()
+
+        tag_companies: Dict[int, List[int]] = defaultdict(list)
+        queryset = select(CompanyTag.tag_id, CompanyTag.company_id)
+        for tag_id, company_id in db.execute(queryset).yield_per(1000):
+            tag_companies[tag_id].append(company_id)
+
+        tag_ids: Dict[str, Set[int]] = defaultdict(set)
+        for tag_id, name in db.execute(select(TagName.tag_id, TagName.name)).yield_per(1000):
+            tag_ids[name].add(tag_id)
+
+        postings = {tag_id: _to_postings(ids) for tag_id, ids in tag_companies.items()}
+        with self._lock:
+            self._postings = postings
+            self._tag_ids = dict(tag_ids)
+            self._universe = _to_postings(company_ids)
+            self.ready = True
+
+    def apply(self, db: Session, changes: CatalogChanges) -> None:
+        """삭제된 연결을 제거한 뒤 변경된 회사의 현재 태그와 태그명 색인"""
+        company_tags: Dict[int, List[int]] = defaultdict(list)
+        queryset = select(CompanyTag.company_id, CompanyTag.tag_id).filter(
+            CompanyTag.company_id.in_(changes.company_ids)
+        )
+        for company_id, tag_id in db.execute(queryset):
+            company_tags[company_id].append(tag_id)
+
+        tag_ids = {tag_id for ids in company_tags.values() for tag_id in ids}
+        queryset = select(TagName.tag_id, TagName.name).filter(TagName.tag_id.in_(tag_ids))
+        tag_names = db.execute(queryset).all() if tag_ids else []
+
+        with self._lock:
+            # 삭제 후 다시 연결된 태그는 아래에서 다시 추가됨
+            for company_id, tag_id in changes.removed_tags:
+                if tag_id in self._postings:
+                    _remove(self._postings[tag_id], company_id)
+            for tag_id, name in tag_names:
+                self._tag_ids.setdefault(name, set()).add(tag_id)
+            for company_id in changes.company_ids:
+                self._add_company(company_id, company_tags.get(company_id, ()))
+
+    def add_tag_names(self, tag_id: int, names: Iterable[str]) -> None:
+        """태그명 색인"""
+        with self._lock:
+            for name in names:
+                self._tag_ids.setdefault(name, set()).add(tag_id)
+
+    def add_company(self, company_id: int, tag_ids: Iterable[int] = ()) -> None:
+        """회사와 연결된 태그 색인"""
+        with self._lock:
+            self._add_company(company_id, tag_ids)
+
+    def _add_company(self, company_id: int, tag_ids: Iterable[int]) -> None:
+        _insert(self._universe, company_id)
+        for tag_id in tag_ids:
+            _insert(self._postings.setdefault(tag_id, array("I")), company_id)
+
+    def remove_company_tag(self, company_id: int, tag_id: int) -> None:
+        """회사와 태그 연결 삭제"""
+        with self._lock:
+            if tag_id in self._postings:
+                _remove(self._postings[tag_id], company_id)
+
+    def _evaluate(self, node: TagQuery) -> array:
+        if isinstance(node, Term):
+            postings = None
+            for tag_id in self._tag_ids.get(node.name, ()):
+                if tag_id in self._postings:
+                    tag_postings = self._postings[tag_id]
+                    postings = tag_postings if postings is None else _union(postings, tag_postings)
+            return postings if postings is not None else array("I")
+        if isinstance(node, And):
+            # a AND NOT b 는 전체 목록을 거치지 않고 차집합으로 처리
+            if isinstance(node.right, Not):
+                return _difference(self._evaluate(node.left), self._evaluate(node.right.operand))
+            if isinstance(node.left, Not):
+                return _difference(self._evaluate(node.right), self._evaluate(node.left.operand))
+            return _intersect(self._evaluate(node.left), self._evaluate(node.right))
+        if isinstance(node, Or):
+            return _union(self._evaluate(node.left), self._evaluate(node.right))
+        return _difference(self._universe, self._evaluate(node.operand))
+
+    def search(
+        self, query: TagQuery, after: Optional[int] = None, limit: Optional[int] = None
+    ) -> Optional[List[int]]:
+        """
+        검색식을 만족하는 회사 id 목록 (id 순, after 다음부터 limit 개)
+        색인이 생성되지 않은 경우 None 을 반환한다.
+        """
+        if not self.ready:
+            return None
+        with self._lock:
+            # 단일 태그의 결과는 색인의 posting list 자체이므로 lock 안에서 복사
+            return _page(self._evaluate(query), after, limit)
+
+
+tag_index = TagPostingIndex()
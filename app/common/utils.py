@@ -1,3 +1,37 @@
-from app.config.settings import Settings
+from typing import Any, AsyncContextManager, Callable, Optional
 
-settings = Settings()
+from sqlalchemy.ext.asyncio import async_session
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.common.routing import is_primary_pinned, pin_primary
+
+
+async def run_db(db: Optional[Session], func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    DB 를 사용하는 (동기) 서비스 메서드 실행
+    - db 가 AsyncSession 의 세션 (DATABASE_ASYNC 모드): AsyncSession.run_sync 로 greenlet 에서 실행되어
+      쿼리 대기 중 이벤트 루프를 양보
+    - 그 외 (동기 세션, 함수 안에서 세션 생성): 스레드풀에서 실행되어 이벤트 루프를 막지 않음
+    """
+    proxy = async_session(db) if db is not None else None
+    if proxy is not None:
+        return await proxy.run_sync(lambda _: func(*args, **kwargs))
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+async def run_in_new_session(
+    open_db: Callable[[], AsyncContextManager[Session]],
+    service: Any,
+    method: Callable[..., Any],
+    *args,
+) -> Any:
+    """
+    요청 세션과 별도의 세션으로 service 의 method 실행 (single flight 계산용)
+    먼저 시작한 요청이 취소되어 요청 세션이 닫혀도 계산은 자신의 세션으로 계속 진행한다.
+    """
+    pinned = is_primary_pinned(service.db)
+    async with open_db() as db:
+        if pinned:
+            pin_primary(db)
+        return await run_db(db, method, service.with_db(db), *args)
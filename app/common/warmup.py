@@ -0,0 +1,227 @@
+import logging
+import time
+from typing import Awaitable, Callable, Dict
+
+from fastapi import HTTPException
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.common.database import (
+    AsyncRedisPool,
+    AsyncSessionLocal,
+    RedisPool,
+    SessionLocal,
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from app.common.index_sync import IndexRefresher
+from app.common.search_index import company_name_index
+from app.common.tag_cache import tag_name_cache
+from app.common.tag_index import tag_index
+from app.common.utils import run_db
+from app.config.settings import Settings
+from app.models.company import CompanyName
+from app.models.partitions import ensure_language_partitions
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+settings = Settings()
+logger = logging.getLogger("app.warmup")
+
+
+class WarmupState:
+    """워커 프로세스의 warmup 진행 상태 (ready 이후에 readiness 를 보고)"""
+
+    def __init__(self):
+        self.ready = False
+        # 단계별 소요 시간(ms)
+        self.timings: Dict[str, float] = {}
+        # 실패한 단계의 오류 (실패해도 요청은 처리할 수 있으므로 warmup 은 계속 진행)
+        self.errors: Dict[str, str] = {}
+
+    def reset(self) -> None:
+        self.ready = False
+        self.timings.clear()
+        self.errors.clear()
+
+
+warmup_state = WarmupState()
+
+# 사용 설정한 검색 색인을 catalog_version 기준으로 갱신
+index_refresher = IndexRefresher(
+    [
+        index
+        for index, enabled in (
+            (company_name_index, settings.search_index_enabled),
+            (tag_index, settings.tag_index_enabled),
+        )
+        if enabled
+    ],
+    interval=settings.index_refresh_interval,
+)
+
+
+def _open_db_pool(count: int) -> None:
+    """
+    primary / replica 별로 커넥션을 동시에 count 개 열어 풀에 반환
+    (pool_size 를 넘는 커넥션은 반환 시 닫히므로 제외)
+    """
+    for db_engine in [engine, *replica_engines]:
+        connections = []
+        try:
+            for _ in range(min(count, settings.database_pool_size)):
+                connection = db_engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+
+
+async def _open_async_db_pool(count: int) -> None:
+    for db_engine in [async_engine, *async_replica_engines]:
+        connections = []
+        try:
+            for _ in range(min(count, settings.database_pool_size)):
+                connection = await db_engine.connect()
+                connections.append(connection)
+                await connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                await connection.close()
+
+
+def _open_redis_pool(count: int) -> None:
+    connections = []
+    try:
+        for _ in range(min(count, settings.redis_max_connections)):
+            connection = RedisPool.get_connection("PING")
+            connections.append(connection)
+            connection.send_command("PING")
+            connection.read_response()
+    finally:
+        for connection in connections:
+            RedisPool.release(connection)
+
+
+async def _open_async_redis_pool(count: int) -> None:
+    connections = []
+    try:
+        for _ in range(min(count, settings.redis_max_connections)):
+            connection = await AsyncRedisPool.get_connection("PING")
+            connections.append(connection)
+            await connection.send_command("PING")
+            await connection.read_response()
+    finally:
+        for connection in connections:
+            await AsyncRedisPool.release(connection)
+
+
+def _build_indexes() -> None:
+    index_refresher.refresh()
+
+
+def _run_hot_paths(db: Session) -> None:
+    """
+    요청에서 사용하는 조회 경로를 언어별로 한 번씩 실행
+    SQLAlchemy 의 컴파일 캐시 (asyncpg 는 prepared statement 포함) 를 미리 채우고
+    태그명 캐시 사용 시 자주 사용되는 태그명을 미리 저장한다.
+    """
+    service = CompanyService(
+        CompanyRepository(db),
+        TagRepository(db),
+        tag_cache=tag_name_cache if settings.tag_cache_enabled else None,
+    )
+    name = db.execute(select(CompanyName.name).limit(1)).scalar() or ""
+    tag = db.execute(select(TagName.name).limit(1)).scalar() or ""
+
+    # ETag 확인
+    service.get_company_version(name)
+    service.get_catalog_version()
+
+    # 조회 결과가 많지 않도록 전체 회사명으로 검색하고 태그 검색은 limit 지정
+    for language in settings.LANGUAGE_CHOICES:
+        calls = [
+            (service.get_company_by_name, (name, language)),
+            (service.search_companies_by_name, (name, language)),
+            (service.search_companies_by_name, (name, language, settings.MAX_SEARCH_LIMIT)),
+            (service.search_companies_by_tag_page, (tag, language, 1)),
+        ]
+        for func, args in calls:
+            try:
+                func(*args)
+            except HTTPException:
+                # 회사가 없는 경우 (404)
+                pass
+
+    service.preload_tag_names(settings.tag_cache_size)
+
+
+async def _precompile_statements() -> None:
+    if async_engine is not None:
+        async with AsyncSessionLocal() as session:
+            await run_db(session.sync_session, _run_hot_paths, session.sync_session)
+    else:
+        with SessionLocal() as db:
+            await run_db(db, _run_hot_paths, db)
+
+
+async def _step(state: WarmupState, name: str, func: Callable[[], Awaitable[None]]) -> None:
+    started = time.perf_counter()
+    try:
+        await func()
+    except Exception as e:
+        logger.exception("warmup %s 실패", name)
+        state.errors[name] = str(e)
+    state.timings[name] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info("warmup %s %.2fms", name, state.timings[name])
+
+
+async def warm_up(state: WarmupState = warmup_state) -> WarmupState:
+    """
+    워커 시작 시 첫 요청의 지연을 줄이기 위한 준비 작업
+    - LANGUAGE_CHOICES 에 추가된 언어의 회사명/태그명 파티션 생성 (LANGUAGE_PARTITIONS_AUTO_CREATE)
+    - DB / Redis 커넥션 풀을 최소 크기만큼 미리 연결
+    - 회사명 / 태그 검색 색인 생성 (WARMUP_ENABLED 와 관계 없이 사용 설정 시 항상 생성)
+    - 조회 경로 SQL 컴파일, 태그명 캐시 적재
+    """
+    started = time.perf_counter()
+    if settings.language_partitions_auto_create:
+        await _step(
+            state, "partitions", lambda: run_in_threadpool(ensure_language_partitions, engine)
+        )
+
+    if settings.warmup_enabled:
+        db_connections = settings.warmup_db_connections
+        if async_engine is not None:
+            await _step(state, "db_pool", lambda: _open_async_db_pool(db_connections))
+        else:
+            await _step(state, "db_pool", lambda: run_in_threadpool(_open_db_pool, db_connections))
+
+        # Redis 를 사용하지 않는 설정에서는 연결하지 않음
+        if settings.cache_enabled or settings.tag_cache_enabled:
+            redis_connections = settings.warmup_redis_connections
+            if settings.database_async:
+                await _step(state, "redis_pool", lambda: _open_async_redis_pool(redis_connections))
+            else:
+                await _step(
+                    state,
+                    "redis_pool",
+                    lambda: run_in_threadpool(_open_redis_pool, redis_connections),
+                )
+
+    if settings.search_index_enabled or settings.tag_index_enabled:
+        await _step(state, "indexes", lambda: run_in_threadpool(_build_indexes))
+
+    if settings.warmup_enabled:
+        await _step(state, "statements", _precompile_statements)
+
+    state.timings["total"] = round((time.perf_counter() - started) * 1000, 2)
+    state.ready = True
+    logger.info("warmup 완료 %.2fms %s", state.timings["total"], state.timings)
+    return state
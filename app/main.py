@@ -1,12 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
+from app.common.database import (
+    AsyncRedisClient,
+    AsyncRedisPool,
+    RedisClient,
+    RedisPool,
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from app.common.instrumentation import SQLInstrumentationMiddleware, instrument
+from app.common.responses import DefaultResponse
+from app.common.tag_cache import tag_name_cache
+from app.common.warmup import index_refresher, warm_up, warmup_state
 from app.config.settings import Settings
 from app.routers import company, index
 
 settings = Settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 다른 워커의 태그명 캐시 무효화 구독 (warmup 중 적재한 태그명도 무효화 대상)
+    if settings.tag_cache_enabled:
+        # 구독 스레드는 동기 클라이언트, 무효화 전달은 service 와 같은 클라이언트를 사용
+        publisher = AsyncRedisClient if settings.database_async else None
+        tag_name_cache.start_subscriber(RedisClient, publisher=publisher)
+
+    # 커넥션 풀, 검색 색인, 조회 SQL 준비
+    # 백그라운드 실행 시 완료 전까지 /api/health/ready 는 503 을 반환
+    warmup_state.reset()
+    warmup_task = None
+    if settings.warmup_background:
+        warmup_task = asyncio.create_task(warm_up(warmup_state))
+    else:
+        await warm_up(warmup_state)
+    # 다른 워커의 변경, 적재 스크립트로 추가된 데이터를 검색 색인에 반영
+    index_refresher.start()
+    yield
+
+    index_refresher.stop()
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    tag_name_cache.stop_subscriber()
+
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+    RedisPool.disconnect()
+    await AsyncRedisPool.disconnect()
+
+
 # FastAPI 앱 생성
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=DefaultResponse)
+
+# 요청 단위 SQL 실행 횟수/시간 기록 (Server-Timing header, 로그)
+if settings.sql_instrumentation_enabled:
+    for db_engine in [engine, *replica_engines]:
+        instrument(db_engine)
+    for db_engine in filter(None, [async_engine, *async_replica_engines]):
+        instrument(db_engine.sync_engine)
+    app.add_middleware(SQLInstrumentationMiddleware)
 
 
 app.include_router(index.router, prefix="/api")
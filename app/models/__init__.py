@@ -1,6 +1,18 @@
 from app.models.base import Base, BaseModel
 from app.models.campany_tag import CompanyTag
-from app.models.company import Company, CompanyName
+from app.models.company import CatalogChange, CatalogVersion, Company, CompanyName
+from app.models.company_view import CompanyView
 from app.models.tag import Tag, TagName
 
-__all__ = ["Base", "BaseModel", "Company", "CompanyName", "Tag", "TagName", "CompanyTag"]
+__all__ = [
+    "Base",
+    "BaseModel",
+    "CatalogChange",
+    "CatalogVersion",
+    "Company",
+    "CompanyName",
+    "CompanyView",
+    "Tag",
+    "TagName",
+    "CompanyTag",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, ForeignKey
+from sqlalchemy import BigInteger, Column, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -12,3 +12,9 @@ class CompanyTag(BaseModel):
 
     company = relationship("Company", back_populates="company_tags")
     tag = relationship("Tag", back_populates="company_tags")
+
+    # 기본키는 id 가 앞이라 회사/태그별 조회에 사용할 수 없으므로 양방향 covering 인덱스
+    __table_args__ = (
+        Index("ix_company_tag_company_id", "company_id", postgresql_include=["tag_id"]),
+        Index("ix_company_tag_tag_id", "tag_id", postgresql_include=["company_id"]),
+    )
@@ -1,9 +1,11 @@
-from sqlalchemy import BigInteger, Column, Enum, ForeignKey, String
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Index, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import UniqueConstraint
 
 from app.config.settings import Settings
-from app.models.base import BaseModel
+from app.models.base import Base, BaseModel
+from app.models.partitions import PARTITION_BY, listen_partitioned
 
 settings = Settings()
 
@@ -11,7 +13,10 @@ settings = Settings()
 class Company(BaseModel):
     __tablename__ = "company"
 
-    company_names = relationship("CompanyName", back_populates="company")
+    # 회사 상세 응답의 버전, 회사명/태그 변경 시 같은 트랜잭션에서 증가
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
+
+    company_names = relationship("CompanyName", back_populates="company", order_by="CompanyName.id")
     company_tags = relationship("CompanyTag", back_populates="company")
 
 
@@ -20,10 +25,48 @@ class CompanyName(BaseModel):
 
     company_id = Column(BigInteger, ForeignKey("company.id"), nullable=False)
     language_code = Column(
-        Enum(*settings.LANGUAGE_CHOICES.keys(), name="language_code_enum"), nullable=False
+        Enum(*settings.LANGUAGE_CHOICES.keys(), name="language_code_enum"),
+        primary_key=True,
+        nullable=False,
     )
     name = Column(String(settings.MAX_TEXT_FIELD), nullable=False)
 
     company = relationship("Company", back_populates="company_names")
 
-    __table_args__ = (UniqueConstraint("company_id", "language_code", name="unique_company_lang"),)
+    # language_code 별 LIST 파티션 (기본키/unique 제약은 파티션 키를 포함해야 함)
+    __table_args__ = (
+        UniqueConstraint("company_id", "language_code", name="unique_company_lang"),
+        # 언어 조건 없는 회사명 조회 (get_by_name, ETag 버전 확인) 를 인덱스만으로 처리
+        Index("ix_company_name_name", "name", postgresql_include=["company_id", "language_code"]),
+        {"postgresql_partition_by": PARTITION_BY},
+    )
+
+
+listen_partitioned(CompanyName.__table__)
+
+
+class CatalogVersion(Base):
+    """
+    회사 목록 응답 (검색/태그 검색) 의 버전 (id = 1 한 행), 회사/태그 변경이 commit 된 뒤 증가
+    sequence 는 replica 에 정확한 값이 복제되지 않으므로 테이블에 저장한다.
+    """
+
+    __tablename__ = "catalog_version"
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False)
+
+
+class CatalogChange(Base):
+    """
+    catalog_version 별 변경된 회사 (다른 워커의 검색 색인이 변경분만 반영하기 위해 사용)
+    변경 내역 없이 증가한 버전 (적재 스크립트) 이 있으면 색인을 다시 생성한다.
+    """
+
+    __tablename__ = "catalog_change"
+
+    version = Column(BigInteger, primary_key=True, autoincrement=False)
+    # 회사명/태그가 추가되거나 태그 연결이 삭제된 회사
+    company_ids = Column(ARRAY(BigInteger), nullable=False)
+    # company_ids 의 회사에서 연결이 삭제된 태그
+    removed_tag_ids = Column(ARRAY(BigInteger), nullable=False, server_default="{}")
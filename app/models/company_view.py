@@ -0,0 +1,41 @@
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.config.settings import Settings
+from app.models.base import Base
+from app.models.partitions import company_view_index_name
+
+settings = Settings()
+
+
+class CompanyView(Base):
+    """
+    회사 x 언어별 조회용 모델 (CompanyResponse 미리 계산)
+    회사/태그 변경 시 CompanyService 에서 함께 갱신된다.
+    """
+
+    __tablename__ = "company_view"
+
+    company_id = Column(BigInteger, ForeignKey("company.id"), primary_key=True)
+    language_code = Column(
+        Enum(*settings.LANGUAGE_CHOICES.keys(), name="language_code_enum"), primary_key=True
+    )
+    # 요청 언어의 회사명, 없으면 가장 먼저 저장된 회사명
+    company_name = Column(String(settings.MAX_TEXT_FIELD), nullable=False)
+    # 요청 언어의 태그명 (정렬)
+    tags = Column(ARRAY(String(settings.MAX_TEXT_FIELD)), nullable=False)
+    # 조회 조건: 모든 언어의 회사명 / 태그명
+    all_names = Column(ARRAY(String(settings.MAX_TEXT_FIELD)), nullable=False)
+    all_tag_names = Column(ARRAY(String(settings.MAX_TEXT_FIELD)), nullable=False)
+
+    # 언어별 partial GIN 인덱스: language_code = :language AND all_names @> ARRAY[:name]
+    __table_args__ = tuple(
+        Index(
+            company_view_index_name(column, language_code),
+            column,
+            postgresql_using="gin",
+            postgresql_where=text(f"language_code = '{language_code}'"),
+        )
+        for column in ("all_names", "all_tag_names")
+        for language_code in settings.LANGUAGE_CHOICES
+    )
@@ -0,0 +1,151 @@
+"""
+company_name / tag_name 의 language_code LIST 파티션 관리
+
+언어별 파티션 (예: company_name_ko) 은 Settings.LANGUAGE_CHOICES 의 언어마다 하나씩 만든다.
+LANGUAGE_CHOICES 에 언어를 추가하면 배포 시 app/scripts/create_language_partitions.py 로
+language_code_enum 값과 파티션, 파티션의 pg_trgm 인덱스, company_view 의 언어별 인덱스를 추가한다.
+(LANGUAGE_PARTITIONS_AUTO_CREATE 설정 시 앱 시작 시에도 실행, DDL 권한 필요)
+"""
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import Table
+
+from app.config.settings import Settings
+
+settings = Settings()
+
+PARTITIONED_TABLES = ("company_name", "tag_name")
+PARTITION_BY = "LIST (language_code)"
+
+LANGUAGE_CODE = re.compile(r"^[a-z]{2,8}$")
+
+
+def partition_name(table: str, language_code: str) -> str:
+    return f"{table}_{language_code}"
+
+
+def trgm_index_name(table: str, language_code: str) -> str:
+    """언어별 pg_trgm 인덱스 (파티션 이전의 partial 인덱스와 같은 이름)"""
+    return f"ix_{table}_name_trgm_{language_code}"
+
+
+def company_view_index_name(column: str, language_code: str) -> str:
+    """company_view 의 언어별 partial GIN 인덱스 (CompanyView.__table_args__ 와 같은 이름)"""
+    return f"ix_company_view_{column}_{language_code}"
+
+
+def _language_codes(language_codes: Optional[Iterable[str]]) -> List[str]:
+    codes = list(language_codes if language_codes is not None else settings.LANGUAGE_CHOICES)
+    for code in codes:
+        # DDL 에 그대로 사용하므로 형식 확인
+        if not LANGUAGE_CODE.match(code):
+            raise ValueError(f"잘못된 언어코드 입니다. {code!r}")
+    return codes
+
+
+def add_language_codes(connection: Connection, language_codes: Iterable[str]) -> List[str]:
+    """
+    language_code_enum 에 없는 언어코드 추가
+    추가한 값은 commit 이후에 사용할 수 있으므로 autocommit 커넥션에서 실행한다.
+    """
+    existing = set(
+        connection.execute(text("SELECT unnest(enum_range(NULL::language_code_enum))::text"))
+        .scalars()
+        .all()
+    )
+    added = [code for code in language_codes if code not in existing]
+    for code in added:
+        connection.execute(text(f"ALTER TYPE language_code_enum ADD VALUE IF NOT EXISTS '{code}'"))
+    return added
+
+
+def create_language_partitions(
+    connection: Connection, table: str, language_codes: Iterable[str]
+) -> List[str]:
+    """
+    없는 언어 파티션 생성 후 생성한 파티션 이름 반환 (pg_trgm 이 있으면 파티션 인덱스 포함)
+    마이그레이션 전이라 파티션 테이블이 아니면 아무것도 하지 않는다.
+    """
+    partitioned = connection.execute(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = CAST(:table AS regclass)"),
+        {"table": table},
+    ).scalar()
+    if not partitioned:
+        return []
+
+    existing = set(
+        connection.execute(
+            text(
+                # search_path 의 테이블 기준 (schema 가 다른 같은 이름의 테이블 제외)
+                "SELECT pg_class.relname FROM pg_inherits "
+                "JOIN pg_class ON pg_class.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": table},
+        )
+        .scalars()
+        .all()
+    )
+    trgm = connection.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).scalar()
+
+    created = []
+    for code in language_codes:
+        partition = partition_name(table, code)
+        if partition in existing:
+            continue
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition} "
+                f"PARTITION OF {table} FOR VALUES IN ('{code}')"
+            )
+        )
+        if trgm:
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {trgm_index_name(table, code)} "
+                    f"ON {partition} USING gin (name gin_trgm_ops)"
+                )
+            )
+        created.append(partition)
+    return created
+
+
+def ensure_language_partitions(
+    engine: Engine, language_codes: Optional[Iterable[str]] = None
+) -> List[str]:
+    """LANGUAGE_CHOICES (또는 language_codes) 의 enum 값과 파티션이 없으면 생성"""
+    codes = _language_codes(language_codes)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        add_language_codes(connection, codes)
+    created = []
+    with engine.begin() as connection:
+        for table in PARTITIONED_TABLES:
+            created += create_language_partitions(connection, table, codes)
+        create_company_view_indexes(connection, codes)
+    return created
+
+
+def create_company_view_indexes(connection: Connection, language_codes: Iterable[str]) -> None:
+    """company_view 의 언어별 partial GIN 인덱스가 없으면 생성 (company_view 가 없으면 생략)"""
+    if not connection.execute(text("SELECT to_regclass('company_view')")).scalar():
+        return
+    for code in language_codes:
+        for column in ("all_names", "all_tag_names"):
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {company_view_index_name(column, code)} "
+                    f"ON company_view USING gin ({column}) WHERE language_code = '{code}'"
+                )
+            )
+
+
+def _create_partitions_after_create(target: Table, connection: Connection, **kw) -> None:
+    # metadata.create_all 로 만든 테이블은 현재 언어의 파티션을 바로 생성 (enum 도 같은 언어로 생성됨)
+    create_language_partitions(connection, target.name, _language_codes(None))
+
+
+def listen_partitioned(table: Table) -> None:
+    event.listen(table, "after_create", _create_partitions_after_create)
@@ -1,9 +1,10 @@
-from sqlalchemy import BigInteger, Column, Enum, ForeignKey, String
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import UniqueConstraint
 
 from app.config.settings import Settings
 from app.models.base import BaseModel
+from app.models.partitions import PARTITION_BY, listen_partitioned
 
 settings = Settings()
 
@@ -11,7 +12,7 @@ settings = Settings()
 class Tag(BaseModel):
     __tablename__ = "tag"
 
-    tag_names = relationship("TagName", back_populates="tag")
+    tag_names = relationship("TagName", back_populates="tag", order_by="TagName.id")
     company_tags = relationship("CompanyTag", back_populates="tag")
 
 
@@ -20,12 +21,23 @@ class TagName(BaseModel):
 
     tag_id = Column(BigInteger, ForeignKey("tag.id"), nullable=False)
     language_code = Column(
-        Enum(*settings.LANGUAGE_CHOICES.keys(), name="language_code_enum"), nullable=False
+        Enum(*settings.LANGUAGE_CHOICES.keys(), name="language_code_enum"),
+        primary_key=True,
+        nullable=False,
     )
     name = Column(String(settings.MAX_TEXT_FIELD), nullable=False)
 
     tag = relationship("Tag", back_populates="tag_names")
 
+    # language_code 별 LIST 파티션 (기본키/unique 제약은 파티션 키를 포함해야 함)
     __table_args__ = (
-        UniqueConstraint("tag_id", "language_code", "name", name="unique_tag_lang_name"),
+        UniqueConstraint("language_code", "name", name="unique_tag_name_lang_name"),
+        # 언어 조건 없는 태그명 조회 (unique 제약은 language_code 가 앞이라 사용할 수 없음)
+        Index("ix_tag_name_name", "name", "language_code", postgresql_include=["tag_id"]),
+        # 태그별 태그명 조회 (joinedload(Tag.tag_names))
+        Index("ix_tag_name_tag_id", "tag_id"),
+        {"postgresql_partition_by": PARTITION_BY},
     )
+
+
+listen_partitioned(TagName.__table__)
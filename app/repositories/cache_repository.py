@@ -1,11 +1,34 @@
-from typing import Any
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from redis import RedisError, StrictRedis, WatchError
 
 from app.common.database import RedisClient
 
+# get_or_compute 의 만료 시각/계산 시간 ("{expires} {delta}") 과 재계산 lease 키 prefix
+META_PREFIX = "meta:"
+LEASE_PREFIX = "lease:"
+
+# lease 를 얻은 워커의 결과를 기다릴 때 조회 간격(초)
+LEASE_POLL_INTERVAL = 0.02
+
 
 class CacheRepository:
-    def __init__(self):
-        self._redis_client = RedisClient
+    # 프로세스 단위 캐시 적중/실패 통계
+    stats: Counter = Counter()
+
+    def __init__(
+        self,
+        redis_client: Optional[StrictRedis] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._redis_client = redis_client or RedisClient
+        # lease 를 얻은 워커의 결과를 기다릴 때 사용
+        self._sleep = sleep
 
     def clean(self) -> None:
         self._redis_client.flushall()
@@ -15,3 +38,239 @@ class CacheRepository:
 
     def set_data_by_key(self, key: str, data: Any, timeout: int = 10) -> None:
         self._redis_client.set(key, data, ex=timeout)
+
+    def get_cached(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+        Redis 장애 시에는 캐시 실패로 처리한다.
+        """
+        try:
+            data = self._redis_client.get(key)
+        except RedisError:
+            self.stats["errors"] += 1
+            return None
+
+        self.stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    def set_cached(self, key: str, data: str, timeout: int) -> None:
+        """캐시 저장"""
+        try:
+            self._redis_client.set(key, data, ex=timeout)
+        except RedisError:
+            self.stats["errors"] += 1
+
+    def get_generation(self, key: str) -> Optional[int]:
+        """
+        무효화 세대 조회 (없으면 0)
+        Redis 장애 시에는 None 을 반환한다.
+        """
+        try:
+            return int(self._redis_client.get(key) or 0)
+        except RedisError:
+            self.stats["errors"] += 1
+            return None
+
+    def bump_generations(self, keys: Iterable[str]) -> None:
+        """무효화 세대 증가 (이전 세대의 캐시 키는 각자의 TTL 로 만료)"""
+        keys = list(keys)
+        if not keys:
+            return
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.incr(key)
+            pipeline.execute()
+        except RedisError:
+            self.stats["errors"] += 1
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], str],
+        timeout: int,
+        stale_ttl: int = 0,
+        lease_timeout: float = 5.0,
+        wait: float = 0.0,
+        beta: float = 1.0,
+    ) -> str:
+        """
+        캐시 조회 후 없거나 만료되었으면 compute 결과 저장 (cache stampede 방지)
+        - 만료된 값은 stale_ttl 초 동안 남겨두고, lease 를 얻은 한 워커만 다시 계산한다.
+          lease 를 얻지 못한 요청은 이전 값을 반환한다.
+        - 값이 없으면 lease 를 얻은 워커의 결과를 최대 wait 초 동안 기다린다.
+        - 만료 전이라도 계산 시간에 비례한 확률로 미리 갱신한다. (XFetch, beta=0 이면 사용 안 함)
+        Redis 장애 시에는 compute 결과를 그대로 반환한다.
+        """
+        try:
+            data, meta = self._get_with_meta(key)
+        except RedisError:
+            self.stats["errors"] += 1
+            return compute()
+
+        lease_key = f"{LEASE_PREFIX}{key}"
+        if data is not None:
+            expires, delta = self._parse_meta(meta)
+            now = time.time()
+            expired = now >= expires
+            if not expired and not self._refresh_early(now, expires, delta, beta):
+                self.stats["hits"] += 1
+                return data
+
+            token = self._acquire_lease(lease_key, lease_timeout)
+            if token is None:
+                # 다른 워커가 갱신 중이면 이전 값 반환 (만료 후 최대 stale_ttl 초)
+                self.stats["stale" if expired else "hits"] += 1
+                return data
+            self.stats["refreshes"] += 1
+        else:
+            self.stats["misses"] += 1
+            token = self._acquire_lease(lease_key, lease_timeout)
+            if token is None:
+                data = self._wait_for(key, wait)
+                if data is not None:
+                    self.stats["coalesced"] += 1
+                    return data
+
+        try:
+            return self._compute_and_store(key, compute, timeout, stale_ttl)
+        finally:
+            if token:
+                self._release_lease(lease_key, token)
+
+    def _get_with_meta(self, key: str) -> Tuple[Optional[str], Optional[str]]:
+        pipeline = self._redis_client.pipeline(transaction=False)
+        pipeline.get(key)
+        pipeline.get(f"{META_PREFIX}{key}")
+        data, meta = pipeline.execute()
+        return data, meta
+
+    @staticmethod
+    def _parse_meta(meta: Optional[str]) -> Tuple[float, float]:
+        """(만료 시각, 계산 시간), 만료 정보가 없는 값은 만료된 것으로 취급"""
+        if not meta:
+            return 0.0, 0.0
+        expires, delta = meta.split()
+        return float(expires), float(delta)
+
+    @staticmethod
+    def _refresh_early(now: float, expires: float, delta: float, beta: float) -> bool:
+        """XFetch: 만료가 가까울수록, 계산이 오래 걸릴수록 높은 확률로 미리 갱신"""
+        if beta <= 0 or delta <= 0:
+            return False
+        return now - delta * beta * math.log(1.0 - random.random()) >= expires
+
+    def _acquire_lease(self, lease_key: str, lease_timeout: float) -> Optional[str]:
+        """재계산 lease 획득 (실패 시 None, Redis 장애 시 lease 없이 계산하도록 빈 문자열)"""
+        token = uuid.uuid4().hex
+        try:
+            acquired = self._redis_client.set(
+                lease_key, token, nx=True, px=max(int(lease_timeout * 1000), 1)
+            )
+        except RedisError:
+            self.stats["errors"] += 1
+            return ""
+        return token if acquired else None
+
+    def _release_lease(self, lease_key: str, token: str) -> None:
+        """자신이 얻은 lease 만 삭제 (lease 가 만료되어 다른 워커가 얻은 경우 유지)"""
+        try:
+            with self._redis_client.pipeline() as pipeline:
+                pipeline.watch(lease_key)
+                if pipeline.get(lease_key) == token:
+                    pipeline.multi()
+                    pipeline.delete(lease_key)
+                    pipeline.execute()
+        except WatchError:
+            pass
+        except RedisError:
+            self.stats["errors"] += 1
+
+    def _wait_for(self, key: str, wait: float) -> Optional[str]:
+        """lease 를 얻은 워커가 저장한 값을 wait 초 동안 기다림"""
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            self._sleep(min(LEASE_POLL_INTERVAL, wait))
+            try:
+                data, meta = self._get_with_meta(key)
+            except RedisError:
+                self.stats["errors"] += 1
+                return None
+            if data is not None:
+                return data
+        return None
+
+    def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], str],
+        timeout: int,
+        stale_ttl: int,
+    ) -> str:
+        started = time.perf_counter()
+        data = compute()
+        delta = time.perf_counter() - started
+
+        # 값은 stale_ttl 만큼 더 보관하고 만료 여부는 meta 의 만료 시각으로 판단
+        meta = f"{time.time() + timeout} {delta}"
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            pipeline.set(key, data, ex=timeout + stale_ttl)
+            pipeline.set(f"{META_PREFIX}{key}", meta, ex=timeout + stale_ttl)
+            pipeline.execute()
+        except RedisError:
+            self.stats["errors"] += 1
+        return data
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 키를 MGET 한 번으로 조회"""
+        if not keys:
+            return []
+        try:
+            values = self._redis_client.mget(keys)
+        except RedisError:
+            self.stats["errors"] += 1
+            return [None] * len(keys)
+
+        hits = sum(value is not None for value in values)
+        self.stats["hits"] += hits
+        self.stats["misses"] += len(values) - hits
+        return values
+
+    def set_many(self, mapping: Mapping[str, str], timeout: int) -> None:
+        """여러 키를 MSET 과 EXPIRE 를 묶은 pipeline 한 번으로 저장"""
+        if not mapping:
+            return
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            pipeline.mset(mapping)
+            for key in mapping:
+                pipeline.expire(key, timeout)
+            pipeline.execute()
+        except RedisError:
+            self.stats["errors"] += 1
+
+    def expire_many(self, keys: Iterable[str], timeout: int) -> None:
+        """여러 키의 만료 시간을 pipeline 한 번으로 갱신"""
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.expire(key, timeout)
+            pipeline.execute()
+        except RedisError:
+            self.stats["errors"] += 1
+
+    def delete_keys(self, keys: Iterable[str]) -> None:
+        """캐시 삭제 (만료 정보 포함, 삭제된 값은 stale 값으로도 사용하지 않음)"""
+        keys = list(keys)
+        if not keys:
+            return
+        try:
+            self._redis_client.delete(*keys, *(f"{META_PREFIX}{key}" for key in keys))
+        except RedisError:
+            self.stats["errors"] += 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        keys = ("hits", "misses", "errors", "stale", "refreshes", "coalesced")
+        return {key: cls.stats[key] for key in keys}
@@ -1,66 +1,302 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array
 from sqlalchemy.orm import Session, joinedload
 
 from app.models import CompanyTag
-from app.models.company import Company, CompanyName
+from app.models.company import CatalogChange, CatalogVersion, Company, CompanyName
+from app.models.company_view import CompanyView
 from app.models.tag import Tag, TagName
 
 
 class CompanyRepository:
+    # pg_trgm 설치 여부 (프로세스 단위로 한 번만 조회)
+    _has_trgm: Optional[bool] = None
+
     def __init__(self, db: Session):
         self.db = db
 
+    def has_trgm(self) -> bool:
+        """pg_trgm extension 설치 여부 (없으면 유사도 검색을 사용할 수 없음)"""
+        if CompanyRepository._has_trgm is None:
+            queryset = text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            CompanyRepository._has_trgm = bool(self.db.execute(queryset).scalar())
+        return CompanyRepository._has_trgm
+
+    def _name_partial_queryset(self, query: str, language: str):
+        """
+        회사명 부분 검색 조건
+        language_code 조건이 언어별 pg_trgm partial 인덱스 조건과 일치하고,
+        name ILIKE '%query%' 는 gin_trgm_ops 인덱스로 처리된다.
+        """
+        return (
+            select(CompanyName)
+            .filter(CompanyName.language_code == language)
+            .filter(CompanyName.name.ilike(f"%{query}%"))
+        )
+
     def search_by_name_partial(self, query: str, language: str = "ko") -> List[CompanyName]:
         """회사명 자동완성을 위한 부분 검색"""
+        queryset = self._name_partial_queryset(query, language).order_by(CompanyName.name)
+        return self.db.execute(queryset).scalars().all()
+
+    def search_by_name_similar(
+        self, query: str, language: str, threshold: float, limit: Optional[int] = None
+    ) -> List[CompanyName]:
+        """pg_trgm 유사도가 threshold 이상인 회사명을 유사도 순으로 검색"""
+        # name % query 연산자가 사용하는 임계값 (현재 트랜잭션에만 적용)
+        self.db.execute(
+            select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+        )
         queryset = (
             select(CompanyName)
             .filter(CompanyName.language_code == language)
+            .filter(CompanyName.name.op("%")(query))
+            .order_by(func.similarity(CompanyName.name, query).desc(), CompanyName.name)
+        )
+        if limit is not None:
+            queryset = queryset.limit(limit)
+        return self.db.execute(queryset).scalars().all()
+
+    def search_by_name_ranked(
+        self, query: str, language: str, limit: int, after: Optional[Sequence] = None
+    ) -> List[Row]:
+        """
+        회사명 자동완성 상위 limit 개 검색 (접두어 일치 우선)
+        (접두어 불일치 여부, 소문자 회사명, 회사명, id) 정렬 키 row 를 반환하며,
+        after 가 주어지면 해당 정렬 키 다음부터 조회한다. (keyset pagination)
+        정렬은 CompanyNameIndex 와 같은 코드 포인트 순서를 사용한다.
+        """
+        keys = (
+            case((CompanyName.name.ilike(f"{query}%"), 0), else_=1).label("bucket"),
+            func.lower(CompanyName.name).collate("C").label("folded"),
+            CompanyName.name.collate("C").label("name"),
+            CompanyName.id,
+        )
+        queryset = (
+            select(*keys)
+            .filter(CompanyName.language_code == language)
             .filter(CompanyName.name.ilike(f"%{query}%"))
+            .order_by(*keys)
+            .limit(limit)
+        )
+        if after is not None:
+            queryset = queryset.filter(tuple_(*keys) > tuple_(*after))
+        return self.db.execute(queryset).all()
+
+    def get_names_by_ids(
+        self, name_ids: List[int], query: str, language: str = "ko"
+    ) -> List[CompanyName]:
+        """색인 후보 id 로 회사명 조회 (search_by_name_partial 과 동일한 조건/정렬)"""
+        queryset = (
+            self._name_partial_queryset(query, language)
+            .filter(CompanyName.id.in_(name_ids))
             .order_by(CompanyName.name)
         )
         return self.db.execute(queryset).scalars().all()
 
-    def get_by_name(self, name: str, language_code: str = None) -> Optional[Company]:
+    @staticmethod
+    def _company_options(with_tag_names: bool):
+        """회사와 함께 조회할 관계 (태그명 캐시를 사용하면 태그명은 조회하지 않음)"""
+        company_tags = joinedload(Company.company_tags)
+        if with_tag_names:
+            company_tags = company_tags.joinedload(CompanyTag.tag).joinedload(Tag.tag_names)
+        return joinedload(Company.company_names), company_tags
+
+    def get_by_name(
+        self, name: str, language_code: str = None, with_tag_names: bool = True
+    ) -> Optional[Company]:
         """회사명으로 회사 검색"""
         queryset = (
             select(Company)
             .join(CompanyName)
             .filter(CompanyName.name == name)
-            .options(
-                joinedload(Company.company_names),
-                joinedload(Company.company_tags)
-                .joinedload(CompanyTag.tag)
-                .joinedload(Tag.tag_names),
-            )
+            .options(*self._company_options(with_tag_names))
         )
         if language_code:
             queryset = queryset.filter(CompanyName.language_code == language_code)
 
         return self.db.execute(queryset).unique().scalar_one_or_none()
 
+    def get_version_by_name(self, name: str) -> Optional[Row]:
+        """회사명으로 (회사 id, 버전) 만 조회 (회사명/태그는 조회하지 않음)"""
+        queryset = (
+            select(Company.id, Company.version)
+            .join(CompanyName)
+            .filter(CompanyName.name == name)
+            .order_by(Company.id)
+            .limit(1)
+        )
+        return self.db.execute(queryset).first()
+
+    def bump_versions(self, company_ids: Iterable[int], tag_ids: Iterable[int] = ()) -> None:
+        """company_ids 의 회사와 tag_ids 가 연결된 회사의 버전 증가 (commit 은 service 에서)"""
+        company_ids, tag_ids = list(company_ids), list(tag_ids)
+        if not company_ids and not tag_ids:
+            return
+        self.db.execute(
+            update(Company)
+            .filter(
+                or_(
+                    Company.id.in_(company_ids),
+                    Company.id.in_(
+                        select(CompanyTag.company_id).filter(CompanyTag.tag_id.in_(tag_ids))
+                    ),
+                )
+            )
+            .values(version=Company.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    def get_catalog_version(self) -> int:
+        """회사 목록 응답의 버전 (한 번도 증가하지 않았으면 0)"""
+        queryset = select(CatalogVersion.version).filter(CatalogVersion.id == 1)
+        return self.db.execute(queryset).scalar() or 0
+
+    def bump_catalog_version(
+        self,
+        company_ids: Optional[Iterable[int]] = None,
+        removed_tag_ids: Iterable[int] = (),
+        retention: int = 1000,
+    ) -> int:
+        """
+        회사 목록 응답의 버전 증가 (행이 없으면 생성, commit 은 service 에서)
+        company_ids 가 주어지면 같은 SQL 에서 변경 내역을 기록하고 retention 개 이전 버전의 내역은 삭제한다.
+        """
+        bumped = (
+            postgresql.insert(CatalogVersion)
+            .values(id=1, version=1)
+            .on_conflict_do_update(
+                index_elements=[CatalogVersion.id],
+                set_={"version": CatalogVersion.version + 1},
+            )
+            .returning(CatalogVersion.version)
+        )
+        if company_ids is None:
+            return self.db.execute(bumped).scalar_one()
+
+        bumped = bumped.cte("bumped")
+        changes = {
+            "company_ids": literal(list(company_ids), ARRAY(BigInteger)),
+            "removed_tag_ids": literal(list(removed_tag_ids), ARRAY(BigInteger)),
+        }
+        recorded = postgresql.insert(CatalogChange).from_select(
+            ["version", *changes], select(bumped.c.version, *changes.values())
+        )
+        # 버전 행을 다시 만든 경우 (DB 초기화) 남아 있던 내역을 덮어씀
+        recorded = recorded.on_conflict_do_update(
+            index_elements=[CatalogChange.version],
+            set_={name: recorded.excluded[name] for name in changes},
+        )
+        pruned = delete(CatalogChange).filter(
+            CatalogChange.version <= select(bumped.c.version).scalar_subquery() - retention
+        )
+        queryset = (
+            select(bumped.c.version).add_cte(recorded.cte("recorded")).add_cte(pruned.cte("pruned"))
+        )
+        return self.db.execute(queryset).scalar_one()
+
+    def get_catalog_changes(self, after: int, version: int) -> Optional[List[CatalogChange]]:
+        """after 다음부터 version 까지의 변경 내역 (내역이 없는 버전이 있으면 None)"""
+        if version <= after:
+            return None
+        queryset = (
+            select(CatalogChange)
+            .filter(CatalogChange.version > after, CatalogChange.version <= version)
+            .order_by(CatalogChange.version)
+        )
+        changes = self.db.execute(queryset).scalars().all()
+        return list(changes) if len(changes) == version - after else None
+
     def create_company(self, company: Company) -> Company:
-        """새로운 회사 생성"""
+        """새로운 회사 추가 (commit 은 service 에서)"""
         self.db.add(company)
-        self.db.flush()
-        self.db.commit()
         return company
 
     def add_company_name(self, company_name: CompanyName) -> CompanyName:
-        """회사명 추가"""
+        """회사명 추가 (commit 은 service 에서)"""
         self.db.add(company_name)
-        self.db.flush()
-        self.db.commit()
         return company_name
 
     def add_company_tag(self, company_tag: CompanyTag) -> CompanyTag:
-        """회사에 태그 추가"""
+        """회사에 태그 추가 (commit 은 service 에서)"""
         self.db.add(company_tag)
-        self.db.flush()
-        self.db.commit()
         return company_tag
 
+    def get_existing_names(self, names: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """(언어, 회사명) 목록 중 이미 존재하는 항목을 한 번에 조회"""
+        names = list(names)
+        if not names:
+            return set()
+        queryset = select(CompanyName.language_code, CompanyName.name).filter(
+            tuple_(CompanyName.language_code, CompanyName.name).in_(names)
+        )
+        return {tuple(row) for row in self.db.execute(queryset)}
+
+    def bulk_create_companies(self, count: int) -> List[int]:
+        """회사 count 개를 한 번에 생성하고 id 를 생성 순서대로 반환"""
+        if count == 0:
+            return []
+        now = datetime.now()
+        queryset = insert(Company).returning(Company.id, sort_by_parameter_order=True)
+        return self.db.execute(queryset, [{"created": now, "updated": now}] * count).scalars().all()
+
+    def bulk_add_company_names(self, rows: List[Tuple[int, str, str]]) -> List[int]:
+        """(company_id, 언어, 회사명) 목록을 한 번에 저장하고 id 를 저장 순서대로 반환"""
+        if not rows:
+            return []
+        now = datetime.now()
+        queryset = insert(CompanyName).returning(CompanyName.id, sort_by_parameter_order=True)
+        return (
+            self.db.execute(
+                queryset,
+                [
+                    dict(
+                        company_id=company_id,
+                        language_code=lang,
+                        name=name,
+                        created=now,
+                        updated=now,
+                    )
+                    for company_id, lang, name in rows
+                ],
+            )
+            .scalars()
+            .all()
+        )
+
+    def bulk_add_company_tags(self, rows: List[Tuple[int, int]]) -> None:
+        """(company_id, tag_id) 목록을 한 번에 저장"""
+        if not rows:
+            return
+        now = datetime.now()
+        self.db.execute(
+            insert(CompanyTag),
+            [
+                dict(company_id=company_id, tag_id=tag_id, created=now, updated=now)
+                for company_id, tag_id in rows
+            ],
+        )
+
     def remove_company_tag(self, company_id: int, tag_id: int) -> bool:
         """회사에서 태그 제거"""
         result = (
@@ -70,6 +306,16 @@ class CompanyRepository:
         )
         return result > 0
 
+    def get_names_by_tag_ids(self, tag_ids: Iterable[int]) -> List[str]:
+        """태그가 연결된 회사들의 모든 회사명 조회"""
+        queryset = (
+            select(CompanyName.name)
+            .join(CompanyTag, CompanyTag.company_id == CompanyName.company_id)
+            .filter(CompanyTag.tag_id.in_(list(tag_ids)))
+            .distinct()
+        )
+        return self.db.execute(queryset).scalars().all()
+
     def get_companies_by_tag(self, tag_name: str, language: str) -> List[Company]:
         """태그명으로 회사 검색"""
         queryset = (
@@ -82,3 +328,178 @@ class CompanyRepository:
             .distinct()
         )
         return self.db.execute(queryset).unique().scalars().all()
+
+    def get_companies_by_ids(
+        self, company_ids: List[int], with_tag_names: bool = True
+    ) -> List[Company]:
+        """회사 id 목록으로 회사, 회사명, 태그를 한 번에 조회 (id 순)"""
+        if not company_ids:
+            return []
+        queryset = (
+            select(Company)
+            .filter(Company.id.in_(company_ids))
+            .options(*self._company_options(with_tag_names))
+            .order_by(Company.id)
+        )
+        return self.db.execute(queryset).unique().scalars().all()
+
+    def get_views_by_ids(self, company_ids: List[int], language: str) -> List[CompanyView]:
+        """회사 id 목록으로 요청 언어의 조회용 모델 조회 (id 순)"""
+        if not company_ids:
+            return []
+        queryset = (
+            select(CompanyView)
+            .filter(CompanyView.language_code == language)
+            .filter(CompanyView.company_id.in_(company_ids))
+            .order_by(CompanyView.company_id)
+        )
+        return self.db.execute(queryset).scalars().all()
+
+    def get_view_by_name(self, name: str, language: str) -> Optional[CompanyView]:
+        """회사명(모든 언어)으로 요청 언어의 조회용 모델 검색"""
+        queryset = (
+            select(CompanyView)
+            .filter(CompanyView.language_code == language)
+            .filter(CompanyView.all_names.contains([name]))
+            .order_by(CompanyView.company_id)
+            .limit(1)
+        )
+        return self.db.execute(queryset).scalar_one_or_none()
+
+    def get_views_by_tag_name(
+        self,
+        tag_query: str,
+        language: str,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> List[CompanyView]:
+        """태그명(모든 언어)으로 요청 언어의 조회용 모델 검색 (company_id 순, after 다음부터)"""
+        queryset = (
+            select(CompanyView)
+            .filter(CompanyView.language_code == language)
+            .filter(CompanyView.all_tag_names.contains([tag_query]))
+            .order_by(CompanyView.company_id)
+            .limit(limit)
+        )
+        if after is not None:
+            queryset = queryset.filter(CompanyView.company_id > after)
+        return self.db.execute(queryset).scalars().all()
+
+    def refresh_company_view(
+        self, company_ids: Optional[Iterable[int]] = None, tag_ids: Iterable[int] = ()
+    ) -> None:
+        """
+        company_view 갱신
+        company_ids 의 회사와 tag_ids 가 연결된 회사를 갱신하고, company_ids 가 없으면 전체를 다시 만든다.
+        회사명/태그명은 _format_company_response 와 같이 요청 언어 이름, 없으면 가장 먼저 저장된 이름을 사용한다.
+        """
+        if company_ids is None:
+            companies = select(Company.id.label("company_id"))
+            self.db.execute(delete(CompanyView))
+        else:
+            companies = select(CompanyTag.company_id).filter(CompanyTag.tag_id.in_(list(tag_ids)))
+            companies = companies.union(
+                select(Company.id).filter(Company.id.in_(list(company_ids)))
+            )
+            self.db.execute(delete(CompanyView).filter(CompanyView.company_id.in_(companies)))
+        companies = companies.cte("companies")
+
+        language_type = CompanyName.language_code.type
+        languages = select(
+            func.unnest(func.enum_range(null().cast(language_type)), type_=language_type).label(
+                "language_code"
+            )
+        ).cte("languages")
+
+        names = (
+            select(
+                CompanyName.company_id,
+                languages.c.language_code,
+                CompanyName.name,
+                func.array_agg(CompanyName.name)
+                .over(partition_by=(CompanyName.company_id, languages.c.language_code))
+                .label("all_names"),
+            )
+            .join(companies, companies.c.company_id == CompanyName.company_id)
+            .join(languages, true())
+            .distinct(CompanyName.company_id, languages.c.language_code)
+            .order_by(
+                CompanyName.company_id,
+                languages.c.language_code,
+                (CompanyName.language_code == languages.c.language_code).desc(),
+                CompanyName.id,
+            )
+            .subquery("localized_company_name")
+        )
+
+        company_tags = (
+            select(CompanyTag.company_id, CompanyTag.tag_id)
+            .join(companies, companies.c.company_id == CompanyTag.company_id)
+            .cte("view_company_tag")
+        )
+        tag_names = (
+            select(TagName.tag_id, languages.c.language_code, TagName.name)
+            .filter(TagName.tag_id.in_(select(company_tags.c.tag_id)))
+            .join(languages, true())
+            .distinct(TagName.tag_id, languages.c.language_code)
+            .order_by(
+                TagName.tag_id,
+                languages.c.language_code,
+                (TagName.language_code == languages.c.language_code).desc(),
+                TagName.id,
+            )
+            .subquery("localized_tag_name")
+        )
+        # python sorted() 와 같은 순서 (코드 포인트)
+        tags = (
+            select(
+                company_tags.c.company_id,
+                tag_names.c.language_code,
+                func.array_agg(
+                    aggregate_order_by(tag_names.c.name, tag_names.c.name.collate("C"))
+                ).label("tags"),
+            )
+            .join(tag_names, tag_names.c.tag_id == company_tags.c.tag_id)
+            .group_by(company_tags.c.company_id, tag_names.c.language_code)
+            .subquery("localized_tags")
+        )
+        all_tag_names = (
+            select(
+                company_tags.c.company_id,
+                func.array_agg(TagName.name.distinct()).label("all_tag_names"),
+            )
+            .join(TagName, TagName.tag_id == company_tags.c.tag_id)
+            .group_by(company_tags.c.company_id)
+            .subquery("all_tag_names")
+        )
+
+        empty = array([], type_=CompanyView.tags.type.item_type).cast(CompanyView.tags.type)
+        rows = select(
+            names.c.company_id,
+            names.c.language_code,
+            names.c.name,
+            func.coalesce(tags.c.tags, empty),
+            names.c.all_names,
+            func.coalesce(all_tag_names.c.all_tag_names, empty),
+        ).select_from(
+            names.outerjoin(
+                tags,
+                and_(
+                    tags.c.company_id == names.c.company_id,
+                    tags.c.language_code == names.c.language_code,
+                ),
+            ).outerjoin(all_tag_names, all_tag_names.c.company_id == names.c.company_id)
+        )
+        self.db.execute(
+            insert(CompanyView).from_select(
+                [
+                    "company_id",
+                    "language_code",
+                    "company_name",
+                    "tags",
+                    "all_names",
+                    "all_tag_names",
+                ],
+                rows,
+            )
+        )
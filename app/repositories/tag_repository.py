@@ -1,10 +1,28 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Row,
+    String,
+    and_,
+    any_,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    not_,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, array
 from sqlalchemy.orm import Session, joinedload
 
+from app.common.tag_index import And, Or, TagQuery, Term, matches_untagged, tag_query_terms
 from app.models import CompanyTag
-from app.models.company import Company
+from app.models.company import Company, CompanyName
 from app.models.tag import Tag, TagName
 
 
@@ -13,7 +31,6 @@ class TagRepository:
         self.db = db
 
     def get_by_name(self, name: str, language: str = None) -> Optional[Tag]:
-        print(f"-------------- {name} / {language}")
         """태그명으로 태그 검색"""
         queryset = select(Tag).join(TagName)
         if language:
@@ -22,10 +39,20 @@ class TagRepository:
             queryset = queryset.filter(TagName.name == name)
         return self.db.execute(queryset).scalar_one_or_none()
 
-    def get_companies_by_tag_name(self, tag_query: str) -> List[Company]:
+    def get_companies_by_tag_name(
+        self,
+        tag_query: str,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        with_tag_names: bool = True,
+    ) -> List[Company]:
         """
-        태그명으로 회사 검색
+        태그명으로 회사 검색 (회사 id 순, after 다음부터 limit 개)
+        with_tag_names 가 False 이면 태그명은 조회하지 않는다. (태그명 캐시 사용)
         """
+        company_tags = joinedload(Company.company_tags)
+        if with_tag_names:
+            company_tags = company_tags.joinedload(CompanyTag.tag).joinedload(Tag.tag_names)
         queryset = (
             select(Company)
             .distinct()
@@ -33,58 +60,212 @@ class TagRepository:
             .join(Tag)
             .join(TagName)
             .filter(TagName.name == tag_query)
-            .options(
-                joinedload(Company.company_names),
-                joinedload(Company.company_tags)
-                .joinedload(CompanyTag.tag)
-                .joinedload(Tag.tag_names),
-            )
+            .options(joinedload(Company.company_names), company_tags)
             .order_by(Company.id)
+            .limit(limit)
         )
+        if after is not None:
+            queryset = queryset.filter(Company.id > after)
 
         return self.db.execute(queryset).unique().scalars().all()
 
+    def get_company_projections_by_tag_name(
+        self,
+        tag_query: str,
+        language: str,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        태그명으로 회사 검색 (요청 언어의 회사명, 태그명 목록만 조회)
+        요청 언어의 이름이 없으면 가장 먼저 저장된 이름을 사용한다.
+        ORM 객체 대신 (company_id, company_name, tags) row 를 회사 id 순으로 반환한다.
+        """
+        matched = (
+            select(CompanyTag.company_id)
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .filter(TagName.name == tag_query)
+            .distinct()
+            .order_by(CompanyTag.company_id)
+            .limit(limit)
+        )
+        if after is not None:
+            matched = matched.filter(CompanyTag.company_id > after)
+        matched = matched.cte("matched")
+        company_tags = (
+            select(CompanyTag.company_id, CompanyTag.tag_id)
+            .join(matched, matched.c.company_id == CompanyTag.company_id)
+            .cte("matched_company_tag")
+        )
+
+        # 회사/태그별 요청 언어 이름 하나 (DISTINCT ON)
+        company_names = (
+            select(CompanyName.company_id, CompanyName.name)
+            .join(matched, matched.c.company_id == CompanyName.company_id)
+            .distinct(CompanyName.company_id)
+            .order_by(
+                CompanyName.company_id,
+                (CompanyName.language_code == language).desc(),
+                CompanyName.id,
+            )
+            .subquery("localized_company_name")
+        )
+        tag_names = (
+            select(TagName.tag_id, TagName.name)
+            .filter(TagName.tag_id.in_(select(company_tags.c.tag_id)))
+            .distinct(TagName.tag_id)
+            .order_by(TagName.tag_id, (TagName.language_code == language).desc(), TagName.id)
+            .subquery("localized_tag_name")
+        )
+        tags = (
+            select(company_tags.c.company_id, func.array_agg(tag_names.c.name).label("tags"))
+            .join(tag_names, tag_names.c.tag_id == company_tags.c.tag_id)
+            .group_by(company_tags.c.company_id)
+            .subquery("localized_tags")
+        )
+
+        queryset = (
+            select(
+                company_names.c.company_id, company_names.c.name.label("company_name"), tags.c.tags
+            )
+            .outerjoin(tags, tags.c.company_id == company_names.c.company_id)
+            .order_by(company_names.c.company_id)
+        )
+        return self.db.execute(queryset).all()
+
+    def _tag_query_condition(self, query: TagQuery, names):
+        """태그 검색식을 회사에 연결된 태그명 배열 (names) 조건으로 변환"""
+        if isinstance(query, Term):
+            return literal(query.name) == any_(names)
+        if isinstance(query, And):
+            return and_(
+                self._tag_query_condition(query.left, names),
+                self._tag_query_condition(query.right, names),
+            )
+        if isinstance(query, Or):
+            return or_(
+                self._tag_query_condition(query.left, names),
+                self._tag_query_condition(query.right, names),
+            )
+        return not_(self._tag_query_condition(query.operand, names))
+
+    def get_company_ids_by_tag_query(
+        self, query: TagQuery, limit: Optional[int] = None, after: Optional[int] = None
+    ) -> List[int]:
+        """
+        태그 검색식을 만족하는 회사 id 목록 (회사 id 순, after 다음부터 limit 개)
+        검색식의 태그명 (중복 제거) 과 연결된 회사별 태그명 배열을 한 번에 조회한 뒤 조건을 확인하므로
+        태그 수와 관계 없이 태그명 조회는 한 번이다.
+        """
+        matched = (
+            select(CompanyTag.company_id, func.array_agg(TagName.name).label("names"))
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .filter(TagName.name.in_(sorted(tag_query_terms(query))))
+            .group_by(CompanyTag.company_id)
+            .subquery("matched")
+        )
+        if matches_untagged(query):
+            # NOT 처럼 검색식의 태그가 없는 회사도 포함되는 경우 전체 회사에서 확인
+            company_id = Company.id
+            names = func.coalesce(matched.c.names, cast(array([], type_=String), ARRAY(String)))
+            queryset = select(Company.id).outerjoin(matched, matched.c.company_id == Company.id)
+        else:
+            company_id = matched.c.company_id
+            names = matched.c.names
+            queryset = select(matched.c.company_id)
+
+        queryset = (
+            queryset.filter(self._tag_query_condition(query, names))
+            .order_by(company_id)
+            .limit(limit)
+        )
+        if after is not None:
+            queryset = queryset.filter(company_id > after)
+        return self.db.execute(queryset).scalars().all()
+
     def create_tag(self, tag: Tag) -> Tag:
-        """새로운 태그 생성"""
+        """새로운 태그 추가 (commit 은 service 에서)"""
         self.db.add(tag)
-        self.db.flush()
-        self.db.commit()
         return tag
 
     def add_tag_name(self, tag_name: TagName) -> TagName:
-        """태그명 추가"""
+        """태그명 추가 (commit 은 service 에서)"""
         self.db.add(tag_name)
-        self.db.flush()
-        self.db.commit()
         return tag_name
 
-    def get_or_create_tag(self, name: str, language_code: str) -> Tag:
-        """태그명으로 태그 검색 또는 생성"""
-        try:
-            # 기존 태그 검색
-            tag = self.get_by_name(name, language_code)
-            if tag:
-                return tag
-
-            # 새 태그 생성
-            tag = Tag()
-            self.db.add(tag)
-            self.db.flush()
-
-            # 태그명 추가
-            tag_name = TagName(tag_id=tag.id, language_code=language_code, name=name)
-            self.db.add(tag_name)
-            self.db.flush()
-
-            return tag
-
-        except Exception:
-            self.db.rollback()
-            raise
-
     def get_tag_names(self, tag_id: int, language: str = None) -> List[TagName]:
         """태그의 다국어 이름 조회"""
         queryset = select(TagName).filter(TagName.tag_id == tag_id)
         if language:
             queryset = queryset.filter(TagName.language_code == language)
         return self.db.execute(queryset).scalars().all()
+
+    def get_tag_ids_by_names(self, names: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """(언어, 태그명) 목록에 해당하는 태그 id 를 한 번에 조회"""
+        names = list(names)
+        if not names:
+            return {}
+        queryset = select(TagName.language_code, TagName.name, TagName.tag_id).filter(
+            tuple_(TagName.language_code, TagName.name).in_(names)
+        )
+        return {(lang, name): tag_id for lang, name, tag_id in self.db.execute(queryset)}
+
+    def get_names_by_tag_ids(self, tag_ids: Iterable[int]) -> Dict[int, List[Tuple[str, str]]]:
+        """태그별 다국어 이름 [(언어, 태그명), ...] 을 저장 순으로 한 번에 조회"""
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return {}
+        queryset = (
+            select(TagName.tag_id, TagName.language_code, TagName.name)
+            .filter(TagName.tag_id.in_(tag_ids))
+            .order_by(TagName.id)
+        )
+        names: Dict[int, List[Tuple[str, str]]] = {}
+        for tag_id, language_code, name in self.db.execute(queryset):
+            names.setdefault(tag_id, []).append((language_code, name))
+        return names
+
+    def get_popular_tag_ids(self, limit: int) -> List[int]:
+        """연결된 회사가 많은 순으로 태그 id 조회"""
+        queryset = (
+            select(CompanyTag.tag_id)
+            .group_by(CompanyTag.tag_id)
+            .order_by(func.count().desc(), CompanyTag.tag_id)
+            .limit(limit)
+        )
+        return self.db.execute(queryset).scalars().all()
+
+    def bulk_create_tags(self, count: int) -> List[int]:
+        """태그 count 개를 한 번에 생성하고 id 를 생성 순서대로 반환"""
+        if count == 0:
+            return []
+        now = datetime.now()
+        queryset = insert(Tag).returning(Tag.id, sort_by_parameter_order=True)
+        return self.db.execute(queryset, [{"created": now, "updated": now}] * count).scalars().all()
+
+    def insert_tag_names(self, rows: List[Tuple[int, str, str]]) -> Dict[Tuple[str, str], int]:
+        """
+        (tag_id, 언어, 태그명) 목록을 한 번에 저장하고 저장된 (언어, 태그명) 의 태그 id 를 반환
+        이미 있는 (언어, 태그명) 은 저장하지 않는다. (INSERT ... ON CONFLICT DO NOTHING)
+        """
+        if not rows:
+            return {}
+        now = datetime.now()
+        queryset = (
+            postgresql.insert(TagName)
+            .values(
+                [
+                    dict(tag_id=tag_id, language_code=lang, name=name, created=now, updated=now)
+                    for tag_id, lang, name in rows
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[TagName.language_code, TagName.name])
+            .returning(TagName.language_code, TagName.name, TagName.tag_id)
+        )
+        return {(lang, name): tag_id for lang, name, tag_id in self.db.execute(queryset)}
+
+    def delete_tags(self, tag_ids: Iterable[int]) -> None:
+        """태그 삭제"""
+        tag_ids = list(tag_ids)
+        if tag_ids:
+            self.db.execute(delete(Tag).filter(Tag.id.in_(tag_ids)))
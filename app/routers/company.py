@@ -1,37 +1,87 @@
-from typing import List
+import json
+from typing import AsyncContextManager, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from sqlalchemy.orm import Session
 
 from app.common.decorators import validate_language_header
-from app.common.dependencies import get_company_service
+from app.common.dependencies import get_company_service, get_db_factory
+from app.common.http_cache import cache_headers, entity_tag, etag_matches, not_modified
+from app.common.pagination import NEXT_CURSOR_HEADER
+from app.common.responses import render, render_encoded
+from app.common.routing import is_primary_pinned
+from app.common.single_flight import single_flight
+from app.common.utils import run_db, run_in_new_session
+from app.config.settings import Settings
 from app.schemas.company import CompanyRequest, TagNameRequest
 from app.services.company_service import CompanyService
 
+settings = Settings()
+
 router = APIRouter()
 
 
+def _flight_key(service: CompanyService, *key) -> tuple:
+    """single flight 키 (primary 고정 요청은 replica 조회 결과를 함께 사용하지 않음)"""
+    return (*key, is_primary_pinned(service.db))
+
+
+async def _catalog_etag(
+    service: CompanyService, language: str, if_none_match: Optional[str]
+) -> Tuple[Optional[int], Dict[str, str], bool]:
+    """
+    회사 목록 응답의 (버전, ETag header, If-None-Match 일치 여부)
+    응답을 만들기 전에 버전을 먼저 읽어 ETag 가 응답보다 새 버전을 가리키지 않도록 한다.
+    """
+    if not settings.etag_enabled:
+        return None, {}, False
+    version = await run_db(service.db, service.get_catalog_version)
+    etag = entity_tag("catalog", version, language)
+    return version, cache_headers(etag), etag_matches(if_none_match, etag)
+
+
 @router.get("/search")
 @validate_language_header
 async def search_company(
     query: str,
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.MAX_SEARCH_LIMIT),
+    fuzzy: bool = False,
+    cursor: Optional[str] = None,
     x_wanted_language: str = Header(...),
+    if_none_match: Optional[str] = Header(default=None),
     service: CompanyService = Depends(get_company_service),
+    open_db: Callable[[], AsyncContextManager[Session]] = Depends(get_db_factory),
 ):
     """
     회사명 자동완성 검색
     - **query**: 회사명의 일부만 들어가도 검색
+    - **limit**: 최대 결과 수, 지정하면 접두어 일치 결과를 우선으로 정렬
+    - **fuzzy**: 유사한 회사명을 유사도 순으로 검색 (pg_trgm)
+    - **cursor**: 이전 응답의 X-Next-Cursor header 값, 다음 페이지 조회
     - **x_wanted_language**:  header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+    - **if_none_match**: 이전 응답의 ETag, 회사 목록이 변경되지 않았으면 304 응답
     """
-    # key = query+x_wanted_language
-    # key = key.replace(" ", "")
-    # companies = service.cache_repository.get_data_by_key()
-    # if companies is None:
-    #     companies = service.search_companies_by_name(query, x_wanted_language)
-    #     service.cache_repository.set_data_by_key(key, companies, 10)
-
-    companies = service.search_companies_by_name(query, x_wanted_language)
+    version, headers, matched = await _catalog_etag(service, x_wanted_language, if_none_match)
+    if matched:
+        return not_modified(headers["ETag"])
 
-    return companies
+    # 같은 검색어의 동시 요청은 한 번만 조회
+    companies, next_cursor = await single_flight.do(
+        _flight_key(service, "search", x_wanted_language, query, limit, fuzzy, cursor, version),
+        run_in_new_session,
+        open_db,
+        service,
+        CompanyService.search_companies_by_name_page,
+        query,
+        x_wanted_language,
+        limit,
+        fuzzy,
+        cursor,
+        version,
+    )
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return render(companies, headers or None)
 
 
 @router.get("/companies/{company_name}")
@@ -39,17 +89,56 @@ async def search_company(
 async def get_company(
     company_name: str,
     x_wanted_language: str = Header(...),
+    if_none_match: Optional[str] = Header(default=None),
     service: CompanyService = Depends(get_company_service),
+    open_db: Callable[[], AsyncContextManager[Session]] = Depends(get_db_factory),
 ):
     """
     회사 이름으로 회사 검색
     - **company_name**: 정확한 회사 이름
     - **x_wanted_language**: header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+    - **if_none_match**: 이전 응답의 ETag, 회사가 변경되지 않았으면 304 응답
     """
-    company = service.get_company_by_name(company_name, x_wanted_language)
+    version, headers = None, None
+    if settings.etag_enabled:
+        # 회사 id 와 버전만 먼저 조회하여 변경되지 않았으면 회사 정보를 조회하지 않음
+        company_version = await run_db(service.db, service.get_company_version, company_name)
+        if company_version is None:
+            raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
+        version = company_version[1]
+        etag = entity_tag("company", *company_version, x_wanted_language)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        headers = cache_headers(etag)
+
+    # 같은 회사의 동시 요청은 한 번만 조회
+    if settings.fast_json_response:
+        # 캐시에 저장된 JSON 을 다시 변환하지 않고 그대로 응답
+        encoded = await single_flight.do(
+            _flight_key(service, "company_json", x_wanted_language, company_name, version),
+            run_in_new_session,
+            open_db,
+            service,
+            CompanyService.get_company_json_by_name,
+            company_name,
+            x_wanted_language,
+            version,
+        )
+        return render_encoded(encoded, headers)
+
+    company = await single_flight.do(
+        _flight_key(service, "company", x_wanted_language, company_name, version),
+        run_in_new_session,
+        open_db,
+        service,
+        CompanyService.get_company_by_name,
+        company_name,
+        x_wanted_language,
+        version,
+    )
     if not company:
         raise HTTPException(status_code=404)
-    return company
+    return render(company, headers)
 
 
 @router.post("/companies")
@@ -64,22 +153,116 @@ async def create_company(
     - **company**: 회사 정보 데이터
     - **x_wanted_language**: 저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    return service.create_company(company, x_wanted_language)
+    return await run_db(service.db, service.create_company, company, x_wanted_language)
+
+
+@router.post(
+    "/companies/bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/CompanyRequest"},
+                    }
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+@validate_language_header
+async def create_companies_bulk(
+    request: Request,
+    x_wanted_language: str = Header(...),
+    service: CompanyService = Depends(get_company_service),
+):
+    """
+    여러 회사 한 번에 추가
+    - **body**: 회사 정보 데이터 목록 (JSON 배열 또는 한 줄에 하나씩 NDJSON)
+    - **x_wanted_language**: 저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+    - 항목별 결과(created/error)를 요청 순서대로 반환
+    """
+    body = await request.body()
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = []
+        for line in body.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                # 잘못된 줄은 해당 항목의 검증 오류로 처리
+                items.append(line)
+    else:
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 요청 형식입니다.")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="회사 정보 목록이 필요합니다.")
+
+    if len(items) > settings.MAX_BULK_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"한 번에 최대 {settings.MAX_BULK_SIZE}개까지 추가할 수 있습니다."
+        )
+
+    return render(await run_db(service.db, service.create_companies_bulk, items, x_wanted_language))
 
 
 @router.get("/tags")
 @validate_language_header
 async def search_by_tag(
     query: str,
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
     x_wanted_language: str = Header(...),
+    if_none_match: Optional[str] = Header(default=None),
     service: CompanyService = Depends(get_company_service),
 ):
     """
     태그명으로 회사 검색
      - **query**: 정확한 태그 네임이어야 합니다.
+     - **limit**: 최대 결과 수 (회사 등록 순)
+     - **cursor**: 이전 응답의 X-Next-Cursor header 값, 다음 페이지 조회
+     - **x_wanted_language**: header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+     - **if_none_match**: 이전 응답의 ETag, 회사 목록이 변경되지 않았으면 304 응답
+    """
+    _, headers, matched = await _catalog_etag(service, x_wanted_language, if_none_match)
+    if matched:
+        return not_modified(headers["ETag"])
+
+    companies, next_cursor = await run_db(
+        service.db, service.search_companies_by_tag_page, query, x_wanted_language, limit, cursor
+    )
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return render(companies, headers or None)
+
+
+@router.get("/tags/query")
+@validate_language_header
+async def search_by_tag_query(
+    expr: str = Query(..., min_length=1, max_length=settings.MAX_TAG_QUERY_LENGTH),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    x_wanted_language: str = Header(...),
+    service: CompanyService = Depends(get_company_service),
+):
+    """
+    태그 검색식으로 회사 검색
+     - **expr**: AND / OR / NOT 과 괄호로 조합한 태그명 (모든 언어), 공백이 있는 태그명은 따옴표로 감쌉니다.
+       예) `태그_4 AND (tag_16 OR "タグ_20") AND NOT 태그_1`
+     - **limit**: 최대 결과 수 (회사 등록 순)
+     - **cursor**: 이전 응답의 X-Next-Cursor header 값, 다음 페이지 조회
      - **x_wanted_language**: header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    return service.search_companies_by_tag(query, x_wanted_language)
+    companies, next_cursor = await run_db(
+        service.db, service.search_companies_by_tag_query, expr, x_wanted_language, limit, cursor
+    )
+    return render(companies, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None)
 
 
 @router.put("/companies/{company_name}/tags")
@@ -95,7 +278,9 @@ async def add_company_tags(
      - **tags**: 태그 리스트
      - **x_wanted_language**: 저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    return service._add_company_to_tags(company_name, tags, x_wanted_language)
+    return await run_db(
+        service.db, service._add_company_to_tags, company_name, tags, x_wanted_language
+    )
 
 
 @router.delete("/companies/{company_name}/tags/{tag_name}")
@@ -112,4 +297,6 @@ async def delete_company_tag(
      - **tag_name**: 정확한 태그 이름
      - **x_wanted_language**: 삭제 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    return service.delete_company_tag(company_name, tag_name, x_wanted_language)
+    return await run_db(
+        service.db, service.delete_company_tag, company_name, tag_name, x_wanted_language
+    )
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import JSONResponse
+
+from app.common.warmup import warmup_state
+from app.repositories.cache_repository import CacheRepository
 
 router = APIRouter()
 
@@ -7,3 +11,24 @@ router = APIRouter()
 @router.get("/docs", include_in_schema=True)
 def get_documentation():
     return get_swagger_ui_html(openapi_url="/openapi.json", title="Swagger Documentation")
+
+
+@router.get("/cache/stats")
+def get_cache_stats():
+    """캐시 적중/실패 횟수 (워커 프로세스 단위)"""
+    return CacheRepository.get_stats()
+
+
+@router.get("/health/live")
+def get_liveness():
+    """워커 프로세스 실행 여부"""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def get_readiness():
+    """warmup 완료 후 요청 처리 가능 여부 (완료 전에는 503)"""
+    content = {"timings": warmup_state.timings, "errors": warmup_state.errors}
+    if not warmup_state.ready:
+        return JSONResponse({"status": "warming_up", **content}, status_code=503)
+    return {"status": "ready", **content}
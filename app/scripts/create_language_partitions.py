@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import argparse
+
+from app.common.database import engine
+from app.models.partitions import ensure_language_partitions
+
+
+def create_language_partitions(language_codes=None):
+    """
+    LANGUAGE_CHOICES (또는 language_codes) 의 enum 값, 회사명/태그명 파티션,
+    company_view 언어별 인덱스 생성 (배포 시 DDL 권한이 있는 계정으로 실행)
+    """
+    created = ensure_language_partitions(engine, language_codes)
+    print(f"language partitions created. {created}")
+    return created
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="언어별 파티션 생성")
+    parser.add_argument("languages", nargs="*", help="언어코드 (기본: LANGUAGE_CHOICES)")
+    args = parser.parse_args()
+    create_language_partitions(args.languages or None)
@@ -3,22 +3,31 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from typing import Dict
+import argparse
+import csv
+import io
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
 
 import pandas as pd
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config.settings import Settings
 from app.models.campany_tag import CompanyTag
 from app.models.company import Company, CompanyName
 from app.models.tag import Tag, TagName
+from app.repositories.company_repository import CompanyRepository
 
 settings = Settings()
 
 engine = create_engine(settings.database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+CSV_PATH = os.path.join(os.path.dirname(__file__), "company_tag_sample.csv")
+
 
 def get_or_create_tag(session, tag_names: Dict[str, str], tag_cache: Dict[str, Tag]) -> Tag:
     ko_name = tag_names["ko"]
@@ -56,15 +65,32 @@ def create_company_with_names(session, names: Dict[str, str]) -> Company:
     return company
 
 
-def import_data():
-    session = SessionLocal()
+def row_company_names(row) -> Dict[str, str]:
+    return {
+        "ko": row["company_ko"],
+        "en": row["company_en"],
+        "jp": row["company_ja"],
+    }
+
+
+def row_tag_names(row) -> List[Dict[str, str]]:
+    ko_tags = str(row["tag_ko"]).split("|")
+    en_tags = str(row["tag_en"]).split("|")
+    jp_tags = str(row["tag_ja"]).split("|")
+    return [
+        {"ko": ko.strip(), "en": en.strip(), "jp": jp.strip()}
+        for ko, en, jp in zip(ko_tags, en_tags, jp_tags)
+    ]
+
+
+def import_data(session=None, csv_path: str = CSV_PATH):
+    session = session or SessionLocal()
     if session.query(Company).first() is not None:
         print("already init data.")
         return
 
     try:
         # CSV 파일 읽기
-        csv_path = os.path.join(os.path.dirname(__file__), "company_tag_sample.csv")
         df = pd.read_csv(csv_path)
         df = df.where(pd.notnull(df), None)
 
@@ -72,21 +98,10 @@ def import_data():
 
         for _, row in df.iterrows():
             # 회사 이름 처리
-            company_names = {
-                "ko": row["company_ko"],
-                "en": row["company_en"],
-                "jp": row["company_ja"],
-            }
-            company = create_company_with_names(session, company_names)
+            company = create_company_with_names(session, row_company_names(row))
 
             # 태그 처리
-            ko_tags = str(row["tag_ko"]).split("|")
-            en_tags = str(row["tag_en"]).split("|")
-            jp_tags = str(row["tag_ja"]).split("|")
-
-            for ko, en, jp in zip(ko_tags, en_tags, jp_tags):
-                tag_names = {"ko": ko.strip(), "en": en.strip(), "jp": jp.strip()}
-
+            for tag_names in row_tag_names(row):
                 tag = get_or_create_tag(session, tag_names, tag_cache)
 
                 company_tag = CompanyTag(company_id=company.id, tag_id=tag.id)
@@ -94,6 +109,9 @@ def import_data():
 
             session.flush()
 
+        # 실행 중인 워커의 검색 색인/목록 캐시가 적재한 데이터를 반영하도록 버전 증가
+        # (변경 내역 없이 증가하므로 워커의 색인은 변경분 대신 다시 생성됨)
+        CompanyRepository(session).bump_catalog_version()
         session.commit()
         print("init data setting complete.")
 
@@ -105,5 +123,153 @@ def import_data():
         session.close()
 
 
+def reserve_ids(connection: Connection, table: str, count: int) -> List[int]:
+    """테이블 id 시퀀스에서 count 개의 id 를 미리 할당"""
+    if count == 0:
+        return []
+    return (
+        connection.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"table": table, "count": count},
+        )
+        .scalars()
+        .all()
+    )
+
+
+def copy_rows(connection: Connection, table: str, columns: Tuple[str, ...], rows: Iterable) -> int:
+    """COPY FROM STDIN 으로 rows 저장"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    if count == 0:
+        return 0
+
+    buffer.seek(0)
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+    return count
+
+
+def bulk_import_data(
+    connection: Connection = None, csv_path: str = CSV_PATH, chunksize: int = 10000
+):
+    """
+    CSV 를 chunk 단위로 읽어 COPY 로 저장하는 대량 적재
+    - company/tag id 는 시퀀스에서 chunk 단위로 미리 할당
+    - 나머지 테이블의 id 는 COPY 순서대로 시퀀스 기본값이 할당되어 import_data 결과와 같다.
+    """
+    connection = connection or engine.connect()
+    if connection.execute(text("SELECT 1 FROM company LIMIT 1")).first() is not None:
+        print("already init data.")
+        return
+
+    started = time.perf_counter()
+    counts = dict.fromkeys(("company", "company_name", "tag", "tag_name", "company_tag"), 0)
+    tag_cache: Dict[str, int] = {}
+
+    try:
+        # chunk 마다 컬럼 타입이 달라지지 않도록 모두 문자열로 읽음
+        for df in pd.read_csv(csv_path, chunksize=chunksize, dtype=str):
+            df = df.where(pd.notnull(df), None)
+            now = datetime.now()
+            records = df.to_dict("records")
+            rows = [(row_company_names(row), row_tag_names(row)) for row in records]
+
+            # 처음 등장한 태그 (ko 태그명 기준)
+            new_tags: Dict[str, Dict[str, str]] = {}
+            for _, tag_names_list in rows:
+                for tag_names in tag_names_list:
+                    if tag_names["ko"] not in tag_cache and tag_names["ko"] not in new_tags:
+                        new_tags[tag_names["ko"]] = tag_names
+
+            company_ids = reserve_ids(connection, "company", len(rows))
+            tag_ids = reserve_ids(connection, "tag", len(new_tags))
+            tag_cache.update(zip(new_tags, tag_ids))
+
+            counts["company"] += copy_rows(
+                connection,
+                "company",
+                ("id", "created", "updated"),
+                ((company_id, now, now) for company_id in company_ids),
+            )
+            counts["company_name"] += copy_rows(
+                connection,
+                "company_name",
+                ("company_id", "language_code", "name", "created", "updated"),
+                (
+                    (company_id, lang, name, now, now)
+                    for company_id, (names, _) in zip(company_ids, rows)
+                    for lang, name in names.items()
+                    if name
+                ),
+            )
+            counts["tag"] += copy_rows(
+                connection,
+                "tag",
+                ("id", "created", "updated"),
+                ((tag_cache[ko_name], now, now) for ko_name in new_tags),
+            )
+            counts["tag_name"] += copy_rows(
+                connection,
+                "tag_name",
+                ("tag_id", "language_code", "name", "created", "updated"),
+                (
+                    (tag_cache[ko_name], lang, name, now, now)
+                    for ko_name, tag_names in new_tags.items()
+                    for lang, name in tag_names.items()
+                    if name
+                ),
+            )
+            counts["company_tag"] += copy_rows(
+                connection,
+                "company_tag",
+                ("company_id", "tag_id", "created", "updated"),
+                (
+                    (company_id, tag_cache[tag_names["ko"]], now, now)
+                    for company_id, (_, tag_names_list) in zip(company_ids, rows)
+                    for tag_names in tag_names_list
+                ),
+            )
+
+        # 실행 중인 워커의 검색 색인/목록 캐시가 적재한 데이터를 반영하도록 버전 증가
+        # (변경 내역 없이 증가하므로 워커의 색인은 변경분 대신 다시 생성됨)
+        CompanyRepository(Session(bind=connection)).bump_catalog_version()
+        connection.commit()
+
+    except Exception as e:
+        connection.rollback()
+        print(f"error : {str(e)}")
+        raise
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"bulk init data setting complete. {counts}")
+    print(f"{total} rows in {elapsed:.2f}s ({total / elapsed:,.0f} rows/s)")
+    return counts
+
+
 if __name__ == "__main__":
-    import_data()
+    parser = argparse.ArgumentParser(description="초기 데이터 적재")
+    parser.add_argument("--csv", default=CSV_PATH, help="적재할 CSV 파일")
+    parser.add_argument("--bulk", action="store_true", help="COPY 기반 대량 적재")
+    parser.add_argument("--chunksize", type=int, default=10000, help="대량 적재 chunk 크기")
+    args = parser.parse_args()
+
+    if args.bulk:
+        bulk_import_data(csv_path=args.csv, chunksize=args.chunksize)
+    else:
+        import_data(csv_path=args.csv)
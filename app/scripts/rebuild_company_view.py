@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.common.database import SessionLocal
+from app.models.company_view import CompanyView
+from app.repositories.company_repository import CompanyRepository
+
+
+def rebuild_company_view(session: Session = None) -> int:
+    """company_view 전체를 다시 만들고 row 수를 반환"""
+    session = session or SessionLocal()
+    started = time.perf_counter()
+    try:
+        CompanyRepository(session).refresh_company_view()
+        count = session.execute(select(func.count()).select_from(CompanyView)).scalar()
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        print(f"error : {str(e)}")
+        raise
+    finally:
+        session.close()
+
+    print(f"company_view rebuild complete. {count} rows in {time.perf_counter() - started:.2f}s")
+    return count
+
+
+if __name__ == "__main__":
+    rebuild_company_view()
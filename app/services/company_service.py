@@ -1,76 +1,587 @@
-from typing import Dict, List
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.common.pagination import ID_CURSOR, SEARCH_CURSOR, decode_cursor, paginate
+from app.common.routing import replica_read
+from app.common.search_index import CompanyNameIndex
+from app.common.tag_cache import TagNameCache, TagNames
+from app.common.tag_index import TagPostingIndex, TagQuerySyntaxError, parse_tag_query
+from app.config.settings import Settings
 from app.models import CompanyTag
 from app.models.company import Company, CompanyName
-from app.models.tag import TagName
+from app.repositories.cache_repository import CacheRepository
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.tag_repository import TagRepository
 from app.schemas.company import CompanyRequest, CompanyResponse, TagNameRequest
 
+settings = Settings()
+
+# LIKE/pg_trgm 검색은 ASCII 대소문자를 구분하지 않으므로 캐시 키에서 통일
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# 읽기 전용 조회는 read replica 로 보냄 (primary 고정 요청, 변경한 세션 제외)
+read_only = replica_read(lambda service: service.company_repository.db)
+
 
 class CompanyService:
-    def __init__(self, company_repository: CompanyRepository, tag_repository: TagRepository):
+    def __init__(
+        self,
+        company_repository: CompanyRepository,
+        tag_repository: TagRepository,
+        name_index: Optional[CompanyNameIndex] = None,
+        cache_repository: Optional[CacheRepository] = None,
+        tag_index: Optional[TagPostingIndex] = None,
+        tag_cache: Optional[TagNameCache] = None,
+    ):
         self.company_repository = company_repository
         self.tag_repository = tag_repository
+        self.name_index = name_index
+        self.cache_repository = cache_repository
+        self.tag_index = tag_index
+        self.tag_cache = tag_cache
+        # 요청 처리 중 다른 언어 이름이 추가된 태그 (캐시 무효화 대상)
+        self._updated_tag_ids: Set[int] = set()
+
+    @property
+    def db(self) -> Session:
+        """서비스가 사용하는 세션 (run_db 실행 방식 결정)"""
+        return self.company_repository.db
+
+    def with_db(self, db: Session) -> "CompanyService":
+        """같은 색인/캐시를 사용하고 다른 세션으로 조회하는 서비스"""
+        return CompanyService(
+            CompanyRepository(db),
+            TagRepository(db),
+            name_index=self.name_index,
+            cache_repository=self.cache_repository,
+            tag_index=self.tag_index,
+            tag_cache=self.tag_cache,
+        )
+
+    def search_companies_by_name(
+        self, query: str, language: str, limit: Optional[int] = None, fuzzy: bool = False
+    ) -> List[dict]:
+        """
+        회사명 자동 완성 조회
+        limit 이 주어지면 접두어 일치 결과를 우선으로 상위 limit 개만 조회한다.
+        fuzzy 이면 pg_trgm 유사도 순으로 조회한다.
+        """
+        return self.search_companies_by_name_page(query, language, limit, fuzzy)[0]
+
+    @read_only
+    def search_companies_by_name_page(
+        self,
+        query: str,
+        language: str,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+        cursor: Optional[str] = None,
+        catalog_version: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        회사명 자동 완성 조회 (keyset pagination)
+        limit 이 주어지면 (회사 목록, 다음 페이지 cursor) 를 반환한다.
+        catalog_version 이 주어지면 해당 버전의 캐시만 사용한다. (ETag 와 응답 일치)
+        """
+        if cursor is not None:
+            if fuzzy:
+                raise HTTPException(status_code=400, detail="유사도 검색은 cursor 를 지원하지 않습니다.")
+            limit = limit or settings.MAX_SEARCH_LIMIT
+
+        if self.cache_repository is None:
+            return self._search_companies(query, language, limit, fuzzy, cursor)
+
+        # 검색어별 키에 저장하고, 회사 생성 시 해당 언어의 세대를 올려 이전 캐시를 사용하지 않음
+        def compute() -> str:
+            return json.dumps(
+                self._search_companies(query, language, limit, fuzzy, cursor), ensure_ascii=False
+            )
+
+        generation = self.cache_repository.get_generation(self._search_generation_key(language))
+        if generation is None:
+            return self._search_companies(query, language, limit, fuzzy, cursor)
 
-    def search_companies_by_name(self, query: str, language: str) -> List[dict]:
-        """회사명 자동 완성 조회"""
-        companies = self.company_repository.search_by_name_partial(query, language)
-        return [{"company_name": c.name} for c in companies]
+        key = f"search:{language}:{generation}:{limit}:{int(fuzzy)}:{cursor or ''}"
+        if catalog_version is not None:
+            key = f"{key}:{catalog_version}"
+        cached = self._get_or_compute(f"{key}:{query.translate(ASCII_LOWER)}", compute)
+        companies, next_cursor = json.loads(cached)
+        return companies, next_cursor
 
-    def get_company_by_name(self, name: str, language: str) -> CompanyResponse:
+    def _search_companies(
+        self,
+        query: str,
+        language: str,
+        limit: Optional[int],
+        fuzzy: bool,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        회사명 자동 완성 조회 (DB/색인)
+        pg_trgm 이 설치되지 않은 DB 에서는 fuzzy 검색을 부분 검색으로 대체한다.
+        """
+        if fuzzy and self.company_repository.has_trgm():
+            companies = self.company_repository.search_by_name_similar(
+                query, language, settings.search_similarity_threshold, limit
+            )
+            return [{"company_name": c.name} for c in companies], None
+        if limit is not None:
+            return self._search_companies_ranked(query, language, limit, cursor)
+
+        name_ids = self.name_index.search(query, language) if self.name_index else None
+        if name_ids is None:
+            companies = self.company_repository.search_by_name_partial(query, language)
+        elif name_ids:
+            companies = self.company_repository.get_names_by_ids(name_ids, query, language)
+        else:
+            companies = []
+        return [{"company_name": c.name} for c in companies], None
+
+    def _search_companies_ranked(
+        self, query: str, language: str, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """회사명 자동 완성 상위 limit 개 조회 (다음 페이지 확인을 위해 limit + 1 개 조회)"""
+        keys = None
+        # 색인은 상위 결과만 빠르게 찾으므로 첫 페이지만 색인으로 처리
+        if cursor is None and self.name_index:
+            keys = self.name_index.search_ranked_keys(query, language, limit + 1)
+        if keys is None:
+            after = decode_cursor(cursor, SEARCH_CURSOR) if cursor is not None else None
+            keys = self.company_repository.search_by_name_ranked(query, language, limit + 1, after)
+        companies = [{"company_name": name} for _, _, name, _ in keys]
+        return paginate(companies, keys, limit)
+
+    @read_only
+    def get_company_version(self, name: str) -> Optional[Tuple[int, int]]:
+        """회사명으로 (회사 id, 버전) 조회 (ETag 확인용, 회사가 없으면 None)"""
+        row = self.company_repository.get_version_by_name(name)
+        return tuple(row) if row else None
+
+    @read_only
+    def get_catalog_version(self) -> int:
+        """회사 목록 응답 (검색/태그 검색) 의 버전 (ETag 확인용)"""
+        return self.company_repository.get_catalog_version()
+
+    @read_only
+    def get_company_by_name(
+        self, name: str, language: str, version: Optional[int] = None
+    ) -> CompanyResponse:
         """회사 상세 정보 조회"""
-        company = self.company_repository.get_by_name(name)
+        if self.cache_repository is None:
+            return self._read_company(name, language)
+        return CompanyResponse.model_validate_json(
+            self.get_company_json_by_name(name, language, version)
+        )
+
+    @read_only
+    def get_company_json_by_name(
+        self, name: str, language: str, version: Optional[int] = None
+    ) -> str:
+        """
+        회사 상세 정보 조회 (JSON 문자열, 캐시 적중 시 검증/변환 없이 그대로 반환)
+        version 이 주어지면 해당 버전의 캐시만 사용한다. (ETag 와 응답 일치)
+        """
+        # ETag 사용 시 버전 없는 키는 무효화하지 않으므로 캐시하지 않음
+        if self.cache_repository is None or (settings.etag_enabled and version is None):
+            return self._read_company(name, language).model_dump_json()
+        key = self._company_cache_key(name, language)
+        if version is not None:
+            key = f"{key}:{version}"
+        return self._get_or_compute(
+            key, lambda: self._read_company(name, language).model_dump_json()
+        )
+
+    def _get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """
+        캐시 조회 후 없으면 compute 결과 저장 (만료 시 한 워커만 재계산, 나머지는 이전 값 사용)
+        """
+        return self.cache_repository.get_or_compute(
+            key,
+            compute,
+            settings.cache_ttl,
+            stale_ttl=settings.cache_stale_ttl,
+            lease_timeout=settings.cache_lease_timeout,
+            wait=settings.cache_lease_wait,
+            beta=settings.cache_early_refresh_beta,
+        )
+
+    def _read_company(self, name: str, language: str) -> CompanyResponse:
+        """회사 상세 정보 조회 (DB/조회용 모델)"""
+        if settings.company_view_enabled:
+            view = self.company_repository.get_view_by_name(name, language)
+            if not view:
+                raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
+            return CompanyResponse.model_construct(company_name=view.company_name, tags=view.tags)
+
+        company = self.company_repository.get_by_name(name, with_tag_names=self.tag_cache is None)
         if not company:
             raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
         return self._format_company_response(company, language)
 
+    @staticmethod
+    def _company_cache_key(name: str, language: str) -> str:
+        return f"company:{language}:{name}"
+
+    @staticmethod
+    def _search_generation_key(language: str) -> str:
+        return f"generation:search:{language}"
+
+    def _invalidate_cache(self, company: Company, search_languages: Iterable[str] = ()) -> None:
+        """
+        회사 변경 후 캐시 무효화
+        - 변경된 회사의 모든 이름 x 모든 언어의 상세 조회 캐시 (ETag 미사용 시)
+        - 다른 언어 이름이 추가된 태그가 연결된 회사들의 상세 조회 캐시 (ETag 미사용 시)
+        - 회사명이 추가된 언어의 검색 캐시
+        """
+        self._invalidate_names({n.name for n in company.company_names}, search_languages)
+
+    def _invalidate_names(self, names: Set[str], search_languages: Iterable[str] = ()) -> None:
+        """회사명 목록 기준 캐시 무효화"""
+        if self.tag_cache is not None:
+            # 다른 언어 이름이 추가된 태그는 모든 워커의 태그명 캐시에서 삭제
+            self.tag_cache.invalidate(self._updated_tag_ids)
+        if self.cache_repository is None:
+            return
+
+        # ETag 사용 시 상세 조회 캐시 키에 회사 버전이 포함되어 버전 증가로 무효화됨
+        if not settings.etag_enabled:
+            if self._updated_tag_ids:
+                names |= set(self.company_repository.get_names_by_tag_ids(self._updated_tag_ids))
+            self.cache_repository.delete_keys(
+                self._company_cache_key(name, language)
+                for name in names
+                for language in settings.LANGUAGE_CHOICES
+            )
+        self._updated_tag_ids.clear()
+        self.cache_repository.bump_generations(
+            self._search_generation_key(language) for language in set(search_languages)
+        )
+
+    @contextmanager
+    def _unit_of_work(self) -> Iterator[None]:
+        """
+        요청 단위 트랜잭션
+        repository 는 변경 사항을 세션에 추가만 하고, 모두 성공하면 한 번에 commit 한다.
+        """
+        db = self.company_repository.db
+        try:
+            yield
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._updated_tag_ids.clear()
+            raise
+
+    def _bump_versions(self, company_ids: Iterable[int]) -> None:
+        """변경된 회사와 다른 언어 이름이 추가된 태그가 연결된 회사의 버전 증가"""
+        self.company_repository.bump_versions(company_ids, self._updated_tag_ids)
+
+    def _bump_catalog_version(
+        self, company_ids: Iterable[int], removed_tag_ids: Iterable[int] = ()
+    ) -> None:
+        """
+        회사 목록 응답의 버전 증가 (다른 워커의 색인이 반영할 변경된 회사를 함께 기록)
+        commit 과 캐시 무효화, 색인 반영 이후에 별도 트랜잭션으로 증가시켜야
+        새 버전으로 이전 응답을 만들지 않는다.
+        """
+        version = self.company_repository.bump_catalog_version(
+            company_ids, removed_tag_ids, retention=settings.catalog_change_retention
+        )
+        self.company_repository.db.commit()
+        # 현재 워커의 색인은 변경을 이미 반영했으므로 다시 생성하지 않도록 버전 기록
+        for index in filter(None, (self.name_index, self.tag_index)):
+            index.mark_version(version)
+
+    def _refresh_company_view(self, company_ids: Iterable[int]) -> None:
+        """변경된 회사와 다른 언어 이름이 추가된 태그가 연결된 회사의 조회용 모델 갱신"""
+        if settings.company_view_enabled:
+            self.company_repository.refresh_company_view(company_ids, self._updated_tag_ids)
+
     def create_company(self, request: CompanyRequest, language: str) -> CompanyResponse:
         """새로운 회사 생성"""
-        company = Company()
-        self.company_repository.create_company(company)
-
-        # 회사명 추가
-        for lang, name in request.company_name.dict(exclude_unset=True).items():
-            # 중복 확인
-            existing_company_name = self.company_repository.get_by_name(name, lang)
-            if not existing_company_name:
+        names = {
+            lang: name
+            for lang, name in request.company_name.model_dump(exclude_unset=True).items()
+            if name
+        }
+        if not names:
+            raise HTTPException(status_code=400, detail="회사명이 없습니다.")
+
+        with self._unit_of_work():
+            # 중복 확인 (모든 회사명을 한 번에 조회)
+            if self.company_repository.get_existing_names(names.items()):
+                raise HTTPException(status_code=400, detail="회사가 이미 존재합니다.")
+
+            # 응답 변환 시 다시 조회하지 않도록 컬렉션을 미리 초기화
+            company = Company(company_names=[])
+            self.company_repository.create_company(company)
+
+            # 회사명 추가
+            for lang, name in names.items():
                 company_name = CompanyName(company=company, language_code=lang, name=name)
                 self.company_repository.add_company_name(company_name)
+
+            # 태그 추가
+            tag_ids = self._add_tags_to_company(company, [t.tag_name for t in request.tags])
+
+            # 회사 id 할당 후 조회용 모델 갱신
+            self.company_repository.db.flush()
+            self._refresh_company_view([company.id])
+            self._bump_versions([])
+
+        if self.name_index:
+            for company_name in company.company_names:
+                self.name_index.add(company_name)
+        self._invalidate_cache(
+            company, search_languages=[n.language_code for n in company.company_names]
+        )
+        tag_names = self._get_tag_names(tag_ids)
+        self._index_company_tags({company.id: tag_ids}, tag_names)
+        self._bump_catalog_version([company.id])
+        return self._format_written_company(names, tag_ids, language, tag_names)
+
+    def create_companies_bulk(self, items: List[Any], language: str) -> List[dict]:
+        """
+        여러 회사를 하나의 트랜잭션으로 생성
+        - 회사명 중복은 배치 전체를 한 번에 조회
+        - 태그는 배치 전체를 한 번에 조회하고 새 태그/태그명만 묶어서 저장
+        - 항목별 검증 실패는 해당 항목만 제외하고 결과에 사유를 기록
+        """
+        results: List[dict] = [{"index": index} for index in range(len(items))]
+        requests: Dict[int, Tuple[Dict[str, str], List[Dict[str, str]]]] = {}
+        for index, item in enumerate(items):
+            try:
+                request = CompanyRequest.model_validate(item)
+            except ValidationError as e:
+                results[index].update(
+                    status="error", detail=e.errors(include_url=False, include_context=False)
+                )
+                continue
+
+            names = {
+                lang: name
+                for lang, name in request.company_name.model_dump(exclude_unset=True).items()
+                if name
+            }
+            tags = [tag.tag_name for tag in request.tags if tag.tag_name]
+            languages = set(names).union(*tags)
+            if not names:
+                results[index].update(status="error", detail="회사명이 없습니다.")
+            elif not languages.issubset(settings.LANGUAGE_CHOICES):
+                results[index].update(status="error", detail="잘못된 언어코드 입니다.")
             else:
-                raise HTTPException(status_code=400, detail="회사가 이미 존재합니다.")
+                requests[index] = (names, tags)
 
-        # 태그 추가
-        for tag_request in request.tags:
-            self._add_tag_to_company(company, tag_request.tag_name)
+        with self._unit_of_work():
+            # 회사명 중복 확인 (DB + 배치 내부)
+            existing = self.company_repository.get_existing_names(
+                {(lang, name) for names, _ in requests.values() for lang, name in names.items()}
+            )
+            for index, (names, _) in list(requests.items()):
+                pairs = set(names.items())
+                if pairs & existing:
+                    results[index].update(status="error", detail="회사가 이미 존재합니다.")
+                    del requests[index]
+                else:
+                    existing |= pairs
 
-        # 다 되면 적용
-        self.company_repository.db.commit()
-        return self._format_company_response(company, language)
+            tag_ids = iter(
+                self._resolve_tags([tag for _, tags in requests.values() for tag in tags])
+            )
 
-    def _add_tag_to_company(self, company: Company, tag_names: Dict[str, str]) -> None:
-        """회사에 태그 추가"""
-        # 첫 번째 언어의 태그명으로 태그 검색 또는 생성
-        first_lang = next(iter(tag_names))
-        tag = self.tag_repository.get_or_create_tag(tag_names[first_lang], first_lang)
-
-        # 나머지 언어의 태그명 추가
-        for lang, name in tag_names.items():
-            if lang != first_lang:
-                # 중복 확인 후 태그명 추가
-                existing_tag_name = self.tag_repository.get_by_name(name, lang)
-                if not existing_tag_name:
-                    tag_name = TagName(tag=tag, language_code=lang, name=name)
-                    self.tag_repository.add_tag_name(tag_name)
-
-        # 회사와 태그 연결
-        company_tag = CompanyTag(company_id=company.id, tag_id=tag.id)
-        self.company_repository.add_company_tag(company_tag)
-
-    def _format_company_response(self, company: Company, language: str) -> CompanyResponse:
-        """회사 정보를 응답 형식으로 변환"""
+            # 회사, 회사명, 회사 태그 저장
+            company_ids = self.company_repository.bulk_create_companies(len(requests))
+            name_rows = [
+                (company_id, lang, name)
+                for company_id, (names, _) in zip(company_ids, requests.values())
+                for lang, name in names.items()
+            ]
+            name_ids = self.company_repository.bulk_add_company_names(name_rows)
+            company_tags = {
+                company_id: list(dict.fromkeys(next(tag_ids) for _ in tags))
+                for company_id, (_, tags) in zip(company_ids, requests.values())
+            }
+            self.company_repository.bulk_add_company_tags(
+                [(company_id, tag_id) for company_id, ids in company_tags.items() for tag_id in ids]
+            )
+            self._refresh_company_view(company_ids)
+            self._bump_versions([])
+
+        if self.name_index:
+            for name_id, (_, lang, name) in zip(name_ids, name_rows):
+                self.name_index.add(CompanyName(id=name_id, language_code=lang, name=name))
+        self._invalidate_names(
+            {name for _, _, name in name_rows}, search_languages={lang for _, lang, _ in name_rows}
+        )
+
+        # 응답 형식으로 변환
+        tag_names = self._get_tag_names(tag_id for ids in company_tags.values() for tag_id in ids)
+        self._index_company_tags(company_tags, tag_names)
+        self._bump_catalog_version(company_ids)
+        for company_id, (index, (names, _)) in zip(company_ids, requests.items()):
+            company = self._format_written_company(
+                names, company_tags[company_id], language, tag_names
+            )
+            results[index].update(status="created", company=company)
+        return results
+
+    @staticmethod
+    def _tag_key(tag_names: Dict[str, str]) -> Tuple[str, str]:
+        """태그를 식별하는 첫 번째 언어의 (언어, 태그명)"""
+        return next(iter(tag_names.items()))
+
+    @staticmethod
+    def _localized_name(tag_names: TagNames, language: str) -> str:
+        """요청된 언어의 태그명, 없으면 첫 번째 태그명"""
+        for language_code, name in tag_names:
+            if language_code == language:
+                return name
+        return tag_names[0][1]
+
+    def _get_tag_names(self, tag_ids: Iterable[int]) -> Dict[int, TagNames]:
+        """태그별 다국어 이름 (태그명 캐시에 없는 태그만 한 번에 조회)"""
+        tag_ids = list(dict.fromkeys(tag_ids))
+        if self.tag_cache is None:
+            return self.tag_repository.get_names_by_tag_ids(tag_ids)
+
+        tag_names, missing = self.tag_cache.get_many(tag_ids)
+        if missing:
+            generation = self.tag_cache.generation
+            fetched = self.tag_repository.get_names_by_tag_ids(missing)
+            self.tag_cache.put_many(fetched, generation)
+            tag_names.update(fetched)
+        return tag_names
+
+    def preload_tag_names(self, limit: int) -> int:
+        """자주 사용되는 태그의 태그명을 태그명 캐시에 미리 저장"""
+        if self.tag_cache is None:
+            return 0
+        return len(self._get_tag_names(self.tag_repository.get_popular_tag_ids(limit)))
+
+    def _get_tag_ids_by_names(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """
+        (언어, 태그명) 의 태그 id (태그명 캐시에 없는 이름만 한 번에 조회)
+        저장된 태그명은 변경/삭제되지 않으므로 캐시된 태그 id 는 그대로 사용한다.
+        """
+        pairs = set(pairs)
+        if self.tag_cache is None:
+            return self.tag_repository.get_tag_ids_by_names(pairs)
+
+        resolved = self.tag_cache.get_tag_ids(pairs)
+        missing = pairs.difference(resolved)
+        if missing:
+            resolved.update(self.tag_repository.get_tag_ids_by_names(missing))
+        return resolved
+
+    def _company_tag_names(self, companies: Iterable[Company]) -> Dict[int, TagNames]:
+        """회사에 연결된 태그의 다국어 이름 (태그명 캐시 또는 함께 조회된 태그명)"""
+        company_tags = [ct for company in companies for ct in company.company_tags]
+        if self.tag_cache is not None:
+            return self._get_tag_names(ct.tag_id for ct in company_tags)
+        return {
+            ct.tag_id: [(tn.language_code, tn.name) for tn in ct.tag.tag_names]
+            for ct in company_tags
+        }
+
+    def _resolve_tags(self, tag_requests: List[Dict[str, str]]) -> List[int]:
+        """
+        태그 요청 목록의 태그 id 를 요청 순서대로 반환 (요청 수와 관계 없이 일정한 횟수의 쿼리)
+        첫 번째 언어의 태그명으로 태그를 찾거나 생성하고,
+        나머지 언어의 태그명은 어디에도 없을 때만 추가한다.
+        동시에 같은 태그명이 저장된 경우 INSERT ... ON CONFLICT 로 먼저 저장된 태그를 사용한다.
+        """
+        pairs = {pair for tag_names in tag_requests for pair in tag_names.items()}
+        resolved = self._get_tag_ids_by_names(pairs)
+
+        # 새 태그는 음수 임시 id 로 표시
+        new_tags: List[Tuple[int, str, str]] = []
+        new_names: List[Tuple[int, str, str]] = []
+        for tag_names in tag_requests:
+            key = self._tag_key(tag_names)
+            if key not in resolved:
+                resolved[key] = -(len(new_tags) + 1)
+                new_tags.append((resolved[key], *key))
+            for pair in tag_names.items():
+                if pair not in resolved:
+                    resolved[pair] = resolved[key]
+                    new_names.append((resolved[key], *pair))
+
+        # 새 태그 생성 후 첫 번째 언어의 태그명 저장
+        created = self.tag_repository.bulk_create_tags(len(new_tags))
+        real_id = {temp_id: tag_id for (temp_id, _, _), tag_id in zip(new_tags, created)}
+        inserted = self.tag_repository.insert_tag_names(
+            [(real_id[temp_id], lang, name) for temp_id, lang, name in new_tags]
+        )
+
+        # 다른 요청이 먼저 저장한 태그명은 해당 태그를 사용하고 생성한 태그는 삭제
+        conflicts = [(lang, name) for _, lang, name in new_tags if (lang, name) not in inserted]
+        if conflicts:
+            winners = self.tag_repository.get_tag_ids_by_names(conflicts)
+            orphans = []
+            for temp_id, lang, name in new_tags:
+                if (lang, name) in winners:
+                    orphans.append(real_id[temp_id])
+                    real_id[temp_id] = winners[(lang, name)]
+            self.tag_repository.delete_tags(orphans)
+
+        # 나머지 언어의 태그명 저장, 기존 태그에 추가된 경우 캐시 무효화 대상
+        inserted = self.tag_repository.insert_tag_names(
+            [(real_id.get(tag_id, tag_id), lang, name) for tag_id, lang, name in new_names]
+        )
+        self._updated_tag_ids.update(set(inserted.values()) - set(created))
+
+        return [
+            real_id.get(resolved[key], resolved[key]) for key in map(self._tag_key, tag_requests)
+        ]
+
+    def _add_tags_to_company(
+        self, company: Company, tag_requests: List[Dict[str, str]]
+    ) -> List[int]:
+        """회사에 태그 추가 후 추가된 태그 id 목록 반환"""
+        tag_ids = list(dict.fromkeys(self._resolve_tags(tag_requests)))
+        for tag_id in tag_ids:
+            self.company_repository.add_company_tag(CompanyTag(company=company, tag_id=tag_id))
+        return tag_ids
+
+    def _index_company_tags(
+        self, company_tags: Dict[int, List[int]], tag_names: Dict[int, TagNames]
+    ) -> None:
+        """저장한 회사와 태그를 태그 검색 색인에 반영"""
+        if not self.tag_index:
+            return
+        for tag_id, names in tag_names.items():
+            self.tag_index.add_tag_names(tag_id, [name for _, name in names])
+        for company_id, tag_ids in company_tags.items():
+            self.tag_index.add_company(company_id, tag_ids)
+
+    def _format_written_company(
+        self,
+        names: Dict[str, str],
+        tag_ids: Iterable[int],
+        language: str,
+        tag_names: Optional[Dict[int, TagNames]] = None,
+    ) -> CompanyResponse:
+        """저장한 회사 정보를 응답 형식으로 변환 (태그명은 한 번에 조회)"""
+        tag_ids = list(tag_ids)
+        if tag_names is None:
+            tag_names = self._get_tag_names(tag_ids)
+        name = names.get(language) or next(iter(names.values()))
+        tags = [self._localized_name(tag_names[tag_id], language) for tag_id in tag_ids]
+        return CompanyResponse.model_construct(company_name=name, tags=sorted(tags))
+
+    def _format_company_response(
+        self,
+        company: Company,
+        language: str,
+        tag_names: Optional[Dict[int, TagNames]] = None,
+    ) -> CompanyResponse:
+        """회사 정보를 응답 형식으로 변환 (tag_names 가 없으면 회사 태그의 이름 조회)"""
         # 요청된 언어의 회사명 찾기
         name = None
         for n in company.company_names:
@@ -85,85 +596,189 @@ class CompanyService:
         if name is None:
             raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
 
-        # 요청된 언어의 태그명 수집
-        tags = []
-        for company_tag in company.company_tags:
-            tag_name = None
-            for tn in company_tag.tag.tag_names:
-                if tn.language_code == language:
-                    tag_name = tn.name
-                    break
-            # 없으면 첫 번째 이름 사용
-            if tag_name is None and company_tag.tag.tag_names:
-                tag_name = company_tag.tag.tag_names[0].name
-            if tag_name:
-                tags.append(tag_name)
-
-        return CompanyResponse(company_name=name, tags=sorted(tags))
+        # 요청된 언어의 태그명 수집 (없으면 첫 번째 이름 사용)
+        if tag_names is None:
+            tag_names = self._company_tag_names([company])
+        tags = [
+            self._localized_name(tag_names[company_tag.tag_id], language)
+            for company_tag in company.company_tags
+            if tag_names.get(company_tag.tag_id)
+        ]
+
+        # DB 에서 읽은 값이므로 다시 검증하지 않음
+        return CompanyResponse.model_construct(company_name=name, tags=sorted(tags))
 
     def search_companies_by_tag(self, tag_query: str, language: str) -> List[CompanyResponse]:
         """
         태그명으로 회사 검색
         """
-        companies = self.tag_repository.get_companies_by_tag_name(tag_query)
+        return self.search_companies_by_tag_page(tag_query, language)[0]
+
+    @read_only
+    def search_companies_by_tag_page(
+        self,
+        tag_query: str,
+        language: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CompanyResponse], Optional[str]]:
+        """
+        태그명으로 회사 검색 (회사 id 기준 keyset pagination)
+        limit 이 주어지면 (회사 목록, 다음 페이지 cursor) 를 반환한다.
+        """
+        if cursor is not None:
+            limit = limit or settings.MAX_SEARCH_LIMIT
+        after = decode_cursor(cursor, ID_CURSOR)[0] if cursor is not None else None
+        # 다음 페이지 확인을 위해 limit + 1 개 조회
+        fetch = limit + 1 if limit is not None else None
+
+        if settings.company_view_enabled:
+            views = self.company_repository.get_views_by_tag_name(tag_query, language, fetch, after)
+            companies = [
+                CompanyResponse.model_construct(company_name=v.company_name, tags=v.tags)
+                for v in views
+            ]
+            return paginate(companies, [(v.company_id,) for v in views], limit)
+
+        if settings.tag_search_projection:
+            rows = self.tag_repository.get_company_projections_by_tag_name(
+                tag_query, language, fetch, after
+            )
+            companies = [
+                CompanyResponse.model_construct(
+                    company_name=row.company_name, tags=sorted(row.tags or [])
+                )
+                for row in rows
+            ]
+            return paginate(companies, [(row.company_id,) for row in rows], limit)
+
+        companies = self.tag_repository.get_companies_by_tag_name(
+            tag_query, fetch, after, with_tag_names=self.tag_cache is None
+        )
 
         # 중복 제거 및 응답 형식으로 변환
-        return [self._format_company_response(company, language) for company in companies]
+        tag_names = self._company_tag_names(companies)
+        return paginate(
+            [self._format_company_response(c, language, tag_names) for c in companies],
+            [(company.id,) for company in companies],
+            limit,
+        )
+
+    @read_only
+    def search_companies_by_tag_query(
+        self,
+        expression: str,
+        language: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CompanyResponse], Optional[str]]:
+        """
+        태그 검색식(AND / OR / NOT, 괄호, 따옴표)으로 회사 검색 (회사 id 기준 keyset pagination)
+        색인(없으면 DB)에서 회사 id 를 찾은 뒤 해당 페이지의 회사만 한 번에 조회한다.
+        """
+        try:
+            query = parse_tag_query(expression)
+        except TagQuerySyntaxError as e:
+            raise HTTPException(status_code=400, detail=f"잘못된 태그 검색식 입니다. {e}")
+
+        if cursor is not None:
+            limit = limit or settings.MAX_SEARCH_LIMIT
+        after = decode_cursor(cursor, ID_CURSOR)[0] if cursor is not None else None
+        # 다음 페이지 확인을 위해 limit + 1 개 조회
+        fetch = limit + 1 if limit is not None else None
+
+        company_ids = self.tag_index.search(query, after, fetch) if self.tag_index else None
+        if company_ids is None:
+            company_ids = self.tag_repository.get_company_ids_by_tag_query(query, fetch, after)
+        company_ids, next_cursor = paginate(company_ids, [(i,) for i in company_ids], limit)
+
+        if settings.company_view_enabled:
+            views = self.company_repository.get_views_by_ids(company_ids, language)
+            companies = [
+                CompanyResponse.model_construct(company_name=v.company_name, tags=v.tags)
+                for v in views
+            ]
+        else:
+            hydrated = self.company_repository.get_companies_by_ids(
+                company_ids, with_tag_names=self.tag_cache is None
+            )
+            tag_names = self._company_tag_names(hydrated)
+            companies = [self._format_company_response(c, language, tag_names) for c in hydrated]
+        return companies, next_cursor
 
     def _add_company_to_tags(
         self, company_name: str, tag_requests: List[TagNameRequest], language: str
     ) -> CompanyResponse:
         """회사에 태그 추가"""
         # 회사 조회
-        company = self.company_repository.get_by_name(company_name)
+        company = self.company_repository.get_by_name(
+            company_name, with_tag_names=self.tag_cache is None
+        )
         if not company:
             raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
 
-        # 태그 추가
-        for tag_request in tag_requests:
-            # 중복 확인
-            for lang, name in tag_request.tag_name.items():
-                existing_tag = self.tag_repository.get_by_name(name, lang)
-                if existing_tag:
-                    raise HTTPException(status_code=400, detail="태그가 이미 존재합니다.")
-            self._add_tag_to_company(company, tag_request.tag_name)
+        with self._unit_of_work():
+            # 중복 확인 (모든 태그명을 한 번에 조회)
+            pairs = [pair for tag_request in tag_requests for pair in tag_request.tag_name.items()]
+            if self._get_tag_ids_by_names(pairs):
+                raise HTTPException(status_code=400, detail="태그가 이미 존재합니다.")
 
-        # 다 되면 적용
-        self.company_repository.db.commit()
-        return self._format_company_response(company, language)
+            # 태그 추가
+            tag_ids = [company_tag.tag_id for company_tag in company.company_tags]
+            tag_ids += self._add_tags_to_company(company, [t.tag_name for t in tag_requests])
+            self._refresh_company_view([company.id])
+            self._bump_versions([company.id])
+
+        self._invalidate_cache(company)
+        tag_ids = list(dict.fromkeys(tag_ids))
+        tag_names = self._get_tag_names(tag_ids)
+        self._index_company_tags({company.id: tag_ids}, tag_names)
+        self._bump_catalog_version([company.id])
+        names = {n.language_code: n.name for n in company.company_names}
+        return self._format_written_company(names, tag_ids, language, tag_names)
 
     def delete_company_tag(
         self, company_name: str, tag_name: str, language: str
     ) -> CompanyResponse:
         """회사의 태그 삭제"""
         # 회사 조회
-        company = self.company_repository.get_by_name(company_name)
+        company = self.company_repository.get_by_name(
+            company_name, with_tag_names=self.tag_cache is None
+        )
         if not company:
             raise HTTPException(status_code=404, detail="회사를 찾을수 없습니다.")
 
         # 태그 조회
+        tag_names = self._company_tag_names([company])
         tag_to_delete = None
         for company_tag in company.company_tags:
-            for tag in company_tag.tag.tag_names:
-                if tag.name == tag_name and tag.language_code == language:
-                    tag_to_delete = company_tag.tag
-                    company.company_tags.remove(company_tag)
-                    break
-            if tag_to_delete:
+            if (language, tag_name) in tag_names.get(company_tag.tag_id, ()):
+                tag_to_delete = company_tag
                 break
 
         if not tag_to_delete:
             raise HTTPException(status_code=404, detail="회사에 연결된 태그를 찾을수 없습니다.")
 
-        if len(company.company_tags) == 0:
+        if len(company.company_tags) == 1:
             raise HTTPException(status_code=400, detail="회사에 최소 하나의 태그가 연결돼 있어야 합니다.")
 
-        # 회사와 태그 연결 삭제
-        success = self.company_repository.remove_company_tag(company.id, tag_to_delete.id)
-        if not success:
-            raise HTTPException(status_code=404, detail="태그 삭제 실패")
+        with self._unit_of_work():
+            # 회사와 태그 연결 삭제
+            success = self.company_repository.remove_company_tag(company.id, tag_to_delete.tag_id)
+            if not success:
+                raise HTTPException(status_code=404, detail="태그 삭제 실패")
+            # DB 에서 이미 삭제되었으므로 flush 대상이 되지 않도록 로드된 컬렉션만 갱신
+            set_committed_value(
+                company,
+                "company_tags",
+                [ct for ct in company.company_tags if ct is not tag_to_delete],
+            )
+            self._refresh_company_view([company.id])
+            self._bump_versions([company.id])
 
-        # 다 되면 적용
-        self.company_repository.db.commit()
+        if self.tag_index:
+            self.tag_index.remove_company_tag(company.id, tag_to_delete.tag_id)
+        self._invalidate_cache(company)
+        self._bump_catalog_version([company.id], [tag_to_delete.tag_id])
 
-        return self._format_company_response(company, language)
+        return self._format_company_response(company, language, tag_names)
@@ -0,0 +1,148 @@
+import difflib
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from starlette.routing import Match
+
+from app.common.database import engine
+from app.common.dependencies import get_db, get_db_factory
+from app.common.instrumentation import statement_shape
+from app.common.routing import RoutingSession
+from app.main import app
+
+# 엔드포인트 (method, 경로 템플릿) 별 요청 한 번에 허용하는 SQL 실행 횟수
+# 태그/회사명 개수와 관계 없이 일정해야 하므로 요청 내용에 따라 늘어나면 N+1 로 판단한다.
+# 조회는 ETag 버전 확인 1 회, 변경은 회사 버전 / 회사 목록 버전 증가 2 회를 포함한다.
+QUERY_BUDGETS: Dict[Tuple[str, str], int] = {
+    ("GET", "/search"): 2,
+    ("GET", "/companies/{company_name}"): 2,
+    ("POST", "/companies"): 11,
+    ("POST", "/companies/bulk"): 14,
+    ("GET", "/tags"): 2,
+    ("GET", "/tags/query"): 2,
+    ("PUT", "/companies/{company_name}/tags"): 10,
+    ("DELETE", "/companies/{company_name}/tags/{tag_name}"): 4,
+}
+
+# 테스트용 세션의 savepoint 는 요청에서 실행한 SQL 이 아니므로 제외
+SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryRecorder:
+    """엔진에서 실행된 SQL 기록 (TestClient 는 별도 스레드에서 앱을 실행하므로 엔진 단위로 수집)"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(SAVEPOINT_PREFIXES):
+            self.statements.append(statement)
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(engine, "before_cursor_execute", self)
+
+    @property
+    def shapes(self) -> List[str]:
+        return [statement_shape(statement) for statement in self.statements]
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+
+def statement_diff(expected: List[str], actual: List[str]) -> str:
+    """SQL 형태 목록의 unified diff"""
+    return "\n".join(difflib.unified_diff(expected, actual, "expected", "actual", lineterm=""))
+
+
+def budget_report(endpoint: str, budget: int, shapes: List[str]) -> str:
+    """
+    허용 횟수를 넘은 요청의 SQL 목록
+    같은 형태가 반복된 경우 한 번씩만 실행했을 때와의 diff 를 함께 출력한다.
+    """
+    lines = [f"{endpoint}: SQL {len(shapes)} 회 실행 (허용 {budget} 회)"]
+    lines += [f"{number:>3}. {shape}" for number, shape in enumerate(shapes, 1)]
+    diff = statement_diff(list(dict.fromkeys(shapes)), shapes)
+    if diff:
+        lines += ["반복 실행된 SQL:", diff]
+    return "\n".join(lines)
+
+
+def route_template(method: str, path: str) -> Optional[str]:
+    scope = {"type": "http", "method": method, "path": path}
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return None
+
+
+class BudgetClient(TestClient):
+    """
+    요청마다 실행된 SQL 을 기록하고 QUERY_BUDGETS 를 넘으면 실패하는 TestClient
+    실패 메시지에는 실행된 SQL 형태와 반복 실행된 SQL 의 diff 를 출력한다.
+    """
+
+    def __init__(self, *args, budgets: Dict[Tuple[str, str], int] = QUERY_BUDGETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budgets = budgets
+        # 마지막 요청에서 실행된 SQL
+        self.queries = QueryRecorder()
+
+    def request(self, method, url, *args, **kwargs):
+        self.queries.clear()
+        with self.queries:
+            response = super().request(method, url, *args, **kwargs)
+
+        endpoint = (method.upper(), route_template(method.upper(), response.request.url.path))
+        budget = self.budgets.get(endpoint)
+        shapes = self.queries.shapes
+        if budget is not None and len(shapes) > budget:
+            pytest.fail(budget_report(" ".join(endpoint), budget, shapes), pytrace=False)
+        return response
+
+
+@pytest.fixture
+def db():
+    """테스트 종료 후 롤백되는 세션, 실행된 SQL 은 db.statements 에 기록"""
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = RoutingSession(
+            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+        session.statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            session.statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        yield session
+        session.close()
+        transaction.rollback()
+
+
+@pytest.fixture
+def api_db(db):
+    """API 요청도 db 세션을 사용 (single flight 계산 포함, 테스트 종료 후 롤백)"""
+
+    @asynccontextmanager
+    async def open_db():
+        yield db
+
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_db_factory] = lambda: open_db
+    yield db
+    app.dependency_overrides.pop(get_db)
+    app.dependency_overrides.pop(get_db_factory)
+
+
+@pytest.fixture
+def budget_client():
+    """SQL 실행 횟수를 검사하는 TestClient"""
+    return BudgetClient(app)
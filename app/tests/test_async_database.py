@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.common import utils
+from app.config.settings import Settings
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+pytest.importorskip("asyncpg")
+
+settings = Settings()
+
+
+def run_with_async_sessions(handler, count: int):
+    """count 개의 AsyncSession 으로 handler 를 동시에 실행"""
+
+    async def main():
+        engine = create_async_engine(settings.async_database_url, pool_size=count)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def run(index):
+            async with session_factory() as session:
+                return await handler(session.sync_session, index)
+
+        try:
+            return await asyncio.gather(*(run(i) for i in range(count)))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_service_runs_on_async_session():
+    """동기 service 가 AsyncSession 위에서 그대로 동작해야 합니다."""
+
+    async def handler(db, _):
+        service = CompanyService(CompanyRepository(db), TagRepository(db))
+        return await utils.run_db(db, service.get_company_by_name, "Wantedlab", "ko")
+
+    responses = run_with_async_sessions(handler, 4)
+
+    assert {response.company_name for response in responses} == {"원티드랩"}
+
+
+def test_queries_in_flight_concurrently():
+    """여러 요청의 쿼리가 이벤트 루프를 막지 않고 동시에 실행되어야 합니다."""
+
+    def sleep_query(db):
+        db.execute(text("SELECT pg_sleep(0.2)"))
+
+    async def handler(db, _):
+        await utils.run_db(db, sleep_query, db)
+
+    started = time.perf_counter()
+    run_with_async_sessions(handler, 5)
+
+    assert time.perf_counter() - started < 0.2 * 5 / 2
@@ -0,0 +1,55 @@
+import io
+from collections import Counter
+
+from app.benchmarks.datagen import generate_rows, write_csv
+from app.benchmarks.runner import Workload, compare, percentile
+
+
+def test_datagen_deterministic():
+    """같은 seed 로 생성한 데이터는 항상 같아야 하고 회사명은 언어별로 겹치지 않아야 합니다."""
+    first, second = io.StringIO(), io.StringIO()
+    assert write_csv(generate_rows(2000, seed=7), first) == 2000
+    write_csv(generate_rows(2000, seed=7), second)
+    assert first.getvalue() == second.getvalue()
+
+    rows = list(generate_rows(2000, seed=7))
+    for column in ("company_ko", "company_en", "company_ja"):
+        names = [row[column] for row in rows if row[column]]
+        assert len(names) == len(set(names))
+    assert all(row["company_ko"] or row["company_en"] or row["company_ja"] for row in rows)
+
+
+def test_datagen_zipf_tags():
+    """태그 인기도는 소수의 태그에 몰려야 합니다."""
+    rows = list(generate_rows(5000, tag_count=100))
+    counts = Counter(tag for row in rows for tag in row["tag_ko"].split("|"))
+    popular = [count for _, count in counts.most_common()]
+
+    assert len(counts) <= 100
+    assert sum(popular[:10]) > sum(popular[10:])
+    assert all(1 <= len(row["tag_ko"].split("|")) <= 4 for row in rows)
+
+
+def test_workload_requests():
+    """CSV 행의 회사명/태그명으로 요청을 생성해야 합니다."""
+    workload = Workload(list(generate_rows(50)), limit=5)
+
+    method, url, options = workload.search()
+    assert (method, url, options["params"]["limit"]) == ("GET", "/search", 5)
+    method, url, options = workload.create()
+    assert method == "POST" and options["json"]["company_name"]["ko"].endswith(" 1")
+    _, url, options = workload.add_tags()
+    assert url.endswith("/tags") and options["json"][0]["tag_name"]["ko"].endswith("_2")
+
+
+def test_percentile_and_compare():
+    values = [float(value) for value in range(1, 101)]
+    assert [percentile(values, q) for q in (50, 95, 99)] == [50.0, 95.0, 99.0]
+    assert percentile([], 50) == 0.0
+
+    result = {"scenario": "company", "concurrency": 8, "requests_per_second": 110.0}
+    result.update(p50_ms=9.0, p95_ms=20.0, p99_ms=30.0)
+    baseline = {"results": [{**result, "requests_per_second": 100.0, "p95_ms": 25.0}]}
+    compare([result], baseline)
+    assert result["change"]["requests_per_second"] == 10.0
+    assert result["change"]["p95_ms"] == -20.0
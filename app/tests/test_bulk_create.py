@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+@pytest.fixture
+def statements(api_db):
+    """API 요청에서 실행된 SQL (테스트 종료 후 롤백)"""
+    return api_db.statements
+
+
+@pytest.fixture
+def api():
+    return TestClient(app)
+
+
+def company(index, tags=("4",)):
+    return {
+        "company_name": {"ko": f"벌크 회사 {index}", "en": f"Bulk Company {index}"},
+        "tags": [{"tag_name": {"ko": f"태그_{tag}", "en": f"tag_{tag}"}} for tag in tags],
+    }
+
+
+def test_bulk_create_json(api, statements):
+    """JSON 배열로 여러 회사를 생성하고 항목별 결과를 반환해야 합니다."""
+    items = [company(i, tags=("4", "bulk", f"bulk_{i % 5}")) for i in range(50)]
+    resp = api.post("/companies/bulk", json=items, headers=HEADERS)
+
+    results = resp.json()
+    assert resp.status_code == 200
+    assert [r["status"] for r in results] == ["created"] * 50
+    assert results[0] == {
+        "index": 0,
+        "status": "created",
+        "company": {"company_name": "벌크 회사 0", "tags": ["태그_4", "태그_bulk", "태그_bulk_0"]},
+    }
+    # 항목 수와 관계 없이 일정한 횟수의 쿼리로 처리 (회사 목록 버전 증가 트랜잭션 포함)
+    assert len(statements) <= 14
+
+    resp = api.get("/companies/Bulk Company 7", headers=[("x-wanted-language", "en")])
+    assert resp.json() == {
+        "company_name": "Bulk Company 7",
+        "tags": ["tag_4", "tag_bulk", "tag_bulk_2"],
+    }
+
+
+def test_bulk_create_ndjson(api, statements):
+    """NDJSON 요청의 잘못된 줄, 중복 회사는 해당 항목만 실패해야 합니다."""
+    lines = [
+        json.dumps(company(1)),
+        "{not json",
+        json.dumps({"company_name": {"ko": "원티드랩"}, "tags": []}),
+        json.dumps(company(1)),
+        json.dumps({"company_name": {"ko": "벌크 회사 2"}, "tags": [{"tag_name": {"xx": "a"}}]}),
+        json.dumps(company(3)),
+    ]
+    resp = api.post(
+        "/companies/bulk",
+        content="\n".join(lines),
+        headers={**HEADERS, "content-type": "application/x-ndjson"},
+    )
+
+    results = resp.json()
+    assert resp.status_code == 200
+    assert [r["status"] for r in results] == [
+        "created",
+        "error",
+        "error",
+        "error",
+        "error",
+        "created",
+    ]
+    assert results[2]["detail"] == "회사가 이미 존재합니다."
+    assert results[3]["detail"] == "회사가 이미 존재합니다."
+    assert results[4]["detail"] == "잘못된 언어코드 입니다."
+    assert results[5]["company"]["company_name"] == "벌크 회사 3"
+
+
+def test_bulk_create_limits(api, statements, monkeypatch):
+    """잘못된 형식이나 최대 개수를 넘는 요청은 거절해야 합니다."""
+    from app.routers import company as company_router
+
+    resp = api.post("/companies/bulk", content="{", headers=HEADERS)
+    assert resp.status_code == 400
+
+    monkeypatch.setattr(company_router.settings, "MAX_BULK_SIZE", 2)
+    resp = api.post("/companies/bulk", json=[company(i) for i in range(3)], headers=HEADERS)
+    assert resp.status_code == 413
@@ -0,0 +1,284 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fakeredis
+import pytest
+from sqlalchemy.util import greenlet_spawn
+
+from app.common.greenlet_redis import GreenletRedis, greenlet_sleep
+from app.repositories.cache_repository import CacheRepository
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services import company_service
+from app.services.company_service import CompanyService
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeStrictRedis(decode_responses=True)
+
+
+@pytest.fixture
+def service(db, redis_client, monkeypatch):
+    """버전 없는 키를 사용하는 (ETag 미사용) 캐시 서비스"""
+    monkeypatch.setattr(company_service.settings, "etag_enabled", False)
+    company_repository = CompanyRepository(db)
+    service = CompanyService(
+        company_repository,
+        TagRepository(db),
+        cache_repository=CacheRepository(redis_client),
+    )
+
+    # DB 조회 횟수 기록
+    service.db_calls = 0
+    get_by_name = company_repository.get_by_name
+    search_by_name_partial = company_repository.search_by_name_partial
+
+    def counted(func):
+        def wrapper(*args, **kwargs):
+            service.db_calls += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    company_repository.get_by_name = counted(get_by_name)
+    company_repository.search_by_name_partial = counted(search_by_name_partial)
+    return service
+
+
+def test_company_detail_read_through(service, redis_client):
+    """회사 상세 조회는 두번째 요청부터 캐시에서 응답해야 합니다."""
+    stats = CacheRepository.get_stats()
+    first = service.get_company_by_name("Wantedlab", "ko")
+    second = service.get_company_by_name("Wantedlab", "ko")
+
+    assert first == second
+    assert service.db_calls == 1
+    assert redis_client.exists("company:ko:Wantedlab")
+    assert CacheRepository.get_stats()["hits"] == stats["hits"] + 1
+    assert CacheRepository.get_stats()["misses"] == stats["misses"] + 1
+
+
+def test_company_detail_invalidated_on_tag_delete(service, redis_client):
+    """회사 태그 삭제 시 해당 회사의 모든 이름/언어 캐시가 삭제되어야 합니다."""
+    service.get_company_by_name("원티드랩", "ko")
+    service.get_company_by_name("Wantedlab", "en")
+    service.get_company_by_name("OKAY.com", "ko")
+
+    service.delete_company_tag("원티드랩", "태그_16", "ko")
+
+    assert not redis_client.exists("company:ko:원티드랩")
+    assert not redis_client.exists("company:en:Wantedlab")
+    assert redis_client.exists("company:ko:OKAY.com")
+    assert "tag_16" not in service.get_company_by_name("Wantedlab", "en").tags
+
+
+def test_versioned_company_cache_not_deleted(db, redis_client):
+    """ETag 사용 시 상세 조회 캐시는 버전으로 무효화하므로 변경 시 삭제하지 않아야 합니다."""
+    service = CompanyService(
+        CompanyRepository(db), TagRepository(db), cache_repository=CacheRepository(redis_client)
+    )
+    _, version = service.get_company_version("원티드랩")
+    service.get_company_json_by_name("원티드랩", "ko", version)
+    # 버전 없이 조회하면 무효화되지 않는 키이므로 캐시하지 않음
+    service.get_company_json_by_name("원티드랩", "en")
+    assert redis_client.keys("company:*") == [f"company:ko:원티드랩:{version}"]
+
+    deleted = []
+    service.cache_repository.delete_keys = lambda keys: deleted.extend(keys)
+    service.delete_company_tag("원티드랩", "태그_16", "ko")
+    assert deleted == []
+    assert redis_client.exists(f"company:ko:원티드랩:{version}")
+
+    _, new_version = service.get_company_version("원티드랩")
+    assert new_version != version
+    assert "태그_16" not in service.get_company_by_name("원티드랩", "ko", new_version).tags
+
+
+def test_search_invalidated_on_create(service, redis_client):
+    """회사 생성 시 회사명이 추가된 언어의 검색 캐시가 삭제되어야 합니다."""
+    assert service.search_companies_by_name("링크", "ko") == service.search_companies_by_name(
+        "링크", "ko"
+    )
+    service.search_companies_by_name("link", "en")
+    assert service.db_calls == 2
+
+    service.create_company(
+        CompanyRequest(
+            company_name=CompanyNameRequest(ko="링크 캐시 테스트"),
+            tags=[TagNameRequest(tag_name={"ko": "태그_4"})],
+        ),
+        "ko",
+    )
+
+    assert redis_client.get("generation:search:ko") == "1"
+    assert not redis_client.exists("generation:search:en")
+    assert {"company_name": "링크 캐시 테스트"} in service.search_companies_by_name("링크", "ko")
+
+
+def test_search_cache_key_per_query(service, redis_client):
+    """검색 캐시는 검색어별 키에 각자의 만료 시간으로 저장되어야 합니다."""
+    service.search_companies_by_name("링크", "ko")
+    service.search_companies_by_name("원티드", "ko")
+
+    keys = redis_client.keys("search:ko:*")
+    assert len(keys) == 2
+    assert all(0 < redis_client.ttl(key) <= 90 for key in keys)
+    # 이미 저장된 검색어의 만료 시간은 다른 검색어 저장으로 연장되지 않음
+    redis_client.expire(keys[0], 5)
+    service.search_companies_by_name("랩", "ko")
+    assert redis_client.ttl(keys[0]) <= 5
+
+
+def test_cache_failure_falls_back_to_database(db):
+    """Redis 장애 시에도 DB 에서 조회되어야 합니다."""
+    server = fakeredis.FakeServer()
+    server.connected = False
+    service = CompanyService(
+        CompanyRepository(db),
+        TagRepository(db),
+        cache_repository=CacheRepository(fakeredis.FakeStrictRedis(server=server)),
+    )
+
+    assert service.get_company_by_name("Wantedlab", "ko").company_name == "원티드랩"
+
+
+def test_pipelined_helpers(redis_client):
+    """MGET/MSET/EXPIRE 묶음 처리"""
+    cache_repository = CacheRepository(redis_client)
+    cache_repository.set_many({"a": "1", "b": "2"}, timeout=30)
+
+    assert cache_repository.get_many(["a", "missing", "b"]) == ["1", None, "2"]
+    assert 0 < redis_client.ttl("a") <= 30
+
+    cache_repository.expire_many(["a", "b"], timeout=300)
+    assert 30 < redis_client.ttl("b") <= 300
+
+
+class Counted:
+    """호출 횟수를 기록하는 compute 함수"""
+
+    def __init__(self, value="fresh", delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+def expire(redis_client, key):
+    """만료 시각을 지난 것으로 변경 (값은 stale 로 남음)"""
+    redis_client.set(f"meta:{key}", "0 0.01")
+
+
+def test_get_or_compute_stale_while_refreshing(redis_client):
+    """만료된 값은 lease 를 얻은 요청만 다시 계산하고 나머지는 이전 값을 반환해야 합니다."""
+    cache_repository = CacheRepository(redis_client)
+    assert cache_repository.get_or_compute("k", Counted("old"), 60, stale_ttl=30) == "old"
+    assert 60 < redis_client.ttl("k") <= 90
+    expire(redis_client, "k")
+
+    # 다른 워커가 갱신 중이면 stale 값 반환
+    redis_client.set("lease:k", "other", px=1000)
+    compute = Counted("new")
+    assert cache_repository.get_or_compute("k", compute, 60, stale_ttl=30) == "old"
+    assert compute.calls == 0
+
+    redis_client.delete("lease:k")
+    assert cache_repository.get_or_compute("k", compute, 60, stale_ttl=30) == "new"
+    assert cache_repository.get_or_compute("k", compute, 60, stale_ttl=30) == "new"
+    assert compute.calls == 1
+    assert not redis_client.exists("lease:k")
+
+
+def test_get_or_compute_single_flight(redis_client):
+    """값이 없을 때 동시 요청 중 하나만 계산하고 나머지는 그 결과를 받아야 합니다."""
+    cache_repository = CacheRepository(redis_client)
+    compute = Counted("value", delay=0.1)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(cache_repository.get_or_compute, "k", compute, 60, wait=2.0)
+            for _ in range(10)
+        ]
+        results = [future.result() for future in futures]
+
+    assert results == ["value"] * 10
+    assert compute.calls == 1
+    assert redis_client.get("k") == "value"
+
+
+def test_get_or_compute_early_refresh(redis_client, monkeypatch):
+    """만료 전이라도 계산 시간이 길고 만료가 가까우면 미리 갱신해야 합니다."""
+    cache_repository = CacheRepository(redis_client)
+    cache_repository.get_or_compute("k", Counted("old"), 60)
+    redis_client.set("meta:k", f"{time.time() + 1} 0.5")
+
+    compute = Counted("new")
+    monkeypatch.setattr(random, "random", lambda: 0.99)
+    assert cache_repository.get_or_compute("k", compute, 60, beta=0) == "old"
+    assert cache_repository.get_or_compute("k", compute, 60, beta=1.0) == "new"
+    assert compute.calls == 1
+
+    monkeypatch.setattr(random, "random", lambda: 0.0)
+    assert cache_repository.get_or_compute("k", compute, 60, beta=1.0) == "new"
+    assert compute.calls == 1
+
+
+def test_invalidated_value_not_served_stale(service, redis_client):
+    """무효화된 캐시는 stale 값으로도 사용하지 않아야 합니다."""
+    service.get_company_by_name("Wantedlab", "ko")
+    assert redis_client.exists("meta:company:ko:Wantedlab")
+
+    service.delete_company_tag("원티드랩", "태그_16", "ko")
+    redis_client.set("lease:company:ko:Wantedlab", "other", px=1000)
+
+    assert not redis_client.exists("meta:company:ko:Wantedlab")
+    assert "태그_16" not in service.get_company_by_name("Wantedlab", "ko").tags
+
+
+def test_async_client_get_or_compute():
+    """async 모드의 비동기 클라이언트로도 (run_db 와 같은 greenlet 안) 캐시를 사용할 수 있어야 합니다."""
+
+    async def main():
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        cache_repository = CacheRepository(GreenletRedis(redis_client), sleep=greenlet_sleep)
+        compute = Counted("value")
+        for _ in range(2):
+            result = await greenlet_spawn(cache_repository.get_or_compute, "k", compute, 60)
+            assert result == "value"
+        assert compute.calls == 1
+        assert await redis_client.exists("meta:k")
+        # lease 는 WATCH 후 삭제
+        assert not await redis_client.exists("lease:k")
+
+    asyncio.run(main())
+
+
+def test_async_client_wait_does_not_block_loop():
+    """lease 를 얻은 요청의 결과를 기다리는 동안 이벤트 루프의 다른 요청이 실행되어야 합니다."""
+
+    async def main():
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        cache_repository = CacheRepository(GreenletRedis(redis_client), sleep=greenlet_sleep)
+        await redis_client.set("lease:k", "other", px=1000)
+
+        async def other_request():
+            await asyncio.sleep(0.05)
+            await redis_client.set("k", "value")
+
+        task = asyncio.create_task(other_request())
+        compute = Counted("computed")
+        result = await greenlet_spawn(cache_repository.get_or_compute, "k", compute, 60, wait=1.0)
+        await task
+        return result, compute.calls
+
+    assert asyncio.run(main()) == ("value", 0)
@@ -0,0 +1,97 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, text
+
+from app.models.company import CompanyName
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services import company_service
+from app.services.company_service import CompanyService
+
+LANGUAGES = ["ko", "en", "jp", "tw"]
+
+
+@pytest.fixture
+def db(db):
+    """company_view 를 다시 만든 세션"""
+    CompanyRepository(db).refresh_company_view()
+    return db
+
+
+@pytest.fixture
+def service(db, monkeypatch):
+    monkeypatch.setattr(company_service.settings, "company_view_enabled", True)
+    return CompanyService(CompanyRepository(db), TagRepository(db))
+
+
+def read(service, monkeypatch, method, *args):
+    """company_view 를 사용하지 않고 조회"""
+    monkeypatch.setattr(company_service.settings, "company_view_enabled", False)
+    try:
+        return getattr(service, method)(*args)
+    finally:
+        monkeypatch.setattr(company_service.settings, "company_view_enabled", True)
+
+
+def test_view_matches_normalized_reads(db, service, monkeypatch):
+    """company_view 조회 결과는 정규화된 테이블 조회 결과와 같아야 합니다."""
+    names = db.execute(select(CompanyName.name).order_by(CompanyName.id).limit(30)).scalars()
+    tag_names = db.execute(select(TagName.name).order_by(TagName.id).limit(30)).scalars()
+
+    for name in names.all():
+        for language in LANGUAGES:
+            expected = read(service, monkeypatch, "get_company_by_name", name, language)
+            assert service.get_company_by_name(name, language) == expected
+    for tag_name in tag_names.all():
+        for language in LANGUAGES:
+            expected = read(service, monkeypatch, "search_companies_by_tag", tag_name, language)
+            assert service.search_companies_by_tag(tag_name, language) == expected
+
+    with pytest.raises(HTTPException):
+        service.get_company_by_name("없는 회사", "ko")
+
+
+def test_view_maintained_by_writes(db, service, monkeypatch):
+    """회사 생성, 태그 추가/삭제 시 관련된 회사의 company_view 가 갱신되어야 합니다."""
+    created = service.create_company(
+        CompanyRequest(
+            company_name=CompanyNameRequest(ko="조회 모델 회사", en="View Company"),
+            tags=[
+                TagNameRequest(tag_name={"ko": "태그_4", "tw": "tag_4_tw"}),
+                TagNameRequest(tag_name={"ko": "조회 모델 태그", "en": "view_tag"}),
+            ],
+        ),
+        "en",
+    )
+    assert created == service.get_company_by_name("조회 모델 회사", "en")
+    # 기존 태그에 추가된 대만어 태그명은 해당 태그가 연결된 다른 회사에도 반영
+    assert "tag_4_tw" in service.get_company_by_name("원티드랩", "tw").tags
+    assert {c.company_name for c in service.search_companies_by_tag("view_tag", "ko")} == {
+        "조회 모델 회사"
+    }
+
+    service._add_company_to_tags(
+        "View Company", [TagNameRequest(tag_name={"ko": "조회 모델 태그 2"})], "ko"
+    )
+    service.delete_company_tag("View Company", "view_tag", "en")
+
+    expected = read(service, monkeypatch, "get_company_by_name", "View Company", "ko")
+    assert service.get_company_by_name("View Company", "ko") == expected
+    assert expected.tags == ["조회 모델 태그 2", "태그_4"]
+
+
+def test_view_lookup_uses_index(db):
+    """회사명 조회는 company_view 의 GIN 인덱스를 사용해야 합니다."""
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(
+        db.execute(
+            text(
+                "EXPLAIN SELECT * FROM company_view "
+                "WHERE language_code = 'ko' AND all_names @> ARRAY['원티드랩']::varchar[]"
+            )
+        ).scalars()
+    )
+
+    assert "ix_company_view_all_names_ko" in plan
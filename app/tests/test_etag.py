@@ -0,0 +1,133 @@
+import fakeredis
+import pytest
+
+from app.common.http_cache import entity_tag, etag_matches
+from app.repositories.cache_repository import CacheRepository
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+def revalidate(api, url, etag, **kwargs):
+    return api.get(url, headers={**HEADERS, "If-None-Match": etag}, **kwargs)
+
+
+def test_etag_matches():
+    """If-None-Match 의 목록, weak 비교, * 를 처리해야 합니다."""
+    etag = entity_tag("company", 1, 2, "ko")
+    assert etag == '"company-1-2-ko"'
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"company-1-3-ko"', etag)
+
+
+def test_company_not_modified(api_db, budget_client):
+    """변경되지 않은 회사는 버전만 확인하고 본문 없이 304 로 응답해야 합니다."""
+    resp = budget_client.get("/companies/원티드랩", headers=HEADERS)
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"].endswith("must-revalidate")
+    assert resp.headers["vary"] == "X-Wanted-Language"
+
+    resp = revalidate(budget_client, "/companies/원티드랩", etag)
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    # 회사명/태그를 조회하지 않음
+    assert len(budget_client.queries.statements) == 1
+
+    # 언어가 다르면 다른 응답
+    resp = budget_client.get(
+        "/companies/원티드랩", headers={"x-wanted-language": "en", "If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+
+def test_company_etag_changes_on_write(api_db, budget_client):
+    """태그 추가/삭제 후에는 이전 ETag 로 확인해도 새 응답을 받아야 합니다."""
+    etag = budget_client.get("/companies/원티드랩", headers=HEADERS).headers["etag"]
+
+    tags = [{"tag_name": {"ko": "ETag 태그", "en": "etag_tag"}}]
+    assert budget_client.put("/companies/원티드랩/tags", json=tags, headers=HEADERS).is_success
+    resp = revalidate(budget_client, "/companies/원티드랩", etag)
+    assert resp.status_code == 200
+    assert "ETag 태그" in resp.json()["tags"]
+    etag = resp.headers["etag"]
+
+    resp = budget_client.delete("/companies/원티드랩/tags/ETag 태그", headers=HEADERS)
+    assert resp.is_success
+    resp = revalidate(budget_client, "/companies/원티드랩", etag)
+    assert resp.status_code == 200
+    assert "ETag 태그" not in resp.json()["tags"]
+
+
+def test_tag_name_added_changes_linked_companies(api_db, budget_client):
+    """기존 태그에 다른 언어 이름이 추가되면 태그가 연결된 회사의 ETag 도 바뀌어야 합니다."""
+    headers = {"x-wanted-language": "tw"}
+    etag = budget_client.get("/companies/원티드랩", headers=headers).headers["etag"]
+
+    body = {
+        "company_name": {"ko": "ETag 회사"},
+        "tags": [{"tag_name": {"ko": "태그_4", "tw": "tw_tag_4"}}],
+    }
+    assert budget_client.post("/companies", json=body, headers=HEADERS).is_success
+
+    resp = budget_client.get("/companies/원티드랩", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert "tw_tag_4" in resp.json()["tags"]
+
+
+@pytest.mark.parametrize(
+    "url, params",
+    [("/search", {"query": "원티드"}), ("/tags", {"query": "태그_4", "limit": 2})],
+)
+def test_catalog_not_modified(api_db, budget_client, url, params):
+    """회사 목록은 회사/태그가 변경되기 전까지 304 로 응답해야 합니다."""
+    resp = budget_client.get(url, params=params, headers=HEADERS)
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+
+    resp = revalidate(budget_client, url, etag, params=params)
+    assert resp.status_code == 304
+    assert len(budget_client.queries.statements) == 1
+
+    body = {"company_name": {"ko": "원티드 ETag"}, "tags": [{"tag_name": {"ko": "태그_4"}}]}
+    assert budget_client.post("/companies", json=body, headers=HEADERS).is_success
+    resp = revalidate(budget_client, url, etag, params=params)
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+
+def test_missing_company_has_no_etag(api_db, budget_client):
+    resp = budget_client.get("/companies/없는회사", headers=HEADERS)
+    assert resp.status_code == 404
+    assert "etag" not in resp.headers
+
+
+def test_etag_disabled(api_db, budget_client, monkeypatch):
+    from app.routers import company
+
+    monkeypatch.setattr(company.settings, "etag_enabled", False)
+    resp = budget_client.get("/companies/원티드랩", headers={**HEADERS, "If-None-Match": "*"})
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
+    assert len(budget_client.queries.statements) == 1
+
+
+def test_cache_keyed_by_version(db):
+    """버전이 주어지면 버전별 캐시를 사용하여 이전 버전의 응답을 새 ETag 로 보내지 않아야 합니다."""
+    redis_client = fakeredis.FakeStrictRedis(decode_responses=True)
+    service = CompanyService(
+        CompanyRepository(db), TagRepository(db), cache_repository=CacheRepository(redis_client)
+    )
+    _, version = service.get_company_version("원티드랩")
+    service.get_company_json_by_name("원티드랩", "ko", version)
+    assert redis_client.exists(f"company:ko:원티드랩:{version}")
+
+    service.search_companies_by_name_page("원티드", "ko", catalog_version=7)
+    assert redis_client.keys("search:ko:0:*:7:원티드")
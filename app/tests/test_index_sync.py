@@ -0,0 +1,155 @@
+import pytest
+
+from app.common import index_sync
+from app.common.index_sync import IndexRefresher, VersionedIndex
+from app.common.search_index import CompanyNameIndex
+from app.common.tag_index import TagPostingIndex, parse_tag_query
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services.company_service import CompanyService
+
+REQUEST = CompanyRequest(
+    company_name=CompanyNameRequest(ko="색인 동기화"),
+    tags=[TagNameRequest(tag_name={"ko": "태그_동기화"})],
+)
+
+
+@pytest.fixture
+def workers(db):
+    """같은 DB 를 사용하는 두 워커의 (서비스, 색인 갱신)"""
+
+    def worker():
+        name_index = CompanyNameIndex(n=2)
+        tag_index = TagPostingIndex()
+        refresher = IndexRefresher([name_index, tag_index])
+        refresher.refresh(db)
+        service = CompanyService(
+            CompanyRepository(db), TagRepository(db), name_index=name_index, tag_index=tag_index
+        )
+        return service, refresher
+
+    return worker(), worker()
+
+
+def indexed(service, name="색인 동기화", tag="태그_동기화"):
+    """서비스의 색인에서 회사명, 태그 검색 결과"""
+    names = service.name_index.search_ranked(name, "ko", 10)
+    company_ids = service.tag_index.search(parse_tag_query(tag))
+    return names, company_ids
+
+
+def record_builds(service, monkeypatch):
+    """색인을 다시 생성한 횟수 기록"""
+    built = []
+    for index in (service.name_index, service.tag_index):
+        build = index.build
+
+        def recorded(db, build=build):
+            built.append(db)
+            build(db)
+
+        monkeypatch.setattr(index, "build", recorded)
+    return built
+
+
+def test_other_worker_write_applied(db, workers, monkeypatch):
+    """다른 워커의 변경은 다시 생성하지 않고 변경분만 반영해야 합니다."""
+    (writer, _), (reader, refresher) = workers
+    built = record_builds(reader, monkeypatch)
+    writer.create_company(REQUEST, "ko")
+    assert indexed(writer)[0] == ["색인 동기화"]
+    assert indexed(reader) == ([], [])
+
+    assert refresher.refresh(db) == [reader.name_index, reader.tag_index]
+    assert indexed(reader) == indexed(writer)
+    assert built == []
+    # 변경이 없으면 반영하지 않음
+    assert refresher.refresh(db) == []
+
+
+def test_steady_writes_applied(db, workers, monkeypatch):
+    """다른 워커의 변경이 계속되어도 매번 변경분만 반영하여 버전을 따라가야 합니다."""
+    (writer, _), (reader, refresher) = workers
+    built = record_builds(reader, monkeypatch)
+    for number in range(3):
+        name, tag = f"색인 동기화 {number}", f"태그_동기화_{number}"
+        writer.create_company(
+            REQUEST.model_copy(update={"company_name": CompanyNameRequest(ko=name)}), "ko"
+        )
+        # 반영 전 변경이 하나 더 있어도 두 버전의 변경분을 함께 반영
+        writer._add_company_to_tags(name, [TagNameRequest(tag_name={"ko": tag})], "ko")
+
+        assert refresher.refresh(db) == [reader.name_index, reader.tag_index]
+        assert reader.tag_index.version == CompanyRepository(db).get_catalog_version()
+        assert indexed(reader, name, tag) == indexed(writer, name, tag)
+    assert built == []
+
+
+def test_other_worker_tag_delete_applied(db, workers, monkeypatch):
+    """다른 워커의 태그 연결 삭제는 변경분으로 색인에서 제거되어야 합니다."""
+    (writer, _), (reader, refresher) = workers
+    built = record_builds(reader, monkeypatch)
+    before = indexed(reader, "원티드랩", "태그_16")[1]
+    writer.delete_company_tag("원티드랩", "태그_16", "ko")
+
+    refresher.refresh(db)
+    after = indexed(reader, "원티드랩", "태그_16")[1]
+    assert after == indexed(writer, "원티드랩", "태그_16")[1]
+    assert len(after) == len(before) - 1
+    assert built == []
+
+
+def test_own_write_keeps_index(db, workers):
+    """현재 워커의 변경은 색인에 바로 반영되어 다시 반영하지 않아야 합니다."""
+    (writer, refresher), _ = workers
+    writer.create_company(REQUEST, "ko")
+    assert refresher.refresh(db) == []
+
+
+def test_unrecorded_version_rebuilds_index(db, workers, monkeypatch):
+    """변경 내역 없이 증가한 버전 (적재 스크립트) 이 있으면 색인을 다시 생성해야 합니다."""
+    (writer, refresher), _ = workers
+    built = record_builds(writer, monkeypatch)
+    CompanyRepository(db).bump_catalog_version()
+    writer.create_company(REQUEST, "ko")
+
+    assert refresher.refresh(db) == [writer.name_index, writer.tag_index]
+    assert built == [db, db]
+    assert indexed(writer)[0] == ["색인 동기화"]
+
+
+def test_too_many_changes_rebuilds_index(db, workers, monkeypatch):
+    """변경된 회사가 너무 많으면 변경분 대신 색인을 다시 생성해야 합니다."""
+    (writer, _), (reader, refresher) = workers
+    built = record_builds(reader, monkeypatch)
+    monkeypatch.setattr(index_sync.settings, "index_replay_max_companies", 0)
+    writer.create_company(REQUEST, "ko")
+
+    refresher.refresh(db)
+    assert built == [db, db]
+    assert indexed(reader) == indexed(writer)
+
+
+def test_catalog_changes_retention(db):
+    """retention 개 이전 버전의 변경 내역은 삭제되어 변경분을 조회할 수 없어야 합니다."""
+    repository = CompanyRepository(db)
+    first = repository.bump_catalog_version([1], retention=2)
+    second = repository.bump_catalog_version([2], [5], retention=2)
+    changes = repository.get_catalog_changes(first - 1, second)
+    assert [(c.company_ids, c.removed_tag_ids) for c in changes] == [([1], []), ([2], [5])]
+
+    repository.bump_catalog_version([3], retention=2)
+    assert repository.get_catalog_changes(first - 1, second + 1) is None
+    assert len(repository.get_catalog_changes(first, second + 1)) == 2
+
+
+def test_build_required():
+    """build, apply 를 구현하지 않은 색인은 생성할 수 없어야 합니다."""
+
+    class Partial(VersionedIndex):
+        def build(self, db):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
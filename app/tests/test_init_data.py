@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.config.settings import Settings
+from app.models import Base
+from app.scripts.init_data import bulk_import_data, import_data
+
+settings = Settings()
+
+TABLES = {
+    "company": "id",
+    "company_name": "id, company_id, language_code, name",
+    "tag": "id",
+    "tag_name": "id, tag_id, language_code, name",
+    "company_tag": "id, company_id, tag_id",
+}
+
+
+@pytest.fixture
+def schema_engine():
+    """테스트 전용 schema 에 테이블을 만들고 해당 schema 를 사용하는 엔진 생성"""
+    engines = []
+    admin = create_engine(settings.database_url)
+
+    def factory(schema: str):
+        with admin.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+        engine = create_engine(
+            settings.database_url, connect_args={"options": f"-csearch_path={schema}"}
+        )
+        Base.metadata.create_all(engine)
+        engines.append((schema, engine))
+        return engine
+
+    yield factory
+
+    for schema, engine in engines:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    admin.dispose()
+
+
+def dump(engine):
+    with engine.connect() as connection:
+        return {
+            table: connection.execute(text(f"SELECT {columns} FROM {table} ORDER BY id")).all()
+            for table, columns in TABLES.items()
+        }
+
+
+@pytest.mark.parametrize("chunksize", [7, 10000])
+def test_bulk_import_matches_import(schema_engine, chunksize):
+    """COPY 대량 적재 결과는 기존 적재 결과와 같아야 합니다."""
+    legacy_engine = schema_engine("test_import_legacy")
+    bulk_engine = schema_engine("test_import_bulk")
+
+    import_data(Session(legacy_engine))
+    counts = bulk_import_data(bulk_engine.connect(), chunksize=chunksize)
+
+    legacy, bulk = dump(legacy_engine), dump(bulk_engine)
+    assert bulk == legacy
+    assert counts == {table: len(rows) for table, rows in legacy.items()}
+
+    # 실행 중인 워커가 적재한 데이터를 반영하도록 회사 목록 버전 증가
+    for engine in (legacy_engine, bulk_engine):
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT version FROM catalog_version")).scalar() == 1
@@ -0,0 +1,100 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+
+from app.common.database import SessionLocal, engine
+from app.common.instrumentation import (
+    SQLInstrumentationMiddleware,
+    current_stats,
+    instrument,
+    statement_shape,
+)
+from app.common.utils import run_db
+from app.main import app
+from app.models.company import CompanyName
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+def test_statement_shape():
+    """IN 목록 길이와 파라미터 번호가 달라도 같은 형태로 취급해야 합니다."""
+    one = "SELECT id FROM tag WHERE id IN (%(id_1_1)s)"
+    many = "SELECT id FROM tag\n WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+    assert statement_shape(one) == statement_shape(many) == "SELECT id FROM tag WHERE id IN (?)"
+    assert statement_shape("SELECT $1, $12") == "SELECT ?, ?"
+
+
+def test_server_timing_header():
+    """응답 header 로 요청에서 실행된 SQL 횟수와 시간을 전달해야 합니다."""
+    resp = TestClient(app).get("/companies/Wantedlab", headers=HEADERS)
+
+    assert resp.status_code == 200
+    timing = resp.headers["server-timing"]
+    assert timing.startswith('db;desc="queries=2 rows=')
+    assert float(timing.rsplit("dur=", 1)[1]) > 0
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_n_plus_one_warning():
+    """같은 형태의 SQL 이 기준보다 많이 실행되면 경고해야 합니다."""
+    instrument(engine)
+    n_plus_one = FastAPI()
+    n_plus_one.add_middleware(SQLInstrumentationMiddleware, threshold=3)
+
+    def load_names():
+        with SessionLocal() as db:
+            ids = db.execute(select(CompanyName.id).limit(5)).scalars().all()
+            for name_id in ids:
+                db.execute(select(CompanyName.name).filter(CompanyName.id == name_id))
+            return {"rows": current_stats().rows, "queries": current_stats().count}
+
+    @n_plus_one.get("/names")
+    async def names():
+        return await run_db(None, load_names)
+
+    logger = logging.getLogger("app.sql")
+    handler, level = RecordingHandler(), logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        resp = TestClient(n_plus_one).get("/names")
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+    assert resp.json() == {"rows": 10, "queries": 6}
+    assert "queries=6" in resp.headers["server-timing"]
+    warnings = [r.getMessage() for r in handler.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "GET /names" in warnings[0] and "5 회" in warnings[0]
+
+
+def test_outside_request_not_recorded():
+    """요청 밖에서 실행한 SQL 은 기록하지 않아야 합니다."""
+    instrument(engine)
+    with SessionLocal() as db:
+        db.execute(text("SELECT 1"))
+    assert current_stats() is None
+
+
+def test_failed_statement_not_left_on_connection():
+    """실패한 SQL 의 시작 시각이 커넥션에 남아 다음 SQL 의 시간 측정에 사용되지 않아야 합니다."""
+    instrument(engine)
+    with engine.connect() as connection:
+        with pytest.raises(DBAPIError):
+            connection.execute(text("SELECT 1 / 0"))
+        connection.rollback()
+        assert "query_started" not in connection.info
+        assert connection.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,148 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.common.pagination import (
+    ID_CURSOR,
+    NEXT_CURSOR_HEADER,
+    SEARCH_CURSOR,
+    decode_cursor,
+    encode_cursor,
+)
+from app.common.search_index import CompanyNameIndex
+from app.main import app
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services import company_service
+from app.services.company_service import CompanyService
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+@pytest.fixture
+def services(db):
+    name_index = CompanyNameIndex(n=2)
+    name_index.build(db)
+    company_repository, tag_repository = CompanyRepository(db), TagRepository(db)
+    return (
+        CompanyService(company_repository, tag_repository),
+        CompanyService(company_repository, tag_repository, name_index),
+    )
+
+
+@pytest.fixture
+def api():
+    return TestClient(app)
+
+
+def read_pages(read, limit):
+    """cursor 가 없을 때까지 다음 페이지를 조회"""
+    pages = []
+    companies, cursor = read(limit, None)
+    pages.append(companies)
+    while cursor is not None:
+        companies, cursor = read(limit, cursor)
+        pages.append(companies)
+    return pages
+
+
+def test_cursor_round_trip():
+    """cursor 는 정렬 키 값을 그대로 복원해야 합니다."""
+    cursor = encode_cursor(1, "주식회사 링크", "Link", 10)
+    assert decode_cursor(cursor, SEARCH_CURSOR) == [1, "주식회사 링크", "Link", 10]
+
+
+@pytest.mark.parametrize(
+    "cursor,types",
+    [
+        ("", SEARCH_CURSOR),
+        ("not-a-cursor", SEARCH_CURSOR),
+        (encode_cursor(1, 2), SEARCH_CURSOR),
+        (encode_cursor(1, 2, 3, 4), SEARCH_CURSOR),
+        (encode_cursor("x", "y", "z", "w"), SEARCH_CURSOR),
+        (encode_cursor(1, "a", "A", None), SEARCH_CURSOR),
+        (encode_cursor("x"), ID_CURSOR),
+        (encode_cursor(None), ID_CURSOR),
+        (encode_cursor(True), ID_CURSOR),
+        (encode_cursor(1.5), ID_CURSOR),
+    ],
+)
+def test_invalid_cursor(cursor, types):
+    """형식이나 정렬 키 타입이 맞지 않는 cursor 는 400 을 반환해야 합니다."""
+    with pytest.raises(HTTPException) as e:
+        decode_cursor(cursor, types)
+    assert e.value.status_code == 400
+
+
+@pytest.mark.parametrize("query,language", [("a", "en"), ("주식", "ko"), ("링크", "ko")])
+@pytest.mark.parametrize("limit", [1, 3])
+def test_search_pages(services, query, language, limit):
+    """페이지를 이어 붙인 결과는 중복/누락 없이 전체 자동완성 결과와 같아야 합니다."""
+    ilike_service, index_service = services
+    expected = ilike_service.search_companies_by_name(query, language, limit=100)
+
+    for service in (ilike_service, index_service):
+        pages = read_pages(
+            lambda size, cursor: service.search_companies_by_name_page(
+                query, language, size, cursor=cursor
+            ),
+            limit,
+        )
+        assert all(len(page) == limit for page in pages[:-1])
+        # 색인 서비스는 첫 페이지만 색인, 다음 페이지부터 DB 로 조회
+        assert [c for page in pages for c in page] == expected
+
+
+@pytest.mark.parametrize("view,projection", [(True, False), (False, True), (False, False)])
+def test_tag_search_pages(db, monkeypatch, view, projection):
+    """태그 검색 페이지를 이어 붙인 결과는 전체 검색 결과와 같아야 합니다."""
+    monkeypatch.setattr(company_service.settings, "company_view_enabled", view)
+    monkeypatch.setattr(company_service.settings, "tag_search_projection", projection)
+    service = CompanyService(CompanyRepository(db), TagRepository(db))
+    expected = service.search_companies_by_tag("태그_4", "ko")
+
+    pages = read_pages(
+        lambda size, cursor: service.search_companies_by_tag_page("태그_4", "ko", size, cursor),
+        2,
+    )
+
+    assert len(expected) > 2
+    assert all(len(page) == 2 for page in pages[:-1])
+    assert [c for page in pages for c in page] == expected
+
+
+def test_pagination_api(api):
+    """다음 페이지 cursor 는 X-Next-Cursor header 로 전달되어야 합니다."""
+    for path in ("/search?query=주식", "/tags?query=태그_4"):
+        companies = []
+        resp = api.get(f"{path}&limit=2", headers=HEADERS)
+        companies += resp.json()
+        while NEXT_CURSOR_HEADER in resp.headers:
+            cursor = resp.headers[NEXT_CURSOR_HEADER]
+            resp = api.get(f"{path}&limit=2&cursor={cursor}", headers=HEADERS)
+            assert resp.status_code == 200
+            companies += resp.json()
+
+        assert companies == api.get(f"{path}&limit=100", headers=HEADERS).json()
+
+    resp = api.get("/tags?query=태그_4&cursor=invalid", headers=HEADERS)
+    assert resp.status_code == 400
+    resp = api.get(f"/search?query=a&fuzzy=true&cursor={encode_cursor(0)}", headers=HEADERS)
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "path,cursor",
+    [
+        ("/tags?query=태그_4", encode_cursor("x")),
+        ("/tags?query=태그_4", encode_cursor(None)),
+        ("/tags/query?expr=태그_4", encode_cursor("x")),
+        ("/search?query=주식", encode_cursor(1, 2, 3, 4)),
+        ("/search?query=주식", encode_cursor("x", "y", "z", "w")),
+    ],
+)
+def test_pagination_api_cursor_types(api, path, cursor):
+    """정렬 키 타입이 맞지 않는 cursor 는 조회하지 않고 400 을 반환해야 합니다."""
+    resp = api.get(f"{path}&limit=2&cursor={cursor}", headers=HEADERS)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "잘못된 cursor 입니다."
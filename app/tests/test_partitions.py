@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+from app.common.database import engine
+from app.config.settings import Settings
+from app.models import Base
+from app.models.partitions import PARTITIONED_TABLES, ensure_language_partitions
+from app.repositories.company_repository import CompanyRepository
+
+settings = Settings()
+
+SCHEMA = "test_partitions"
+
+
+def partitions(connection, table):
+    return (
+        connection.execute(
+            text(
+                "SELECT pg_class.relname FROM pg_inherits "
+                "JOIN pg_class ON pg_class.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:table AS regclass) ORDER BY 1"
+            ),
+            {"table": table},
+        )
+        .scalars()
+        .all()
+    )
+
+
+@pytest.fixture
+def schema_engine():
+    """테스트 전용 schema 에 테이블을 만들고 해당 schema 를 사용하는 엔진"""
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    schema_engine = create_engine(
+        settings.database_url, connect_args={"options": f"-csearch_path={SCHEMA}"}
+    )
+    Base.metadata.create_all(schema_engine)
+    yield schema_engine
+
+    schema_engine.dispose()
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+@pytest.mark.parametrize("table", PARTITIONED_TABLES)
+def test_language_partitions(table):
+    """회사명/태그명은 언어별 파티션에 저장되어야 합니다."""
+    with engine.connect() as connection:
+        assert partitions(connection, table) == sorted(
+            f"{table}_{code}" for code in settings.LANGUAGE_CHOICES
+        )
+        rows = connection.execute(
+            text(f"SELECT DISTINCT tableoid::regclass::text, language_code FROM {table}")
+        ).all()
+    assert all(partition == f"{table}_{code}" for partition, code in rows)
+
+
+def test_language_scoped_search_prunes_partitions():
+    """언어 조건이 있는 검색은 해당 언어 파티션만 조회해야 합니다."""
+    queryset = CompanyRepository(None)._name_partial_queryset("원티드", "en")
+    sql = str(
+        queryset.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    with engine.connect() as connection:
+        plan = "\n".join(connection.execute(text(f"EXPLAIN {sql}")).scalars())
+    assert "company_name_en" in plan
+    assert "company_name_ko" not in plan
+
+
+def test_ensure_language_partitions(schema_engine):
+    """LANGUAGE_CHOICES 에 추가한 언어의 enum 값과 파티션, company_view 인덱스를 만들어야 합니다."""
+    languages = [*settings.LANGUAGE_CHOICES, "de"]
+    assert ensure_language_partitions(schema_engine, languages) == [
+        "company_name_de",
+        "tag_name_de",
+    ]
+    # 이미 있으면 아무것도 만들지 않음
+    assert ensure_language_partitions(schema_engine, languages) == []
+
+    with schema_engine.begin() as connection:
+        assert "company_name_de" in partitions(connection, "company_name")
+        connection.execute(text("INSERT INTO company (id, version) VALUES (1, 1)"))
+        connection.execute(
+            text(
+                "INSERT INTO company_name (company_id, language_code, name) "
+                "VALUES (1, 'de', 'Wanted GmbH')"
+            )
+        )
+        assert connection.execute(text("SELECT count(*) FROM company_name_de")).scalar() == 1
+        # 새 언어의 company_view 조회 인덱스
+        indexes = (
+            connection.execute(
+                text(
+                    "SELECT indexname FROM pg_indexes "
+                    "WHERE schemaname = :schema AND tablename = 'company_view'"
+                ),
+                {"schema": SCHEMA},
+            )
+            .scalars()
+            .all()
+        )
+        assert {"ix_company_view_all_names_de", "ix_company_view_all_tag_names_de"} <= set(indexes)
+
+
+def test_ensure_language_partitions_rejects_invalid_code(schema_engine):
+    with pytest.raises(ValueError):
+        ensure_language_partitions(schema_engine, ["ko'; DROP TABLE company; --"])
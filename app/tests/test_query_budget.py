@@ -0,0 +1,67 @@
+import pytest
+
+from app.main import app
+from app.tests.conftest import QUERY_BUDGETS, BudgetClient, route_template
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+def company(index, tag_count):
+    return {
+        "company_name": {"ko": f"쿼리 회사 {index}", "tw": f"Query Company {index}"},
+        "tags": [{"tag_name": {"ko": "태그_4", "en": "tag_4"}}]
+        + [
+            {"tag_name": {"ko": f"쿼리 태그_{index}_{i}", "jp": f"クエリ_{index}_{i}"}}
+            for i in range(tag_count)
+        ],
+    }
+
+
+def test_route_template():
+    """요청 경로를 등록된 경로 템플릿으로 변환해야 합니다."""
+    assert route_template("GET", "/companies/원티드랩") == "/companies/{company_name}"
+    assert route_template("POST", "/companies/bulk") == "/companies/bulk"
+    assert route_template("DELETE", "/companies/a/tags/b") == (
+        "/companies/{company_name}/tags/{tag_name}"
+    )
+    assert route_template("GET", "/없는경로") is None
+
+
+def test_write_queries_independent_of_tag_count(api_db, budget_client):
+    """태그 개수와 관계 없이 같은 횟수의 SQL 로 회사/태그를 저장해야 합니다."""
+    counts = []
+    for index, tag_count in enumerate((1, 10)):
+        resp = budget_client.post("/companies", json=company(index, tag_count), headers=HEADERS)
+        assert resp.status_code == 200
+        counts.append(len(budget_client.queries.statements))
+
+        tags = [
+            {"tag_name": {"ko": f"추가 태그_{index}_{i}", "en": f"added_{index}_{i}"}}
+            for i in range(tag_count)
+        ]
+        resp = budget_client.put(f"/companies/쿼리 회사 {index}/tags", json=tags, headers=HEADERS)
+        assert resp.status_code == 200
+        counts.append(len(budget_client.queries.statements))
+
+    assert counts[:2] == counts[2:]
+    assert counts[0] <= QUERY_BUDGETS[("POST", "/companies")]
+
+
+def test_budget_exceeded_reports_statements(api_db):
+    """허용 횟수를 넘으면 실행된 SQL 과 반복된 SQL 의 diff 를 출력하고 실패해야 합니다."""
+    api = BudgetClient(app, budgets={("GET", "/companies/{company_name}"): 0})
+    with pytest.raises(pytest.fail.Exception) as error:
+        api.get("/companies/Wantedlab", headers=HEADERS)
+
+    message = str(error.value)
+    assert message.startswith("GET /companies/{company_name}: SQL 2 회 실행 (허용 0 회)")
+    assert "  1. SELECT company.id, company.version" in message
+
+    api = BudgetClient(app, budgets={("POST", "/companies"): 0})
+    with pytest.raises(pytest.fail.Exception) as error:
+        api.post("/companies", json=company(0, 3), headers=HEADERS)
+
+    # 태그명 INSERT 가 반복되면 diff 로 표시
+    message = str(error.value)
+    assert "반복 실행된 SQL:" in message
+    assert "+INSERT INTO tag_name" in message
@@ -0,0 +1,190 @@
+import io
+import re
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.benchmarks.datagen import generate_rows, write_csv
+from app.common.tag_index import And, Term
+from app.config.settings import Settings
+from app.models import Base
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.scripts.init_data import bulk_import_data
+
+settings = Settings()
+
+SCHEMA = "test_query_plans"
+# 인덱스가 seq scan 보다 유리해지는 크기의 합성 데이터 (회사 2만, 태그 400)
+COMPANIES = 20000
+# 이보다 작은 테이블 (tag, 비어 있는 언어 파티션 등) 의 seq scan 은 허용
+MIN_ROWS = 1000
+
+SEQ_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+@pytest.fixture(scope="module")
+def plan_engine():
+    """합성 데이터를 적재하고 통계를 갱신한 테스트 전용 schema 의 엔진"""
+    admin = create_engine(settings.database_url)
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    engine = create_engine(
+        settings.database_url, connect_args={"options": f"-csearch_path={SCHEMA}"}
+    )
+    Base.metadata.create_all(engine)
+
+    csv_file = io.StringIO()
+    write_csv(generate_rows(COMPANIES, seed=1), csv_file)
+    csv_file.seek(0)
+    bulk_import_data(engine.connect(), csv_file)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+    yield engine
+
+    engine.dispose()
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    admin.dispose()
+
+
+@pytest.fixture
+def explain(plan_engine):
+    """
+    repository 메서드가 실행한 모든 SQL 의 실행 계획 목록을 반환하는 함수
+    (실제 조회와 같은 SQL, 파라미터로 EXPLAIN)
+    """
+
+    def run(method_name: str, repository_class, *args, **kwargs) -> List[Tuple[str, str, list]]:
+        with plan_engine.connect() as connection:
+            statements = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                statements.append((statement, parameters))
+
+            event.listen(connection, "before_cursor_execute", capture)
+            repository = repository_class(Session(bind=connection))
+            getattr(repository, method_name)(*args, **kwargs)
+            event.remove(connection, "before_cursor_execute", capture)
+
+            assert statements
+            plans = []
+            for statement, parameters in statements:
+                plan = "\n".join(
+                    connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars()
+                )
+                plans.append((statement, plan, large_seq_scans(connection, plan)))
+            return plans
+
+    return run
+
+
+def large_seq_scans(connection, plan: str) -> List[str]:
+    """실행 계획에서 MIN_ROWS 이상인 테이블의 seq scan 목록"""
+    tables = SEQ_SCAN.findall(plan)
+    if not tables:
+        return []
+    return (
+        connection.execute(
+            text(
+                "SELECT relname FROM pg_class WHERE relname = ANY(:tables) AND reltuples >= :rows "
+                "AND relnamespace = CAST(:schema AS regnamespace)"
+            ),
+            {"tables": tables, "rows": MIN_ROWS, "schema": SCHEMA},
+        )
+        .scalars()
+        .all()
+    )
+
+
+def names(plan_engine, table: str, language: str) -> str:
+    """적재된 이름 중 하나 (태그는 연결된 회사가 적은 태그)"""
+    with plan_engine.connect() as connection:
+        if table == "company_name":
+            return connection.execute(
+                text(
+                    "SELECT name FROM company_name WHERE language_code = :lang ORDER BY id LIMIT 1"
+                ),
+                {"lang": language},
+            ).scalar()
+        return connection.execute(
+            text(
+                "SELECT tag_name.name FROM tag_name JOIN company_tag USING (tag_id) "
+                "WHERE language_code = :lang GROUP BY tag_name.name ORDER BY count(*), 1 LIMIT 1"
+            ),
+            {"lang": language},
+        ).scalar()
+
+
+HOT_PATHS = [
+    (CompanyRepository, "get_by_name", "company_name", {}),
+    (CompanyRepository, "get_by_name", "company_name", {"language_code": "ko"}),
+    (CompanyRepository, "get_by_name", "company_name", {"with_tag_names": False}),
+    (CompanyRepository, "get_version_by_name", "company_name", {}),
+    (TagRepository, "get_by_name", "tag_name", {}),
+    (TagRepository, "get_by_name", "tag_name", {"language": "ko"}),
+    # 태그 검색은 항상 한 페이지 (limit + 1) 씩 조회
+    (TagRepository, "get_companies_by_tag_name", "tag_name", {"limit": 11}),
+    (TagRepository, "get_companies_by_tag_name", "tag_name", {"limit": 11, "after": 100}),
+    (
+        TagRepository,
+        "get_companies_by_tag_name",
+        "tag_name",
+        {"limit": 11, "with_tag_names": False},
+    ),
+    (
+        TagRepository,
+        "get_company_projections_by_tag_name",
+        "tag_name",
+        {"language": "ko", "limit": 11},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "repository_class, method_name, table, kwargs",
+    HOT_PATHS,
+    ids=[f"{c.__name__}.{m}-{'-'.join(k) or 'name'}" for c, m, _, k in HOT_PATHS],
+)
+def test_exact_name_lookup_uses_index(
+    plan_engine, explain, repository_class, method_name, table, kwargs
+):
+    """회사명/태그명 조회는 합성 데이터에서 seq scan 없이 인덱스를 사용해야 합니다."""
+    name = names(plan_engine, table, "ko")
+    for statement, plan, seq_scans in explain(method_name, repository_class, name, **kwargs):
+        assert not seq_scans, f"{statement}\n{plan}"
+
+
+@pytest.mark.parametrize(
+    "repository_class, method_name, table",
+    [
+        (CompanyRepository, "get_existing_names", "company_name"),
+        (TagRepository, "get_tag_ids_by_names", "tag_name"),
+    ],
+)
+def test_name_batch_lookup_uses_index(plan_engine, explain, repository_class, method_name, table):
+    """(언어, 이름) 목록 조회는 seq scan 없이 인덱스를 사용해야 합니다."""
+    rows = [("ko", names(plan_engine, table, "ko")), ("en", "없는 이름")]
+    for statement, plan, seq_scans in explain(method_name, repository_class, rows):
+        assert not seq_scans, f"{statement}\n{plan}"
+
+
+def test_tag_query_uses_index(plan_engine, explain):
+    """태그 검색식 (AND) 조회는 seq scan 없이 인덱스를 사용해야 합니다."""
+    query = And(
+        Term(names(plan_engine, "tag_name", "ko")), Term(names(plan_engine, "tag_name", "en"))
+    )
+    for statement, plan, seq_scans in explain(
+        "get_company_ids_by_tag_query", TagRepository, query, limit=10
+    ):
+        assert not seq_scans, f"{statement}\n{plan}"
+
+
+def test_company_name_lookup_is_index_only(plan_engine, explain):
+    """ETag 버전 확인은 회사명 covering 인덱스만으로 회사 id 를 찾아야 합니다."""
+    name = names(plan_engine, "company_name", "ko")
+    [(_, plan, _)] = explain("get_version_by_name", CompanyRepository, name)
+    assert "Index Only Scan using company_name_ko_name_company_id_language_code_idx" in plan
@@ -0,0 +1,80 @@
+import fakeredis
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common import dependencies, responses
+from app.common.dependencies import get_cache_repository
+from app.common.pagination import NEXT_CURSOR_HEADER
+from app.main import app
+from app.repositories.cache_repository import CacheRepository
+from app.routers import company as company_router
+from app.schemas.company import CompanyResponse
+
+HEADERS = {"x-wanted-language": "ko"}
+
+PATHS = [
+    "/search?query=주식&limit=2",
+    "/search?query=링크",
+    "/tags?query=태그_4&limit=2",
+    "/tags/query?expr=태그_11 AND NOT 태그_2",
+    "/companies/Wantedlab",
+    "/companies/없는회사",
+]
+
+
+@pytest.fixture
+def api():
+    return TestClient(app)
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    def enable(enabled: bool):
+        monkeypatch.setattr(responses.settings, "fast_json_response", enabled)
+        monkeypatch.setattr(company_router.settings, "fast_json_response", enabled)
+
+    return enable
+
+
+def test_render_matches_default(fast_json):
+    """orjson 직렬화 결과는 기본 직렬화 결과와 같아야 합니다."""
+    content = [CompanyResponse.model_construct(company_name="원티드랩", tags=["태그_4", "tag_16"])]
+    default = responses.render(content)
+    fast_json(True)
+    fast = responses.render(content, {NEXT_CURSOR_HEADER: "cursor"})
+
+    assert fast.body == default.body
+    assert fast.headers[NEXT_CURSOR_HEADER] == "cursor"
+    assert fast.media_type == "application/json"
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_fast_json_api(api, fast_json, path):
+    """fast_json_response 여부와 관계 없이 같은 응답을 반환해야 합니다."""
+    fast_json(False)
+    expected = api.get(path, headers=HEADERS)
+    fast_json(True)
+    resp = api.get(path, headers=HEADERS)
+
+    assert resp.status_code == expected.status_code
+    assert resp.json() == expected.json()
+    assert resp.headers.get(NEXT_CURSOR_HEADER) == expected.headers.get(NEXT_CURSOR_HEADER)
+
+
+def test_cached_company_returned_as_is(api, fast_json, monkeypatch):
+    """캐시에 저장된 회사 상세 JSON 은 다시 변환하지 않고 그대로 응답해야 합니다."""
+    fast_json(True)
+    monkeypatch.setattr(dependencies.settings, "cache_enabled", True)
+    redis_client = fakeredis.FakeStrictRedis(decode_responses=True)
+    app.dependency_overrides[get_cache_repository] = lambda: CacheRepository(redis_client)
+    try:
+        first = api.get("/companies/Wantedlab", headers=HEADERS)
+        # ETag 버전별 캐시
+        (key,) = redis_client.keys("company:ko:Wantedlab:*")
+        cached = redis_client.get(key)
+        second = api.get("/companies/Wantedlab", headers=HEADERS)
+    finally:
+        app.dependency_overrides.pop(get_cache_repository)
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content == cached.encode("utf-8")
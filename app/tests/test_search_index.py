@@ -0,0 +1,109 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.common.search_index import CompanyNameIndex, RadixTrie
+from app.models.company import CompanyName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+CSV_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "scripts", "company_tag_sample.csv"
+)
+
+
+def sample_queries():
+    """샘플 CSV 회사명의 모든 1~3 글자 부분 문자열과 대소문자 변형"""
+    df = pd.read_csv(CSV_PATH)
+    names = [
+        name
+        for column in ("company_ko", "company_en", "company_ja")
+        for name in df[column].dropna()
+    ]
+    queries = {"", "없는회사", "zzz", "Wanted", "wantedlab", "WANTEDLAB", "주식회사 링크"}
+    for name in names:
+        for size in range(1, 4):
+            for i in range(len(name) - size + 1):
+                queries.add(name[i : i + size])
+    queries |= {q.upper() for q in list(queries)}
+    return sorted(queries)
+
+
+@pytest.fixture
+def services(db):
+    name_index = CompanyNameIndex(n=2)
+    name_index.build(db)
+
+    company_repository = CompanyRepository(db)
+    tag_repository = TagRepository(db)
+    return (
+        CompanyService(company_repository, tag_repository),
+        CompanyService(company_repository, tag_repository, name_index=name_index),
+    )
+
+
+@pytest.mark.parametrize("language", ["ko", "en", "jp"])
+def test_ngram_index_matches_ilike(services, language):
+    """n-gram 색인 검색 결과는 ILIKE 검색 결과와 동일해야 합니다."""
+    ilike_service, index_service = services
+    for query in sample_queries():
+        expected = ilike_service.search_companies_by_name(query, language)
+        assert index_service.search_companies_by_name(query, language) == expected, query
+
+
+def test_ngram_index_falls_back_on_like_wildcards(services):
+    """LIKE 특수문자가 포함된 검색어는 기존 ILIKE 검색으로 처리합니다."""
+    _, index_service = services
+    assert index_service.name_index.search("링%", "ko") is None
+    assert index_service.name_index.search("링_", "ko") is None
+
+
+def test_radix_trie_top_k():
+    """각 노드의 상위 k 개 캐시와 하위 트리 전체 탐색 결과가 같아야 합니다."""
+    trie = RadixTrie(k=2)
+    names = ["wanted", "wantedlab", "want", "wave", "apple", "wantedspace"]
+    for i, name in enumerate(names):
+        trie.insert(name, (name, name, i))
+
+    assert [e[1] for e in trie.complete("wan", 2)] == ["want", "wanted"]
+    assert [e[1] for e in trie.complete("wan", 10)] == [
+        "want",
+        "wanted",
+        "wantedlab",
+        "wantedspace",
+    ]
+    assert [e[1] for e in trie.complete("wantedl", 2)] == ["wantedlab"]
+    assert [e[1] for e in trie.complete("wa", 3)] == ["want", "wanted", "wantedlab"]
+    assert trie.complete("x", 2) == []
+
+
+def test_ranked_search_prefix_first():
+    """접두어 일치 결과가 중간 일치 결과보다 먼저 나와야 합니다."""
+    name_index = CompanyNameIndex(n=2, k=3)
+    name_index.ready = True
+    names = ["스피링크", "링크드인", "주식회사 링크드코리아", "링크", "원티드랩"]
+    for i, name in enumerate(names):
+        name_index.add(CompanyName(id=i, language_code="ko", name=name))
+
+    assert name_index.search_ranked("링크", "ko", 2) == ["링크", "링크드인"]
+    assert name_index.search_ranked("링크", "ko", 10) == [
+        "링크",
+        "링크드인",
+        "스피링크",
+        "주식회사 링크드코리아",
+    ]
+    assert name_index.search_ranked("없는회사", "ko", 10) == []
+
+
+@pytest.mark.parametrize("query", ["링크", "주식", "a", "Co", "株式"])
+def test_ranked_search_matches_database(services, query):
+    """색인 자동완성 결과는 DB 자동완성 결과와 같은 회사명을 반환해야 합니다."""
+    ilike_service, index_service = services
+    for language in ("ko", "en", "jp"):
+        expected = ilike_service.search_companies_by_name(query, language, limit=100)
+        ranked = index_service.search_companies_by_name(query, language, limit=100)
+        assert sorted(map(str, ranked)) == sorted(map(str, expected))
+        prefix = [c for c in ranked if c["company_name"].lower().startswith(query.lower())]
+        assert ranked[: len(prefix)] == prefix
@@ -1,14 +1,12 @@
 import json
 
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
 
 
 @pytest.fixture
-def api():
-    return TestClient(app)
+def api(budget_client):
+    """엔드포인트별 SQL 실행 횟수 (conftest.QUERY_BUDGETS) 를 함께 검사"""
+    return budget_client
 
 
 def test_company_name_autocomplete(api):
@@ -181,3 +179,15 @@ def test_delete_tag(api):
             "tag_50",
         ],
     }
+
+
+def test_company_name_autocomplete_limit(api):
+    """
+    회사명 자동완성 결과 수 제한
+    limit 을 지정하면 접두어 일치 결과를 우선으로 최대 limit 개만 출력되어야 합니다.
+    """
+    resp = api.get("/search?query=링크&limit=1", headers=[("x-wanted-language", "ko")])
+    searched_companies = json.loads(resp.content.decode("utf-8"))
+
+    assert resp.status_code == 200
+    assert searched_companies == [{"company_name": "스피링크"}]
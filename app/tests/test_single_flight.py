@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.common.database import SessionLocal
+from app.common.dependencies import open_db
+from app.common.routing import is_primary_pinned, pin_primary
+from app.common.single_flight import SingleFlight, single_flight
+from app.common.utils import run_in_new_session
+from app.main import app
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+def test_concurrent_calls_share_result():
+    """같은 키의 동시 호출은 한 번만 실행하고 결과를 함께 사용해야 합니다."""
+    flight = SingleFlight()
+    calls = []
+
+    async def load(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return value
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do("a", load, "a") for _ in range(5)), flight.do("b", load, "b")
+        )
+
+    assert asyncio.run(main()) == ["a"] * 5 + ["b"]
+    assert calls == ["a", "b"]
+    assert len(flight) == 0
+    assert flight.stats == {"calls": 2, "shared": 4}
+
+
+def test_error_and_cancellation():
+    """예외는 모든 호출에 전달하고, 먼저 시작한 호출이 취소되어도 나머지는 결과를 받아야 합니다."""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("실패")
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        results = await asyncio.gather(
+            flight.do("fail", fail), flight.do("fail", fail), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [ValueError, ValueError]
+
+        leader = asyncio.ensure_future(flight.do("slow", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("slow", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == "done"
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_company_requests_coalesced(monkeypatch, enabled):
+    """같은 회사의 동시 상세 조회는 DB 를 한 번만 조회해야 합니다."""
+    monkeypatch.setattr(single_flight, "enabled", enabled)
+    calls = []
+    lock = threading.Lock()
+    get_by_name = CompanyRepository.get_by_name
+
+    def slow_get_by_name(self, *args, **kwargs):
+        with lock:
+            calls.append(args[0])
+        threading.Event().wait(0.05)
+        return get_by_name(self, *args, **kwargs)
+
+    monkeypatch.setattr(CompanyRepository, "get_by_name", slow_get_by_name)
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.get("/companies/Wantedlab", headers=HEADERS) for _ in range(5))
+            )
+
+    responses = asyncio.run(main())
+    assert [resp.status_code for resp in responses] == [200] * 5
+    assert len({resp.content for resp in responses}) == 1
+    assert len(calls) == (1 if enabled else 5)
+
+
+def test_flight_uses_own_session(monkeypatch):
+    """먼저 시작한 요청이 취소되어 요청 세션이 닫혀도 계산은 자신의 세션으로 계속되어야 합니다."""
+    flight = SingleFlight()
+    sessions = []
+    get_by_name = CompanyRepository.get_by_name
+
+    def slow_get_by_name(self, *args, **kwargs):
+        sessions.append((self.db, is_primary_pinned(self.db)))
+        threading.Event().wait(0.05)
+        return get_by_name(self, *args, **kwargs)
+
+    monkeypatch.setattr(CompanyRepository, "get_by_name", slow_get_by_name)
+
+    async def main(request_db):
+        service = CompanyService(CompanyRepository(request_db), TagRepository(request_db))
+        pin_primary(request_db)
+
+        def call():
+            return asyncio.ensure_future(
+                flight.do(
+                    "company",
+                    run_in_new_session,
+                    open_db,
+                    service,
+                    CompanyService.get_company_by_name,
+                    "원티드랩",
+                    "ko",
+                )
+            )
+
+        leader = call()
+        await asyncio.sleep(0)
+        follower = call()
+        await asyncio.sleep(0.01)
+        # 취소된 요청의 dependency 정리로 요청 세션이 닫힘
+        leader.cancel()
+        request_db.close()
+        return await follower
+
+    with SessionLocal() as request_db:
+        company = asyncio.run(main(request_db))
+
+    assert company.company_name == "원티드랩"
+    [(db, pinned)] = sessions
+    assert db is not request_db
+    assert pinned
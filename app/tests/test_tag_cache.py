@@ -0,0 +1,157 @@
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from sqlalchemy import select
+from sqlalchemy.util import greenlet_spawn
+
+from app.common.greenlet_redis import GreenletRedis
+from app.common.tag_cache import TagNameCache
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services import company_service
+from app.services.company_service import CompanyService
+
+
+@pytest.fixture
+def tag_cache():
+    return TagNameCache(size=100, ttl=60)
+
+
+@pytest.fixture
+def services(db, tag_cache):
+    company_repository, tag_repository = CompanyRepository(db), TagRepository(db)
+    return (
+        CompanyService(company_repository, tag_repository),
+        CompanyService(company_repository, tag_repository, tag_cache=tag_cache),
+    )
+
+
+def wait_until(condition, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_lru_and_reverse_map():
+    """최대 개수를 넘으면 가장 오래 사용하지 않은 태그부터 삭제해야 합니다."""
+    cache = TagNameCache(size=2, ttl=60)
+    cache.put_many({1: [("ko", "태그_1")], 2: [("ko", "태그_2")]}, cache.generation)
+    cache.get_many([1])
+    cache.put_many({3: [("ko", "태그_3"), ("en", "tag_3")]}, cache.generation)
+
+    found, missing = cache.get_many([1, 2, 3])
+    assert found == {1: (("ko", "태그_1"),), 3: (("ko", "태그_3"), ("en", "tag_3"))}
+    assert missing == [2]
+    assert cache.get_tag_ids([("ko", "태그_2"), ("en", "tag_3")]) == {("en", "tag_3"): 3}
+
+
+def test_ttl_and_stale_put():
+    """ttl 이 지난 항목과 무효화 이전에 조회한 값은 사용하지 않아야 합니다."""
+    cache = TagNameCache(size=10, ttl=0)
+    cache.put_many({1: [("ko", "태그_1")]}, cache.generation)
+    assert cache.get_many([1]) == ({}, [1])
+
+    cache = TagNameCache(size=10, ttl=60)
+    generation = cache.generation
+    cache.invalidate([1])
+    cache.put_many({1: [("ko", "이전 태그명")]}, generation)
+    assert cache.get_many([1]) == ({}, [1])
+
+
+def test_invalidation_across_workers():
+    """한 워커의 무효화는 pub/sub 으로 다른 워커의 캐시에도 반영되어야 합니다."""
+    server = fakeredis.FakeServer()
+    workers = [TagNameCache(size=10, ttl=60) for _ in range(2)]
+    for cache in workers:
+        cache.start_subscriber(
+            fakeredis.FakeStrictRedis(server=server, decode_responses=True), poll_interval=0.01
+        )
+        cache.put_many({1: [("ko", "태그_1")], 2: [("ko", "태그_2")]}, cache.generation)
+    try:
+        workers[0].invalidate([1])
+
+        assert workers[0].get_many([1, 2])[1] == [1]
+        assert wait_until(lambda: 1 not in workers[1].get_many([1])[0])
+        assert workers[1].get_many([2])[0] == {2: (("ko", "태그_2"),)}
+    finally:
+        for cache in workers:
+            cache.stop_subscriber()
+
+
+def test_invalidation_with_async_publisher():
+    """async 모드의 무효화는 비동기 클라이언트로 전달되어 다른 워커의 구독 스레드가 받아야 합니다."""
+    server = fakeredis.FakeServer()
+    workers = [TagNameCache(size=10, ttl=60) for _ in range(2)]
+    for cache in workers:
+        cache.put_many({1: [("ko", "태그_1")]}, cache.generation)
+    workers[1].start_subscriber(
+        fakeredis.FakeStrictRedis(server=server, decode_responses=True), poll_interval=0.01
+    )
+
+    async def invalidate():
+        publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        workers[0].start_subscriber(
+            fakeredis.FakeStrictRedis(server=server, decode_responses=True),
+            poll_interval=0.01,
+            publisher=GreenletRedis(publisher),
+        )
+        await greenlet_spawn(workers[0].invalidate, [1])
+
+    try:
+        asyncio.run(invalidate())
+        assert wait_until(lambda: 1 not in workers[1].get_many([1])[0])
+    finally:
+        for cache in workers:
+            cache.stop_subscriber()
+
+
+def test_cached_reads_skip_tag_joins(db, services):
+    """태그명 캐시를 사용하면 회사 조회 시 태그 테이블을 조인하지 않아야 합니다."""
+    db_service, cached_service = services
+    for name in ("Wantedlab", "원티드랩"):
+        for language in ("ko", "en", "tw"):
+            expected = db_service.get_company_by_name(name, language)
+            assert cached_service.get_company_by_name(name, language) == expected
+
+    db.statements.clear()
+    cached_service.get_company_by_name("Wantedlab", "jp")
+
+    assert len(db.statements) == 1
+    assert "tag_name" not in db.statements[0]
+
+
+def test_cached_tag_search_matches(services, monkeypatch):
+    """태그명 캐시를 사용해도 태그 검색 결과는 같아야 합니다."""
+    monkeypatch.setattr(company_service.settings, "tag_search_projection", False)
+    db_service, cached_service = services
+    for tag in ("태그_4", "tag_16"):
+        expected = db_service.search_companies_by_tag(tag, "en")
+        assert cached_service.search_companies_by_tag(tag, "en") == expected
+        expected, _ = db_service.search_companies_by_tag_query(f"{tag} OR 태그_1", "ko")
+        companies, _ = cached_service.search_companies_by_tag_query(f"{tag} OR 태그_1", "ko")
+        assert companies == expected
+
+
+def test_write_invalidates_tag_names(db, services, tag_cache):
+    """기존 태그에 다른 언어 이름이 추가되면 캐시된 태그명을 다시 조회해야 합니다."""
+    _, service = services
+    tag_id = db.execute(select(TagName.tag_id).filter(TagName.name == "태그_4")).scalar()
+    service.get_company_by_name("Wantedlab", "tw")
+    assert tag_id in tag_cache.get_many([tag_id])[0]
+
+    request = CompanyRequest(
+        company_name=CompanyNameRequest(ko="캐시 회사"),
+        tags=[TagNameRequest(tag_name={"ko": "태그_4", "tw": "tag_4_tw"})],
+    )
+    response = service.create_company(request, "tw")
+
+    assert response.tags == ["tag_4_tw"]
+    assert ("tw", "tag_4_tw") in tag_cache.get_many([tag_id])[0][tag_id]
+    assert "tag_4_tw" in service.get_company_by_name("Wantedlab", "tw").tags
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import event, select
+
+from app.common.database import SessionLocal, engine
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services import company_service
+from app.services.company_service import CompanyService
+
+
+def search(monkeypatch, projection, tag_query, language):
+    monkeypatch.setattr(company_service.settings, "tag_search_projection", projection)
+    with SessionLocal() as db:
+        service = CompanyService(CompanyRepository(db), TagRepository(db))
+        return service.search_companies_by_tag(tag_query, language)
+
+
+@pytest.mark.parametrize("language", ["ko", "en", "jp", "tw"])
+def test_projection_matches_orm_path(monkeypatch, language):
+    """SQL 에서 변환한 결과는 ORM 객체로 변환한 결과와 같아야 합니다."""
+    with SessionLocal() as db:
+        tag_queries = db.execute(select(TagName.name).order_by(TagName.id).limit(30)).scalars()
+        tag_queries = tag_queries.all() + ["없는 태그"]
+
+    for tag_query in tag_queries:
+        expected = search(monkeypatch, False, tag_query, language)
+        assert search(monkeypatch, True, tag_query, language) == expected
+
+
+def test_projection_single_statement(monkeypatch):
+    """태그 검색은 결과 수와 관계 없이 쿼리 한 번으로 처리되어야 합니다."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        companies = search(monkeypatch, True, "tag_4", "en")
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len([s for s in statements if s.startswith("WITH")]) == 1
+    assert len(statements) == 1
+    assert companies and all("tag_4" in company.tags for company in companies)
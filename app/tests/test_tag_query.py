@@ -0,0 +1,206 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common.database import SessionLocal
+from app.common.pagination import NEXT_CURSOR_HEADER
+from app.common.tag_index import (
+    MAX_QUERY_TERMS,
+    And,
+    Not,
+    Or,
+    TagPostingIndex,
+    TagQuerySyntaxError,
+    Term,
+    _difference,
+    _insert,
+    _intersect,
+    _page,
+    _remove,
+    _to_postings,
+    _union,
+    parse_tag_query,
+    tag_query_terms,
+)
+from app.main import app
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services.company_service import CompanyService
+
+HEADERS = {"x-wanted-language": "ko"}
+
+EXPRESSIONS = [
+    "태그_11",
+    "tag_11 AND 태그_29",
+    "태그_11 OR タグ_29 OR tag_19",
+    "태그_11 NOT 태그_2",
+    "(태그_11 OR 태그_2) AND NOT (태그_29 OR tag_6)",
+    "NOT 태그_11",
+    '"태그_11" and not 없는태그',
+    "없는태그 OR 없는태그2",
+]
+
+
+@pytest.fixture
+def services(db):
+    tag_index = TagPostingIndex()
+    tag_index.build(db)
+    company_repository, tag_repository = CompanyRepository(db), TagRepository(db)
+    return (
+        CompanyService(company_repository, tag_repository),
+        CompanyService(company_repository, tag_repository, tag_index=tag_index),
+    )
+
+
+def test_parse_tag_query():
+    """NOT > AND > OR 순서로 결합하고, 따옴표/괄호/생략된 AND 를 처리해야 합니다."""
+    assert parse_tag_query("a OR b AND NOT c") == Or(Term("a"), And(Term("b"), Not(Term("c"))))
+    assert parse_tag_query("(a or b) c") == And(Or(Term("a"), Term("b")), Term("c"))
+    assert parse_tag_query('"tag \\"x\\"" AND "OR"') == And(Term('tag "x"'), Term("OR"))
+    assert parse_tag_query("NOT NOT a") == Not(Not(Term("a")))
+
+
+@pytest.mark.parametrize("expression", ["", "a AND", "(a OR b", "a)", "OR a", '"a', "(" * 40])
+def test_parse_tag_query_error(expression):
+    """잘못된 검색식은 TagQuerySyntaxError 가 발생해야 합니다."""
+    with pytest.raises(TagQuerySyntaxError):
+        parse_tag_query(expression)
+
+
+def test_parse_tag_query_terms_limit():
+    """검색식의 태그 수는 MAX_QUERY_TERMS 개로 제한되어야 합니다."""
+    query = parse_tag_query(" AND ".join(["a", "b"] * (MAX_QUERY_TERMS // 2)))
+    assert tag_query_terms(query) == {"a", "b"}
+    with pytest.raises(TagQuerySyntaxError):
+        parse_tag_query(" ".join(["a"] * (MAX_QUERY_TERMS + 1)))
+
+
+@pytest.mark.parametrize("after", [None, 0, 3, 64, 200, 10**6])
+@pytest.mark.parametrize("limit", [None, 1, 3, 100])
+def test_posting_page(after, limit):
+    """posting list 의 회사 id 는 after 다음부터 limit 개를 순서대로 꺼내야 합니다."""
+    company_ids = [1, 2, 3, 63, 64, 65, 130, 200, 201, 5000]
+    expected = [i for i in company_ids if after is None or i > after][:limit]
+    assert _page(_to_postings(reversed(company_ids)), after, limit) == expected
+
+
+def test_posting_operations():
+    """posting list 의 교집합/합집합/차집합과 추가/삭제는 정렬 순서를 유지해야 합니다."""
+    left, right = [1, 3, 5, 7, 9, 5000], [3, 4, 5, 10, 5000, 6000]
+    a, b = _to_postings(left), _to_postings(right)
+    assert _intersect(a, b).tolist() == sorted(set(left) & set(right))
+    assert _union(a, b).tolist() == sorted(set(left) | set(right))
+    assert _difference(a, b).tolist() == sorted(set(left) - set(right))
+    assert _difference(b, _to_postings([])).tolist() == right
+
+    for company_id in (8, 0, 7001, 8):
+        _insert(a, company_id)
+    _remove(a, 5)
+    _remove(a, 2)
+    assert a.tolist() == [0, 1, 3, 7, 8, 9, 5000, 7001]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_index_matches_database(services, expression):
+    """색인 검색 결과는 DB 검색 결과와 같아야 합니다."""
+    db_service, index_service = services
+    expected, _ = db_service.search_companies_by_tag_query(expression, "ko")
+    companies, _ = index_service.search_companies_by_tag_query(expression, "ko")
+    assert companies == expected
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_index_pages_match_database(services, expression):
+    """색인과 DB 의 페이지 (after 다음 limit 개) 조회 결과가 같아야 합니다."""
+    db_service, index_service = services
+    query = parse_tag_query(expression)
+    everything = db_service.tag_repository.get_company_ids_by_tag_query(query)
+    for after in [None, *everything[:3]]:
+        expected = db_service.tag_repository.get_company_ids_by_tag_query(query, 2, after)
+        assert index_service.tag_index.search(query, after, 2) == expected
+
+
+def test_database_query_deduplicates_terms(db, services):
+    """DB 검색은 검색식의 태그 수와 관계 없이 한 번의 쿼리로 중복 없는 태그명만 조회해야 합니다."""
+    db_service, _ = services
+    expression = " OR ".join(["태그_11", "tag_29"] * (MAX_QUERY_TERMS // 2))
+    expected, _ = db_service.search_companies_by_tag_query("태그_11 OR tag_29", "ko")
+    db.statements.clear()
+
+    query = parse_tag_query(expression)
+    company_ids = db_service.tag_repository.get_company_ids_by_tag_query(query)
+
+    assert len(db.statements) == 1
+    assert db.statements[0].count("tag_name.name IN") == 1
+    companies, _ = db_service.search_companies_by_tag_query(expression, "ko")
+    assert companies == expected and len(company_ids) == len(expected)
+
+
+def test_single_tag_matches_tag_search(services):
+    """태그 하나로 검색하면 /tags 검색 결과와 같아야 합니다."""
+    _, index_service = services
+    for name in ("태그_11", "tag_29", "タグ_19"):
+        companies, _ = index_service.search_companies_by_tag_query(name, "en")
+        assert companies == index_service.search_companies_by_tag(name, "en")
+
+
+def test_index_search_single_statement(db, services):
+    """색인 검색 결과는 한 번의 쿼리로 조회해야 합니다."""
+    _, index_service = services
+    db.statements.clear()
+
+    companies, _ = index_service.search_companies_by_tag_query("태그_11 AND NOT 태그_2", "ko")
+
+    assert companies
+    assert len(db.statements) == 1
+
+
+def test_index_follows_writes(db, services):
+    """회사 생성, 태그 추가/삭제 결과가 색인 검색에 반영되어야 합니다."""
+    _, service = services
+    request = CompanyRequest(
+        company_name=CompanyNameRequest(ko="색인 회사"),
+        tags=[
+            TagNameRequest(tag_name={"ko": "태그_11", "en": "tag_11"}),
+            TagNameRequest(tag_name={"ko": "색인 태그", "en": "index_tag"}),
+        ],
+    )
+    service.create_company(request, "ko")
+
+    companies, _ = service.search_companies_by_tag_query('"색인 태그" AND tag_11', "ko")
+    assert [c.company_name for c in companies] == ["색인 회사"]
+
+    service._add_company_to_tags(
+        "색인 회사", [TagNameRequest(tag_name={"ko": "추가 태그", "jp": "追加タグ"})], "ko"
+    )
+    companies, _ = service.search_companies_by_tag_query("追加タグ NOT 없는태그", "ko")
+    assert [c.company_name for c in companies] == ["색인 회사"]
+
+    service.delete_company_tag("색인 회사", "태그_11", "ko")
+    companies, _ = service.search_companies_by_tag_query("index_tag AND 태그_11", "ko")
+    assert companies == []
+
+
+def test_tag_query_api():
+    """API 는 페이지 단위로 결과를 반환하고 잘못된 검색식은 400 을 반환해야 합니다."""
+    api = TestClient(app)
+    path = "/tags/query?expr=태그_11 OR 태그_29"
+
+    companies = []
+    resp = api.get(f"{path}&limit=4", headers=HEADERS)
+    companies += resp.json()
+    while NEXT_CURSOR_HEADER in resp.headers:
+        resp = api.get(f"{path}&limit=4&cursor={resp.headers[NEXT_CURSOR_HEADER]}", headers=HEADERS)
+        companies += resp.json()
+
+    with SessionLocal() as db:
+        service = CompanyService(CompanyRepository(db), TagRepository(db))
+        expected, _ = service.search_companies_by_tag_query("태그_11 OR 태그_29", "ko")
+    assert [c["company_name"] for c in companies] == [c.company_name for c in expected]
+
+    resp = api.get("/tags/query?expr=(태그_11", headers=HEADERS)
+    assert resp.status_code == 400
+    resp = api.get(
+        f"/tags/query?expr={' AND '.join(['a'] * (MAX_QUERY_TERMS + 1))}", headers=HEADERS
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.models.tag import Tag, TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+
+@pytest.fixture
+def service(db):
+    return CompanyService(CompanyRepository(db), TagRepository(db))
+
+
+def tag_ids_of(db, *names):
+    queryset = select(TagName.name, TagName.tag_id).filter(TagName.name.in_(names))
+    return dict(db.execute(queryset).all())
+
+
+@pytest.mark.parametrize("size", [1, 30])
+def test_resolve_tags_statement_count(db, service, size):
+    """태그 요청 수와 관계 없이 일정한 횟수의 쿼리로 처리되어야 합니다."""
+    tag_requests = [{"ko": "태그_1", "en": "tag_1"}] + [
+        {"ko": f"새 태그 {i}", "en": f"new_tag_{i}", "jp": f"new_tag_jp_{i}"} for i in range(size)
+    ]
+
+    tag_ids = service._resolve_tags(tag_requests)
+
+    # 태그 id 조회, tag 저장, 첫 번째 태그명 저장, 나머지 태그명 저장
+    assert len([s for s in db.statements if "SAVEPOINT" not in s]) == 4
+    saved = tag_ids_of(db, "태그_1", "새 태그 0", "new_tag_0", "new_tag_jp_0")
+    assert tag_ids[:2] == [saved["태그_1"], saved["새 태그 0"]]
+    assert saved["새 태그 0"] == saved["new_tag_0"] == saved["new_tag_jp_0"]
+
+
+def test_resolve_tags_follows_request_order(service, db):
+    """앞선 요청에서 추가된 태그명은 뒤의 요청에서 같은 태그로 사용되어야 합니다."""
+    tag_ids = service._resolve_tags(
+        [
+            {"ko": "순서 태그", "en": "order_tag"},
+            {"en": "order_tag", "jp": "order_tag_jp"},
+            {"ko": "태그_4", "tw": "order_tag_tw"},
+        ]
+    )
+
+    saved = tag_ids_of(db, "순서 태그", "order_tag_jp", "태그_4", "order_tag_tw")
+    assert tag_ids == [saved["순서 태그"], saved["순서 태그"], saved["태그_4"]]
+    assert saved["order_tag_jp"] == saved["순서 태그"]
+    assert saved["order_tag_tw"] == saved["태그_4"]
+    assert service._updated_tag_ids == {saved["태그_4"]}
+
+
+def test_resolve_tags_uses_concurrently_created_tag(db, service, monkeypatch):
+    """조회 이후 다른 요청이 먼저 저장한 태그명은 충돌 없이 해당 태그를 사용해야 합니다."""
+    winner = Tag(tag_names=[TagName(language_code="ko", name="경쟁 태그")])
+    db.add(winner)
+    db.flush()
+    tag_count = db.execute(select(func.count()).select_from(Tag)).scalar()
+
+    # 다른 요청의 commit 전에 조회한 상황
+    get_tag_ids_by_names = service.tag_repository.get_tag_ids_by_names
+    calls = []
+
+    def stale_read(names):
+        calls.append(names)
+        return {} if len(calls) == 1 else get_tag_ids_by_names(names)
+
+    monkeypatch.setattr(service.tag_repository, "get_tag_ids_by_names", stale_read)
+
+    tag_ids = service._resolve_tags([{"ko": "경쟁 태그", "en": "race_tag"}])
+
+    assert tag_ids == [winner.id]
+    assert tag_ids_of(db, "race_tag") == {"race_tag": winner.id}
+    assert db.execute(select(func.count()).select_from(Tag)).scalar() == tag_count
@@ -0,0 +1,115 @@
+import importlib.util
+import os
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from app.common.database import engine
+from app.models.company import CompanyName
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+MIGRATION_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "alembic",
+    "versions",
+    "8a4e6c2b7d15_pg_trgm_name_indexes.py",
+)
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("pg_trgm_name_indexes", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def explain(connection, queryset) -> str:
+    sql = queryset.compile(
+        dialect=postgresql.psycopg2.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    rows = connection.exec_driver_sql(f"EXPLAIN {sql}").scalars()
+    return "\n".join(rows)
+
+
+@pytest.fixture
+def connection():
+    """pg_trgm 인덱스 마이그레이션을 적용한 커넥션 (테스트 후 롤백)"""
+    with engine.connect() as connection:
+        available = connection.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+        if not available:
+            pytest.skip("pg_trgm extension is not available")
+
+        transaction = connection.begin()
+        migrated = connection.execute(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = 'ix_company_name_name_trgm_ko'")
+        ).scalar()
+        if not migrated:
+            with Operations.context(MigrationContext.configure(connection)):
+                load_migration().upgrade()
+
+        # 샘플 데이터가 작아 seq scan 이 더 싸므로 인덱스 사용 가능 여부만 확인
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        yield connection
+        transaction.rollback()
+
+
+@pytest.mark.parametrize("language", ["ko", "en", "jp", "tw"])
+def test_partial_search_uses_trgm_index(connection, language):
+    """회사명 부분 검색은 언어별 pg_trgm 인덱스를 사용해야 합니다."""
+    repository = CompanyRepository(Session(bind=connection))
+    plan = explain(connection, repository._name_partial_queryset("링크", language))
+
+    assert f"ix_company_name_name_trgm_{language}" in plan
+    assert "Seq Scan" not in plan
+
+
+def test_similar_search_uses_trgm_index(connection):
+    """회사명 유사도 검색은 pg_trgm 인덱스를 사용해야 합니다."""
+    queryset = (
+        select(CompanyName)
+        .filter(CompanyName.language_code == "ko")
+        .filter(CompanyName.name.op("%")("원티드"))
+    )
+    plan = explain(connection, queryset)
+
+    assert "ix_company_name_name_trgm_ko" in plan
+    assert "Seq Scan" not in plan
+
+
+def test_tag_name_search_uses_trgm_index(connection):
+    """태그명 검색은 언어별 pg_trgm 인덱스를 사용해야 합니다."""
+    queryset = select(TagName).filter(TagName.language_code == "ko")
+    plan = explain(connection, queryset.filter(TagName.name.ilike("%태그%")))
+
+    assert "ix_tag_name_name_trgm_ko" in plan
+    assert "Seq Scan" not in plan
+
+
+def test_migration_skips_without_trgm(monkeypatch):
+    """pg_trgm 을 설치할 수 없는 서버에서도 마이그레이션이 실패하지 않아야 합니다."""
+    migration = load_migration()
+    monkeypatch.setattr(migration, "_trgm_available", lambda: False)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+            migration.downgrade()
+        transaction.rollback()
+
+
+def test_fuzzy_search_falls_back_without_trgm(db, monkeypatch):
+    """pg_trgm 이 없으면 fuzzy 검색은 부분 검색 결과를 반환해야 합니다."""
+    monkeypatch.setattr(CompanyRepository, "_has_trgm", False)
+    service = CompanyService(CompanyRepository(db), TagRepository(db))
+    assert service.search_companies_by_name("링크", "ko", 10, fuzzy=True) == (
+        service.search_companies_by_name("링크", "ko", 10)
+    )
@@ -0,0 +1,93 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from app.models.company import Company, CompanyName
+from app.models.tag import TagName
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.company import CompanyNameRequest, CompanyRequest, TagNameRequest
+from app.services.company_service import CompanyService
+
+
+@pytest.fixture
+def service(db):
+    return CompanyService(CompanyRepository(db), TagRepository(db))
+
+
+def count(db, model, **filters):
+    return db.execute(select(func.count()).select_from(model).filter_by(**filters)).scalar()
+
+
+def new_company_request():
+    return CompanyRequest(
+        company_name=CompanyNameRequest(ko="작업 단위 회사", en="Unit Of Work", tw="UOW"),
+        tags=[
+            TagNameRequest(tag_name={"ko": "태그_1", "en": "tag_1"}),
+            TagNameRequest(tag_name={"ko": "태그_8", "en": "tag_8"}),
+            TagNameRequest(tag_name={"ko": "작업 단위 태그", "en": "uow_tag", "tw": "uow_tag"}),
+        ],
+    )
+
+
+def test_create_company_statement_count(db, service):
+    """회사 생성은 요청 크기와 관계 없이 적은 횟수의 쿼리와 한 번의 commit 으로 처리되어야 합니다."""
+    response = service.create_company(new_company_request(), "en")
+
+    assert response.model_dump() == {
+        "company_name": "Unit Of Work",
+        "tags": ["tag_1", "tag_8", "uow_tag"],
+    }
+    inserts = [s for s in db.statements if s.startswith("INSERT")]
+    selects = [s for s in db.statements if s.startswith("SELECT")]
+    # 회사명 중복 확인, 태그 id 조회, 응답용 태그명 조회
+    assert len(selects) == 3
+    # company, company_name, tag, tag_name (새 태그 / 나머지 언어), company_tag
+    assert len(inserts) == 6
+    # catalog_version 증가와 변경 내역 기록은 한 번에 실행
+    assert sum(s.startswith("WITH bumped") for s in db.statements) == 1
+    # 변경 사항 commit 후 회사 목록 버전 증가 commit
+    assert sum("RELEASE SAVEPOINT" in s for s in db.statements) == 2
+
+
+def test_create_company_is_all_or_nothing(db, service, monkeypatch):
+    """회사 생성 중 오류가 나면 아무것도 저장되지 않아야 합니다."""
+
+    def fail(company_tag):
+        raise RuntimeError("company_tag 저장 실패")
+
+    monkeypatch.setattr(service.company_repository, "add_company_tag", fail)
+
+    with pytest.raises(RuntimeError):
+        service.create_company(new_company_request(), "ko")
+
+    assert count(db, CompanyName, name="작업 단위 회사") == 0
+    assert count(db, TagName, name="작업 단위 태그") == 0
+
+
+def test_duplicate_company_name_rejected_before_writes(db, service):
+    """이미 존재하는 회사명이 하나라도 있으면 저장하지 않아야 합니다."""
+    request = new_company_request()
+    request.company_name.en = "Wantedlab"
+
+    with pytest.raises(HTTPException) as e:
+        service.create_company(request, "ko")
+
+    assert e.value.status_code == 400
+    assert not [s for s in db.statements if s.startswith("INSERT")]
+    assert count(db, CompanyName, name="작업 단위 회사") == 0
+
+
+def test_empty_company_name_rejected_before_writes(db, service):
+    """회사명이 없으면 회사를 저장하지 않고 400 을 반환해야 합니다."""
+    before = count(db, Company)
+    request = CompanyRequest(
+        company_name=CompanyNameRequest(), tags=[TagNameRequest(tag_name={"ko": "태그_1"})]
+    )
+
+    with pytest.raises(HTTPException) as e:
+        service.create_company(request, "ko")
+
+    assert e.value.status_code == 400
+    assert not [s for s in db.statements if s.startswith("INSERT")]
+    assert count(db, Company) == before
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.orm import Session
+
+from app import main
+from app.common import warmup
+from app.common.database import engine
+from app.common.tag_cache import TagNameCache
+from app.common.warmup import WarmupState, warm_up, warmup_state
+from app.main import app
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.tag_repository import TagRepository
+from app.services.company_service import CompanyService
+
+HEADERS = {"x-wanted-language": "ko"}
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    yield
+    warmup_state.reset()
+
+
+def test_ready_after_warmup():
+    """warmup 이 끝난 뒤에 준비 완료를 보고하고 단계별 시간을 기록해야 합니다."""
+    assert TestClient(app).get("/api/health/ready").status_code == 503
+
+    with TestClient(app) as api:
+        resp = api.get("/api/health/ready")
+
+    body = resp.json()
+    assert resp.status_code == 200
+    assert body["status"] == "ready"
+    assert {"db_pool", "statements", "total"} <= set(body["timings"])
+    assert body["errors"] == {}
+
+
+def test_background_warmup(monkeypatch):
+    """백그라운드 warmup 중에는 요청을 처리하지만 readiness 는 503 이어야 합니다."""
+    release = threading.Event()
+
+    async def slow_warm_up(state):
+        await warmup.run_in_threadpool(release.wait, 5)
+        return await warm_up(state)
+
+    monkeypatch.setattr(main.settings, "warmup_background", True)
+    monkeypatch.setattr(main, "warm_up", slow_warm_up)
+    with TestClient(app) as api:
+        assert api.get("/api/health/live").status_code == 200
+        assert api.get("/api/health/ready").json()["status"] == "warming_up"
+        assert api.get("/companies/Wantedlab", headers=HEADERS).status_code == 200
+
+        release.set()
+        for _ in range(100):
+            if api.get("/api/health/ready").status_code == 200:
+                break
+            threading.Event().wait(0.05)
+        assert api.get("/api/health/ready").status_code == 200
+
+
+def test_failed_step_recorded(monkeypatch):
+    """실패한 단계는 기록하고 나머지 warmup 은 계속 진행해야 합니다."""
+
+    def broken_pool(count):
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(warmup, "_open_db_pool", broken_pool)
+    state = asyncio.run(warm_up(WarmupState()))
+
+    assert state.ready
+    assert state.errors == {"db_pool": "connection refused"}
+    assert "statements" in state.timings
+
+
+def test_hot_paths_compiled():
+    """warmup 후 첫 요청의 SQL 은 컴파일 캐시를 사용해야 합니다."""
+    engine._compiled_cache.clear()
+    with Session(engine) as db:
+        warmup._run_hot_paths(db)
+
+    cache_hits = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit is CACHE_HIT)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert TestClient(app).get("/companies/Wantedlab", headers=HEADERS).status_code == 200
+        TestClient(app).get("/tags?query=태그_4&limit=2", headers=HEADERS)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert cache_hits and all(cache_hits)
+
+
+def test_preload_tag_names():
+    """자주 사용되는 태그부터 태그명 캐시에 적재해야 합니다."""
+    tag_cache = TagNameCache(size=100, ttl=60)
+    with Session(engine) as db:
+        service = CompanyService(CompanyRepository(db), TagRepository(db), tag_cache=tag_cache)
+        popular = TagRepository(db).get_popular_tag_ids(3)
+        assert service.preload_tag_names(3) == 3
+
+    assert len(tag_cache) == 3
+    assert tag_cache.get_many(popular)[1] == []